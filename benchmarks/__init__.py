@@ -0,0 +1 @@
+"""Benchmarks for NEPSE Client (run with ``python -m benchmarks.<name>``)."""
@@ -0,0 +1,65 @@
+"""
+Columnar floor sheet memory benchmark.
+
+Decodes a full day of floor sheet pages the way the client receives them and
+compares the memory retained by a list of dicts with :class:`FloorSheetColumns`.
+
+Usage::
+
+    python -m benchmarks.bench_columnar [--pages 600]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Iterator
+from typing import Any
+
+from benchmarks.mock_server import MockNepseServer
+from nepse_client import FloorSheetColumns
+
+
+def iter_pages(raw_pages: list[bytes]) -> Iterator[list[dict[str, Any]]]:
+    """Decode raw page bodies one at a time, as the client does."""
+    for body in raw_pages:
+        yield json.loads(body)["floorsheets"]["content"]
+
+
+def measure(build, raw_pages: list[bytes]) -> tuple[int, float]:
+    """Return the bytes retained by ``build(pages)`` and the time it took."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(iter_pages(raw_pages))
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=600)
+    parser.add_argument("--rows-per-page", type=int, default=500)
+    args = parser.parse_args()
+
+    server = MockNepseServer(total_pages=args.pages, rows_per_page=args.rows_per_page)
+    raw_pages = [json.dumps(server.floorsheet_page(page)).encode() for page in range(args.pages)]
+
+    results = {
+        "dicts": measure(lambda pages: [row for page in pages for row in page], raw_pages),
+        "columnar": measure(FloorSheetColumns.from_pages, raw_pages),
+    }
+
+    rows = args.pages * args.rows_per_page
+    print(f"{'layout':<10}{'rows':>10}{'MiB':>10}{'bytes/row':>12}{'seconds':>10}")
+    for name, (retained, elapsed) in results.items():
+        print(
+            f"{name:<10}{rows:>10}{retained / 2**20:>10.1f}{retained / rows:>12.0f}{elapsed:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
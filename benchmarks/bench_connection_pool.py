@@ -0,0 +1,77 @@
+"""
+Connection pooling benchmark.
+
+Downloads a 600-page floor sheet from the local mock server with and without
+``keep_alive`` and reports how many TCP connections (and therefore TLS
+handshakes against the real server) each mode needed, and how much of the
+download was spent decoding JSON.
+
+Usage::
+
+    python -m benchmarks.bench_connection_pool [--pages 600] [--json-decoder json]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from benchmarks.mock_server import MockNepseServer
+from nepse_client import AsyncNepseClient, NepseClient
+from nepse_client.json_decoder import JSON_DECODERS
+
+
+def run_sync(
+    server: MockNepseServer, keep_alive: bool, json_decoder: Optional[str]
+) -> tuple[int, float, float, int]:
+    """Download the floor sheet with the sync client."""
+    server.reset_counters()
+    with NepseClient(keep_alive=keep_alive, json_decoder=json_decoder) as client:
+        client.base_url = server.base_url
+        start = time.perf_counter()
+        rows = client.getFloorSheet()
+        elapsed = time.perf_counter() - start
+    return len(rows), elapsed, client.decode_stats["seconds"], server.connections
+
+
+def run_async(
+    server: MockNepseServer, keep_alive: bool, json_decoder: Optional[str]
+) -> tuple[int, float, float, int]:
+    """Download the floor sheet with the async client."""
+    server.reset_counters()
+
+    async def _download():
+        async with AsyncNepseClient(keep_alive=keep_alive, json_decoder=json_decoder) as client:
+            client.base_url = server.base_url
+            start = time.perf_counter()
+            rows = await client.getFloorSheet()
+            return rows, time.perf_counter() - start, client.decode_stats["seconds"]
+
+    rows, elapsed, decode = asyncio.run(_download())
+    return len(rows), elapsed, decode, server.connections
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=600)
+    parser.add_argument("--rows-per-page", type=int, default=20)
+    parser.add_argument("--json-decoder", choices=JSON_DECODERS, default=None)
+    args = parser.parse_args()
+
+    with MockNepseServer(total_pages=args.pages, rows_per_page=args.rows_per_page) as server:
+        print(
+            f"{'client':<8}{'keep_alive':>12}{'rows':>10}{'seconds':>10}{'decode':>10}"
+            f"{'connections':>13}"
+        )
+        for name, runner in (("sync", run_sync), ("async", run_async)):
+            for keep_alive in (False, True):
+                rows, elapsed, decode, connections = runner(server, keep_alive, args.json_decoder)
+                print(
+                    f"{name:<8}{keep_alive!s:>12}{rows:>10}{elapsed:>10.2f}{decode:>10.3f}"
+                    f"{connections:>13}"
+                )
+
+
+if __name__ == "__main__":
+    main()
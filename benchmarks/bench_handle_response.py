@@ -0,0 +1,81 @@
+"""
+Response handling benchmark.
+
+Times ``handle_response`` on successful floor sheet pages and measures the
+memory it allocates per call, with and without the logging context that was
+previously built for every response (now only for failed requests), and
+with DEBUG logging enabled.
+
+Usage::
+
+    python -m benchmarks.bench_handle_response [--calls 2000] [--rows-per-page 500]
+"""
+
+import argparse
+import json
+import logging
+import time
+import tracemalloc
+
+import httpx
+
+from benchmarks.mock_server import make_floorsheet_row
+from nepse_client import NepseClient
+
+
+def measure(handle, response: httpx.Response, calls: int) -> tuple[float, float]:
+    """Return (microseconds, peak allocated bytes) per ``handle(response)`` call."""
+    handle(response)
+    start = time.perf_counter()
+    for _ in range(calls):
+        handle(response)
+    elapsed = (time.perf_counter() - start) / calls
+
+    allocated = 0
+    tracemalloc.start()
+    for _ in range(100):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        handle(response)
+        allocated += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    return elapsed * 1e6, allocated / 100
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--rows-per-page", type=int, default=500)
+    args = parser.parse_args()
+
+    client = NepseClient(json_decoder=lambda content: [])
+    client.logger.setLevel(logging.INFO)
+    request = httpx.Request("POST", client.get_full_url("/api/nots/nepse-data/floorsheet"))
+    request.headers.update(client.build_headers("token"))
+    page = [make_floorsheet_row(i) for i in range(args.rows_per_page)]
+    payload = {"id": 1234}
+    # Skip JSON decoding so only the logging work is compared
+    response = httpx.Response(200, content=json.dumps(page).encode(), request=request)
+
+    def eager(response):
+        client._buildLogContext(response, payload, page)
+        return client.handle_response(response, payload)
+
+    def lazy(response):
+        return client.handle_response(response, payload)
+
+    print(f"{'success path':<24}{'us/call':>10}{'bytes/call':>12}")
+    for name, handle in (("eager log context", eager), ("lazy log context", lazy)):
+        micros, allocated = measure(handle, response, args.calls)
+        print(f"{name:<24}{micros:>10.2f}{allocated:>12.0f}")
+
+    client.logger.setLevel(logging.DEBUG)
+    client.logger.addHandler(logging.NullHandler())
+    client.logger.propagate = False
+    micros, allocated = measure(lazy, response, args.calls)
+    print(f"{'lazy, DEBUG enabled':<24}{micros:>10.2f}{allocated:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
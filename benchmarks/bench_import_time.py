@@ -0,0 +1,73 @@
+"""
+Import time benchmark.
+
+Runs ``python -X importtime`` in fresh interpreters and reports the
+import time of ``nepse_client`` alone, of the exceptions only and of the
+package together with a client (excluding what interpreter startup already
+imports), plus the slowest dependencies pulled in by the client.
+
+Usage::
+
+    python -m benchmarks.bench_import_time [--runs 5] [--top 8]
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+STATEMENTS = {
+    "import nepse_client": "import nepse_client",
+    "exceptions only": "from nepse_client.exceptions import NepseError",
+    "NepseClient": "from nepse_client import NepseClient",
+    "AsyncNepseClient": "from nepse_client import AsyncNepseClient",
+}
+
+
+def importtime(statement: str) -> dict[str, int]:
+    """Return the cumulative microseconds spent on each top-level import made by ``statement``."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented below the module that triggered them
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    # Imports made by interpreter startup are not charged to the statements
+    baseline = set(importtime("pass"))
+
+    print(f"{'statement':<24}{'ms':>10}{'modules':>10}")
+    for label, statement in STATEMENTS.items():
+        runs = []
+        for _ in range(args.runs):
+            times = {name: us for name, us in importtime(statement).items() if name not in baseline}
+            runs.append(times)
+        best = min(runs, key=lambda times: sum(times.values()))
+        print(f"{label:<24}{sum(best.values()) / 1e3:>10.2f}{len(best):>10}")
+
+    times = importtime(STATEMENTS["NepseClient"])
+    slowest = sorted((name for name in times if name not in baseline), key=lambda n: -times[n])
+    print("\nslowest imports for NepseClient:")
+    for name in slowest[: args.top]:
+        print(f"  {name:<32}{times[name] / 1e3:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Per-request overhead benchmark.
+
+Sends authenticated GET requests through an in-process ``httpx.MockTransport``
+so only the client's own work is measured, and compares the requests per
+second of the prebuilt header templates with the previous per-request header
+construction (which re-read USER_AGENTS.json and rebuilt the dict every time).
+
+Usage::
+
+    python -m benchmarks.bench_request_overhead [--requests 5000]
+"""
+
+import argparse
+import json
+import random
+import time
+
+import httpx
+
+from benchmarks.mock_server import SECURITIES, make_token_response
+from nepse_client import NepseClient
+from nepse_client.client import DATA_DIR
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """Answer token requests with a token and everything else with the security list."""
+    if request.url.path.startswith("/api/authenticate/"):
+        return httpx.Response(200, json=make_token_response())
+    return httpx.Response(200, json=SECURITIES)
+
+
+def legacy_authorization_headers(client: NepseClient) -> dict[str, str]:
+    """Build authorization headers the way the client did before templates."""
+    with open(DATA_DIR / "USER_AGENTS.json", encoding="utf-8") as f:
+        user_agents = json.load(f)["USER_AGENTS"]
+    return {
+        "Authorization": f"Salter {client.token_manager.getAccessToken()}",
+        "Content-Type": "application/json",
+        **client.headers,
+        "User-Agent": str(random.choice(user_agents)),
+    }
+
+
+def run(client: NepseClient, requests: int) -> float:
+    """Return the requests per second of ``requests`` authenticated GETs."""
+    url = client.api_end_points["security_list_url"]
+    client.requestGETAPI(url)  # authenticate outside the timed loop
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.requestGETAPI(url)
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'headers':<22}{'req/s':>10}{'us/req':>10}")
+    rates = {}
+    for name, policy in (
+        ("legacy", "random"),
+        ("template random", "random"),
+        ("template round_robin", "round_robin"),
+        ("template fixed", "fixed"),
+    ):
+        client = NepseClient(user_agent_policy=policy)
+        client.client = httpx.Client(transport=httpx.MockTransport(handler))
+        if name == "legacy":
+            client.getAuthorizationHeaders = lambda c=client: legacy_authorization_headers(c)
+        rates[name] = run(client, args.requests)
+        client.close()
+        print(f"{name:<22}{rates[name]:>10.0f}{1e6 / rates[name]:>10.1f}")
+
+    print(f"\nspeedup (template random vs legacy): {rates['template random'] / rates['legacy']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Client construction benchmark.
+
+Measures how long creating a client takes: the first client in a fresh
+interpreter (which loads the configuration files and the CA bundle) and
+every client after it (which reuse the per-process caches). No network I/O
+is involved.
+
+Usage::
+
+    python -m benchmarks.bench_startup [--clients 200] [--runs 5]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+
+COLD_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from nepse_client import NepseClient
+imported = time.perf_counter()
+NepseClient()
+print(json.dumps([imported - start, time.perf_counter() - imported]))
+"""
+
+
+def cold_start() -> tuple[float, float]:
+    """Return (import, first construction) seconds in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", COLD_SCRIPT], check=True, capture_output=True, text=True
+    ).stdout
+    imported, constructed = json.loads(output)
+    return imported, constructed
+
+
+def warm(client_class, clients: int) -> float:
+    """Return the mean seconds to construct one more client of ``client_class``."""
+    client_class()
+    start = time.perf_counter()
+    for _ in range(clients):
+        client_class()
+    return (time.perf_counter() - start) / clients
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [cold_start() for _ in range(args.runs)]
+    print(f"{'phase':<24}{'ms':>10}")
+    print(f"{'import (cold)':<24}{min(r[0] for r in runs) * 1e3:>10.2f}")
+    print(f"{'first client (cold)':<24}{min(r[1] for r in runs) * 1e3:>10.2f}")
+
+    from nepse_client import AsyncNepseClient, NepseClient
+
+    print(f"{'NepseClient (warm)':<24}{warm(NepseClient, args.clients) * 1e3:>10.2f}")
+    print(f"{'AsyncNepseClient (warm)':<24}{warm(AsyncNepseClient, args.clients) * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
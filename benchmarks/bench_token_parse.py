@@ -0,0 +1,57 @@
+"""
+Token parsing benchmark.
+
+Compares ``TokenParser`` construction and ``parse_token_response`` cost for
+the pure-Python index functions against the pywasm-interpreted css.wasm, and
+the cost of parsing again with the indices memoized by salts.
+
+Usage::
+
+    python -m benchmarks.bench_token_parse [--iterations 200]
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.mock_server import make_token_response
+from nepse_client.token_manager import TokenParser
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    responses = []
+    for _ in range(args.iterations):
+        response = make_token_response()
+        response.update({f"salt{i}": rng.randint(100, 99999) for i in range(1, 6)})
+        responses.append(response)
+
+    print(f"{'parser':<8}{'init ms':>10}{'parse us':>12}")
+    results = {}
+    for name, use_wasm in (("wasm", True), ("native", False)):
+        start = time.perf_counter()
+        token_parser = TokenParser(use_wasm=use_wasm)
+        init = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results[name] = [token_parser.parse_token_response(r) for r in responses]
+        parse = (time.perf_counter() - start) / args.iterations
+
+        print(f"{name:<8}{init * 1e3:>10.2f}{parse * 1e6:>12.1f}")
+
+    start = time.perf_counter()
+    for response in responses:
+        token_parser.parse_token_response(response)
+    parse = (time.perf_counter() - start) / args.iterations
+    print(f"{'cached':<8}{'':>10}{parse * 1e6:>12.1f}")
+
+    assert results["wasm"] == results["native"], "native parser disagrees with WASM"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Local mock of the NEPSE API used by the benchmarks.
+
+Serves just enough of the API (authentication, market status, security list
+and floor sheets) for the clients to run end to end without touching
+nepalstock.com.np, and counts the TCP connections it accepts.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+SECURITIES = [
+    {"id": 131, "symbol": "NABIL", "securityName": "Nabil Bank Limited", "activeStatus": "A"},
+    {"id": 132, "symbol": "NICA", "securityName": "NIC Asia Bank Limited", "activeStatus": "A"},
+    {"id": 133, "symbol": "SCB", "securityName": "Standard Chartered Bank", "activeStatus": "A"},
+]
+
+
+def make_token_response() -> dict[str, Any]:
+    """Build a token response the WASM parser can decode."""
+    return {
+        "accessToken": "".join(chr(97 + i % 26) for i in range(200)),
+        "refreshToken": "".join(chr(65 + i % 26) for i in range(200)),
+        "salt1": 12345,
+        "salt2": 23456,
+        "salt3": 34567,
+        "salt4": 45678,
+        "salt5": 56789,
+        "serverTime": int(time.time() * 1000),
+    }
+
+
+def make_floorsheet_row(contract_id: int) -> dict[str, Any]:
+    """Build a deterministic floor sheet row for a contract ID."""
+    security = SECURITIES[contract_id % len(SECURITIES)]
+    quantity = 10 + contract_id % 90
+    rate = 500.0 + contract_id % 700
+    return {
+        "id": contract_id,
+        "contractId": contract_id,
+        "contractType": None,
+        "stockSymbol": security["symbol"],
+        "buyerMemberId": str(1 + contract_id % 58),
+        "sellerMemberId": str(1 + (contract_id // 7) % 58),
+        "contractQuantity": quantity,
+        "contractRate": rate,
+        "contractAmount": quantity * rate,
+        "businessDate": "2024-01-15",
+        "tradeBookId": 1000 + contract_id % 3,
+        "stockId": security["id"],
+        "buyerBrokerName": f"Broker {1 + contract_id % 58}",
+        "sellerBrokerName": f"Broker {1 + (contract_id // 7) % 58}",
+        "tradeTime": "2024-01-15T14:59:59.123456",
+        "securityName": security["securityName"],
+    }
+
+
+class _Server(ThreadingHTTPServer):
+    # Unbounded async downloads open hundreds of connections at once
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+class MockNepseServer:
+    """
+    Threaded HTTP/1.1 server emulating the NEPSE endpoints.
+
+    Args:
+        total_pages: Number of floor sheet pages to serve
+        rows_per_page: Number of rows on every floor sheet page
+        latency: Artificial delay (seconds) added to every response
+
+    Example::
+
+        with MockNepseServer(total_pages=600) as server:
+            client = NepseClient()
+            client.base_url = server.base_url
+            client.getFloorSheet()
+            print(server.connections, server.requests)
+    """
+
+    def __init__(self, total_pages: int = 600, rows_per_page: int = 20, latency: float = 0.0):
+        """Initialize the mock server (not started yet)."""
+        self.total_pages = total_pages
+        self.rows_per_page = rows_per_page
+        self.latency = latency
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Return the base URL clients should use."""
+        assert self._server is not None, "Server is not running"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_counters(self) -> None:
+        """Reset connection and request counters."""
+        with self._lock:
+            self.connections = 0
+            self.requests = 0
+
+    def floorsheet_page(self, page: int) -> dict[str, Any]:
+        """Build a floor sheet page, newest contract first."""
+        first_id = self.total_pages * self.rows_per_page - page * self.rows_per_page
+        content = [make_floorsheet_row(first_id - i) for i in range(self.rows_per_page)]
+        return {
+            "floorsheets": {
+                "content": content,
+                "totalPages": self.total_pages,
+                "totalElements": self.total_pages * self.rows_per_page,
+                "size": self.rows_per_page,
+                "number": page,
+            }
+        }
+
+    def route(self, method: str, path: str, query: dict[str, list[str]]) -> Any:
+        """Return the JSON payload for a request."""
+        if path in ("/api/authenticate/prove", "/api/authenticate/refresh-token"):
+            return make_token_response()
+        if path == "/api/nots/nepse-data/market-open":
+            return {"id": 80, "isOpen": "CLOSE", "asOf": datetime.now().isoformat()}
+        if path == "/api/nots/security":
+            return SECURITIES
+        if method == "POST" and (
+            path == "/api/nots/nepse-data/floorsheet"
+            or path.startswith("/api/nots/security/floorsheet/")
+        ):
+            return self.floorsheet_page(int(query.get("page", ["0"])[0]))
+        return {}
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                with server._lock:
+                    server.connections += 1
+                super().setup()
+
+            def _respond(self):
+                with server._lock:
+                    server.requests += 1
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                if server.latency:
+                    time.sleep(server.latency)
+                parsed = urlparse(self.path)
+                body = json.dumps(
+                    server.route(self.command, parsed.path, parse_qs(parsed.query))
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = _respond
+            do_POST = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "MockNepseServer":
+        """Start serving on an ephemeral localhost port."""
+        self._server = _Server(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockNepseServer":
+        """Start the server on context entry."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stop the server on context exit."""
+        self.stop()
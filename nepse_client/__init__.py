@@ -26,10 +26,9 @@ Asynchronous usage::
    asyncio.run(main())
 """
 
-import importlib.metadata
-import re
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .async_client import AsyncNepseClient
 from .exceptions import (
     NepseAuthenticationError,
     NepseBadGatewayError,
@@ -44,31 +43,92 @@ from .exceptions import (
     NepseTimeoutError,
     NepseValidationError,
 )
-from .sync_client import NepseClient
 
 
-try:
-    pkg_metadata = importlib.metadata.metadata("nepse-client")
-    # Read metadata from the installed package (from pyproject.toml)
-    __name__ = pkg_metadata["Name"]
-    __version__ = importlib.metadata.version("nepse-client")
+if TYPE_CHECKING:
+    from .archive import FloorsheetArchive
+    from .async_client import AsyncNepseClient
+    from .cache import MarketHoursPolicy, ResponseCache
+    from .clock import ServerClock
+    from .floorsheet import FloorSheetCheckpoint, FloorSheetColumns
+    from .history_cache import HistoryCache
+    from .reference_cache import ReferenceCache
+    from .sync_client import NepseClient
+    from .token_store import FileTokenStore
+
+# Public names imported from their submodule on first access (PEP 562), so
+# ``import nepse_client`` does not pull in httpx, tqdm or pywasm until a
+# client is actually used
+_LAZY_ATTRIBUTES = {
+    "NepseClient": ".sync_client",
+    "AsyncNepseClient": ".async_client",
+    "FloorSheetCheckpoint": ".floorsheet",
+    "FloorSheetColumns": ".floorsheet",
+    "FloorsheetArchive": ".archive",
+    "ServerClock": ".clock",
+    "ResponseCache": ".cache",
+    "MarketHoursPolicy": ".cache",
+    "HistoryCache": ".history_cache",
+    "ReferenceCache": ".reference_cache",
+    "FileTokenStore": ".token_store",
+}
+
+_METADATA_ATTRIBUTES = ("__version__", "__author__", "__email__", "__license__")
+
+# Fallback values if package is not installed (e.g., during development)
+_FALLBACK_METADATA = {
+    "name": "nepse-client",
+    "__version__": "0.1.1",
+    "__author__": "Amrit Giri",
+    "__email__": "amritgiri.dev@gmail.com",
+    "__license__": "MIT",
+}
+
+
+def _package_metadata() -> dict[str, str]:
+    """Read the installed package metadata (from pyproject.toml)."""
+    import importlib.metadata
+    import re
+
+    try:
+        pkg_metadata = importlib.metadata.metadata("nepse-client")
+    except importlib.metadata.PackageNotFoundError:
+        return dict(_FALLBACK_METADATA)
+
     # Attempt to get Author from the Author-email field
     author_email_str = pkg_metadata["Author-email"]
     if author_email_str:
         # Extract name using regex, e.g., "Name <email>" -> "Name"
         match = re.match(r"^(.*?)\s+<.*>$", author_email_str)
-        __author__ = match.group(1) if match else "Unknown"
+        author = match.group(1) if match else "Unknown"
+    else:
+        author = "Unknown"
+    return {
+        "name": pkg_metadata["Name"],
+        "__version__": pkg_metadata["Version"],
+        "__author__": author,
+        "__email__": author_email_str,
+        "__license__": pkg_metadata["License"],
+    }
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily loaded public names and package metadata on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif name in _METADATA_ATTRIBUTES:
+        metadata = _package_metadata()
+        globals().update({key: metadata[key] for key in _METADATA_ATTRIBUTES})
+        return metadata[name]
     else:
-        __author__ = "Unknown"
-    __email__ = pkg_metadata["Author-email"]
-    __license__ = pkg_metadata["License"]
-except importlib.metadata.PackageNotFoundError:
-    # Fallback values if package is not installed (e.g., during development)
-    __name__ = "nepse-client"
-    __version__ = "0.1.1"
-    __author__ = "Amrit Giri"
-    __email__ = "amritgiri.dev@gmail.com"
-    __license__ = "MIT"
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including the lazily loaded ones."""
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
@@ -88,6 +148,19 @@ __all__ = [
     "NepseTimeoutError",
     "NepseConnectionError",
     "NepseConfigurationError",
+    # Floor sheet
+    "FloorSheetCheckpoint",
+    "FloorSheetColumns",
+    "FloorsheetArchive",
+    # Server clock
+    "ServerClock",
+    # Token sharing
+    "FileTokenStore",
+    # Response caching
+    "ResponseCache",
+    "MarketHoursPolicy",
+    "HistoryCache",
+    "ReferenceCache",
     # Metadata
     "__version__",
     "__author__",
@@ -109,17 +182,18 @@ def get_client_info():
        >>> print(info['version'])
        1.0.0
     """
-    print(f"Name: {__name__}")
-    print(f"Version: {__version__}")
-    print(f"Author: {__author__}")
-    print(f"Email: {__email__}")
-    print(f"License: {__license__}")
+    metadata = _package_metadata()
+    print(f"Name: {metadata['name']}")
+    print(f"Version: {metadata['__version__']}")
+    print(f"Author: {metadata['__author__']}")
+    print(f"Email: {metadata['__email__']}")
+    print(f"License: {metadata['__license__']}")
     return {
-        "name": __name__,
-        "version": __version__,
-        "author": __author__,
-        "email": __email__,
-        "license": __license__,
+        "name": metadata["name"],
+        "version": metadata["__version__"],
+        "author": metadata["__author__"],
+        "email": metadata["__email__"],
+        "license": metadata["__license__"],
         "features": [
             "Synchronous and Asynchronous API",
             "Automatic token management",
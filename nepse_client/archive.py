@@ -0,0 +1,299 @@
+"""
+Local floor sheet archive.
+
+This module provides :class:`FloorsheetArchive`, an on-disk store that keeps
+one compressed, indexed partition per business date so historical queries
+only read the days and blocks they need.
+"""
+
+import json
+import os
+import pathlib
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from datetime import date
+from typing import Any, Optional, Union
+
+from .exceptions import NepseDataNotFoundError, NepseValidationError
+from .floorsheet import FloorSheetColumns
+
+
+class FloorsheetArchive:
+    """
+    Partitioned on-disk archive of daily floor sheets.
+
+    Every business date is stored as ``<directory>/<YYYY-MM>/<date>.<generation>.data``
+    next to a small ``<date>.index.json``. Rows are sorted by symbol and
+    contract ID and written as independently zlib-compressed blocks. The
+    index records:
+
+    - the data file of the current generation
+    - the byte offset and length of every block
+    - symbol -> ``[first_row, end_row)`` range
+    - buyer/seller broker -> blocks containing that broker's trades
+    - the min/max contract ID of the day
+
+    Queries pick partitions from file names and blocks from the index, so
+    e.g. a month of one symbol decompresses only that symbol's blocks.
+
+    Rewriting a date writes a new data file first and then replaces the
+    index, so readers always see an index together with the data it
+    describes. Replacing the index is the commit point; the data file of
+    the previous generation is removed afterwards.
+
+    Args:
+       directory: Root archive directory
+       block_rows: Number of rows per compressed block
+       compression_level: zlib compression level (0-9)
+
+    Example:
+       >>> archive = FloorsheetArchive("floorsheets")
+       >>> archive.write(client.getFloorSheet())
+       >>> trades = list(
+       ...     archive.query(symbol="NABIL", start_date="2024-03-01", end_date="2024-03-31")
+       ... )
+    """
+
+    DATA_SUFFIX = ".data"
+    INDEX_SUFFIX = ".index.json"
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        block_rows: int = 2000,
+        compression_level: int = 6,
+    ):
+        """Initialize archive rooted at ``directory``."""
+        if block_rows < 1:
+            raise NepseValidationError("block_rows must be at least 1", "block_rows", block_rows)
+        self.path = pathlib.Path(directory)
+        self.block_rows = block_rows
+        self.compression_level = compression_level
+        # Business date -> (index file stat, index), reloaded when the file changes
+        self._indexes: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+    @staticmethod
+    def _normalize_date(value: Union[str, date]) -> str:
+        try:
+            return date.fromisoformat(str(value)).isoformat()
+        except ValueError as e:
+            raise NepseValidationError(
+                f"Invalid date format: {value}. Expected YYYY-MM-DD.",
+                field="business_date",
+                value=value,
+            ) from e
+
+    def _partition(self, business_date: str) -> pathlib.Path:
+        return self.path / business_date[:7] / business_date
+
+    def write(
+        self,
+        rows: Union[Iterable[dict[str, Any]], FloorSheetColumns],
+        business_date: Optional[Union[str, date]] = None,
+    ) -> pathlib.Path:
+        """
+        Archive one business date, replacing any earlier partition for it.
+
+        Args:
+           rows: Floor sheet records, e.g. from ``client.getFloorSheet()``
+           business_date: Business date of the rows (default: the
+              ``businessDate`` of the first row)
+
+        Returns:
+           Path of the written data file
+
+        Raises:
+           NepseValidationError: If the business date cannot be determined
+        """
+        if isinstance(rows, FloorSheetColumns):
+            rows = rows.to_rows()
+        rows = sorted(rows, key=lambda row: (row.get("stockSymbol") or "", row["contractId"]))
+
+        if business_date is None:
+            if not rows or not rows[0].get("businessDate"):
+                raise NepseValidationError(
+                    "business_date is required when rows carry no businessDate",
+                    field="business_date",
+                )
+            business_date = rows[0]["businessDate"]
+        day = self._normalize_date(business_date)
+
+        blocks = []
+        symbols: dict[str, list[int]] = {}
+        buyers: dict[str, set[int]] = {}
+        sellers: dict[str, set[int]] = {}
+        for index, row in enumerate(rows):
+            symbol = row.get("stockSymbol") or ""
+            if symbol in symbols:
+                symbols[symbol][1] = index + 1
+            else:
+                symbols[symbol] = [index, index + 1]
+            block = index // self.block_rows
+            buyers.setdefault(str(row.get("buyerMemberId")), set()).add(block)
+            sellers.setdefault(str(row.get("sellerMemberId")), set()).add(block)
+
+        partition = self._partition(day)
+        partition.parent.mkdir(parents=True, exist_ok=True)
+        data_path = partition.with_name(f"{day}.{time.time_ns():x}{self.DATA_SUFFIX}")
+        tmp_path = data_path.with_suffix(".tmp")
+        offset = 0
+        with open(tmp_path, "wb") as f:
+            for start in range(0, len(rows), self.block_rows):
+                chunk = rows[start : start + self.block_rows]
+                payload = zlib.compress(
+                    json.dumps(chunk, separators=(",", ":")).encode(), self.compression_level
+                )
+                f.write(payload)
+                blocks.append([offset, len(payload), start, len(chunk)])
+                offset += len(payload)
+        os.replace(tmp_path, data_path)
+
+        contract_ids = [row["contractId"] for row in rows]
+        index_data = {
+            "businessDate": day,
+            "dataFile": data_path.name,
+            "rows": len(rows),
+            "blockRows": self.block_rows,
+            "contractId": [min(contract_ids), max(contract_ids)] if rows else None,
+            "blocks": blocks,
+            "symbols": symbols,
+            "buyers": {broker: sorted(ids) for broker, ids in buyers.items()},
+            "sellers": {broker: sorted(ids) for broker, ids in sellers.items()},
+        }
+        index_path = partition.with_name(day + self.INDEX_SUFFIX)
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index_data, f)
+        os.replace(tmp_path, index_path)
+        self._indexes.pop(day, None)
+
+        for stale_path in partition.parent.glob(f"{day}*{self.DATA_SUFFIX}"):
+            if stale_path != data_path:
+                stale_path.unlink(missing_ok=True)
+        return data_path
+
+    def dates(self) -> list[str]:
+        """Return the archived business dates in order."""
+        return sorted(
+            path.name[: -len(self.INDEX_SUFFIX)]
+            for path in self.path.glob(f"*/*{self.INDEX_SUFFIX}")
+        )
+
+    def __contains__(self, business_date: object) -> bool:
+        """Return True if the business date is archived."""
+        if not isinstance(business_date, (str, date)):
+            return False
+        day = self._normalize_date(business_date)
+        return self._partition(day).with_name(day + self.INDEX_SUFFIX).exists()
+
+    def index(self, business_date: Union[str, date]) -> dict[str, Any]:
+        """
+        Return the index of an archived business date.
+
+        Args:
+           business_date: Business date (YYYY-MM-DD string or date object)
+
+        Raises:
+           NepseDataNotFoundError: If the date is not archived
+        """
+        day = self._normalize_date(business_date)
+        index_path = self._partition(day).with_name(day + self.INDEX_SUFFIX)
+        try:
+            stat = index_path.stat()
+        except FileNotFoundError:
+            raise NepseDataNotFoundError(f"No archived floor sheet for {day}") from None
+
+        # The date may have been rewritten since, by this or another archive
+        version = (stat.st_mtime_ns, stat.st_ino)
+        cached = self._indexes.get(day)
+        if cached is None or cached[0] != version:
+            with open(index_path, encoding="utf-8") as f:
+                cached = self._indexes[day] = (version, json.load(f))
+        return cached[1]
+
+    def read(self, business_date: Union[str, date]) -> list[dict[str, Any]]:
+        """
+        Read every archived row of a business date (sorted by symbol).
+
+        Args:
+           business_date: Business date (YYYY-MM-DD string or date object)
+        """
+        return list(self.query(start_date=business_date, end_date=business_date))
+
+    def _select_blocks(
+        self,
+        index: dict[str, Any],
+        symbol: Optional[str],
+        buyer: Optional[str],
+        seller: Optional[str],
+    ) -> list[int]:
+        selected = set(range(len(index["blocks"])))
+        if symbol is not None:
+            if symbol not in index["symbols"]:
+                return []
+            start, end = index["symbols"][symbol]
+            # Partitions keep the block size they were written with
+            block_rows = index["blockRows"]
+            selected &= set(range(start // block_rows, (end - 1) // block_rows + 1))
+        if buyer is not None:
+            selected &= set(index["buyers"].get(buyer, ()))
+        if seller is not None:
+            selected &= set(index["sellers"].get(seller, ()))
+        return sorted(selected)
+
+    def query(
+        self,
+        symbol: Optional[str] = None,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        buyer: Optional[Union[str, int]] = None,
+        seller: Optional[Union[str, int]] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Lazily yield archived trades matching all given filters.
+
+        Args:
+           symbol: Stock symbol
+           start_date: First business date (inclusive)
+           end_date: Last business date (inclusive)
+           buyer: Buyer broker (member) ID
+           seller: Seller broker (member) ID
+
+        Yields:
+           Floor sheet records, by date and then by symbol
+        """
+        start = self._normalize_date(start_date) if start_date is not None else None
+        end = self._normalize_date(end_date) if end_date is not None else None
+        symbol = symbol.upper() if symbol is not None else None
+        buyer = str(buyer) if buyer is not None else None
+        seller = str(seller) if seller is not None else None
+
+        for day in self.dates():
+            if (start is not None and day < start) or (end is not None and day > end):
+                continue
+            index = self.index(day)
+            blocks = self._select_blocks(index, symbol, buyer, seller)
+            if not blocks:
+                continue
+
+            data_file = index.get("dataFile", day + self.DATA_SUFFIX)
+            with open(self._partition(day).with_name(data_file), "rb") as f:
+                for block in blocks:
+                    offset, length, _, _ = index["blocks"][block]
+                    f.seek(offset)
+                    for row in json.loads(zlib.decompress(f.read(length))):
+                        if symbol is not None and row.get("stockSymbol") != symbol:
+                            continue
+                        if buyer is not None and str(row.get("buyerMemberId")) != buyer:
+                            continue
+                        if seller is not None and str(row.get("sellerMemberId")) != seller:
+                            continue
+                        yield row
+
+    def __repr__(self) -> str:
+        """Return the string representation of the archive."""
+        return f"FloorsheetArchive({str(self.path)!r})"
+
+
+__all__ = ["FloorsheetArchive"]
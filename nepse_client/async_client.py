@@ -7,17 +7,24 @@ suitable for concurrent operations and high-performance applications.
 
 import asyncio
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import AsyncGenerator, AsyncIterator
 from datetime import date, datetime, timedelta
+from itertools import islice
 from typing import Any, Optional, Union, cast
 
 import httpx
-import tqdm.asyncio
 
-from .client import _NepseBase
+from .cache import ResponseCache
+from .client import _MISSING, DEFAULT_POOL_LIMITS, _NepseBase, get_ssl_context
 from .dummy_id_manager import AsyncDummyIDManager
 from .exceptions import NepseAuthenticationError, NepseNetworkError, NepseValidationError
+from .floorsheet import FloorSheetColumns
+from .history_cache import HistoryCache
+from .json_decoder import JSONDecoder
+from .reference_cache import ReferenceCache
 from .token_manager import AsyncTokenManager
+from .token_store import FileTokenStore
 
 
 logger = logging.getLogger(__name__)
@@ -34,6 +41,31 @@ class AsyncNepseClient(_NepseBase):
        logger: Optional custom logger instance
        mask_request_data: Whether to mask sensitive data in logs (default: True)
        timeout: Request timeout in seconds (default: 100.0)
+       keep_alive: Keep connections open and reuse them across requests
+          instead of sending ``Connection: close`` (default: False)
+       limits: Optional ``httpx.Limits`` controlling the connection pool
+          (max connections, keep-alive connections and keep-alive expiry).
+          NEPSE is served from a single origin, so these limits also act as
+          the per-host limits.
+       token_store: Optional :class:`~nepse_client.FileTokenStore` shared by
+          several client processes, so a token fetched by one is reused by
+          the others instead of every process authenticating separately
+       user_agent_policy: How requests pick their User-Agent from the bundled
+          pool: ``"random"`` (default), ``"round_robin"`` or ``"fixed"``
+       json_decoder: Backend used to decode responses: ``"orjson"``,
+          ``"msgspec"``, ``"json"`` or a callable taking the body bytes.
+          Defaults to the fastest one installed.
+       response_cache: Optional :class:`~nepse_client.ResponseCache` reusing
+          API responses for a per-endpoint TTL; may be shared by clients
+       history_cache: Optional :class:`~nepse_client.HistoryCache` keeping
+          responses for past business dates on disk, across processes
+       reference_cache: Optional :class:`~nepse_client.ReferenceCache` loading
+          the company, security and holiday lists from disk, refreshed in
+          the background once older than its ``refresh_interval``
+       coalesce_requests: Share one upstream call between identical GET
+          requests that are in flight at the same time (default: True).
+          Every waiter receives the same result object, so treat it as
+          read-only. ``coalesce_stats`` counts the calls that were saved.
 
     Example:
        Basic usage::
@@ -62,11 +94,22 @@ class AsyncNepseClient(_NepseBase):
        manages authentication tokens and handles token expiration.
     """
 
+    client: httpx.AsyncClient
+
     def __init__(
         self,
         logger: Optional[logging.Logger] = None,
         mask_request_data: bool = True,
         timeout: float = 100.0,
+        keep_alive: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        token_store: Optional[FileTokenStore] = None,
+        user_agent_policy: str = "random",
+        json_decoder: Optional[Union[str, JSONDecoder]] = None,
+        response_cache: Optional[ResponseCache] = None,
+        history_cache: Optional[HistoryCache] = None,
+        reference_cache: Optional[ReferenceCache] = None,
+        coalesce_requests: bool = True,
     ):
         """Initialize asynchronous NEPSE client."""
         super().__init__(
@@ -75,7 +118,23 @@ class AsyncNepseClient(_NepseBase):
             logger=logger,
             mask_request_data=mask_request_data,
             timeout=timeout,
+            keep_alive=keep_alive,
+            limits=limits,
+            token_store=token_store,
+            user_agent_policy=user_agent_policy,
+            json_decoder=json_decoder,
+            response_cache=response_cache,
+            history_cache=history_cache,
+            reference_cache=reference_cache,
         )
+        # Single-flight GETs: (url, authorized) -> task of the upstream call
+        self.coalesce_requests = coalesce_requests
+        self.coalesce_stats = {"upstream": 0, "coalesced": 0}
+        self._inflight: dict[tuple[str, bool], asyncio.Task] = {}
+        # Background refreshes of the reference cache, kept alive until done
+        self._refresh_tasks: set[asyncio.Task] = set()
+        # Previous HTTP clients being closed after init_client replaced them
+        self._closing_tasks: set[asyncio.Task] = set()
         self.init_client(tls_verify=self._tls_verify)
 
     def init_client(self, tls_verify: bool) -> None:
@@ -85,14 +144,30 @@ class AsyncNepseClient(_NepseBase):
         Args:
            tls_verify: Whether to verify TLS certificates
         """
+        # Release pooled connections held by a previous client
+        if hasattr(self, "client"):
+            self._closeLater(self.client)
+
         self.client = httpx.AsyncClient(
-            verify=tls_verify,
+            verify=get_ssl_context(http2=False) if tls_verify else False,
             http2=False,  # HTTP/2 can cause issues with some servers
             timeout=self.timeout,
             follow_redirects=True,
+            limits=self.limits or DEFAULT_POOL_LIMITS,
         )
         self.logger.debug(f"Async HTTP client initialized (TLS verify: {tls_verify})")
 
+    def _closeLater(self, client: httpx.AsyncClient) -> None:
+        """Close a replaced HTTP client, in the background if an event loop is running."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(client.aclose())
+            return
+        task = loop.create_task(client.aclose())
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
@@ -103,6 +178,13 @@ class AsyncNepseClient(_NepseBase):
 
     async def close(self) -> None:
         """Close HTTP client and cleanup resources."""
+        await self.token_manager.stopBackgroundRefresh()
+        refresh_tasks = list(self._refresh_tasks)
+        for task in refresh_tasks:
+            task.cancel()
+        await asyncio.gather(*refresh_tasks, return_exceptions=True)
+        if self._closing_tasks:
+            await asyncio.gather(*self._closing_tasks, return_exceptions=True)
         if hasattr(self, "client"):
             await self.client.aclose()
             self.logger.debug("Async HTTP client closed")
@@ -145,9 +227,9 @@ class AsyncNepseClient(_NepseBase):
                 )
                 await asyncio.sleep(wait_time)
 
-            except NepseAuthenticationError:
+            except NepseAuthenticationError as e:
                 self.logger.info("Token expired, refreshing...")
-                await self.token_manager.update()
+                await self.token_manager.renewRejected(e.rejected_token)
                 # Retry immediately after token refresh
                 return await request_func(*args, **kwargs)
 
@@ -155,6 +237,9 @@ class AsyncNepseClient(_NepseBase):
         """
         Make async GET request to NEPSE API.
 
+        Identical requests made while one is in flight wait for its result
+        instead of calling the API again (see ``coalesce_requests``).
+
         Args:
            url: API endpoint URL
            include_authorization_headers: Whether to include auth headers
@@ -162,20 +247,54 @@ class AsyncNepseClient(_NepseBase):
         Returns:
            Parsed response data
         """
+        ttl, cached = self._cacheLookup(url, include_authorization_headers)
+        if cached is not _MISSING:
+            return cached
 
         async def _make_request():
-            headers = (
-                await self.getAuthorizationHeaders()
-                if include_authorization_headers
-                else {**self.headers, "User-Agent": self.get_random_user_agent()}
-            )
-            response = await self.client.get(
-                self.get_full_url(api_url=url),
-                headers=headers,
-            )
-            return self.handle_response(response)
-
-        return await self._retry_request(_make_request)
+            if not include_authorization_headers:
+                response = await self.client.get(
+                    self.get_full_url(api_url=url),
+                    headers=self.build_headers(),
+                )
+                data = self.handle_response(response)
+            else:
+                async with self.token_manager.pinned():
+                    response = await self.client.get(
+                        self.get_full_url(api_url=url),
+                        headers=await self.getAuthorizationHeaders(),
+                    )
+                    data = self.handle_response(response)
+            self._cacheStore(url, include_authorization_headers, response, data, ttl)
+            return data, response.content
+
+        if not self.coalesce_requests:
+            data, _ = await self._retry_request(_make_request)
+            return data
+
+        key = (url, include_authorization_headers)
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._retry_request(_make_request))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._requestDone(key, done))
+            self.coalesce_stats["upstream"] += 1
+            # A cancelled waiter must not cancel the call the others are waiting on
+            data, _ = await asyncio.shield(task)
+            return data
+
+        self.coalesce_stats["coalesced"] += 1
+        # Callers may modify their result, so every waiter decodes its own copy
+        _, content = await asyncio.shield(task)
+        return self._decodeCached(content)
+
+    def _requestDone(self, key: tuple[str, bool], task: asyncio.Task) -> None:
+        """Forget a finished coalesced request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the error as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
 
     async def requestPOSTAPI(self, url: str, payload_generator) -> Any:
         """
@@ -188,16 +307,24 @@ class AsyncNepseClient(_NepseBase):
         Returns:
            Parsed response data
         """
+        # The payload only proves the token, so the URL identifies the response
+        ttl, cached = self._cacheLookup(url, "POST")
+        if cached is not _MISSING:
+            return cached
 
         async def _make_request():
-            payload = {"id": await payload_generator()}
-            response = await self.client.post(
-                self.get_full_url(api_url=url),
-                headers=await self.getAuthorizationHeaders(),
-                json=payload,
-                # data=payload,
-            )
-            return self.handle_response(response, request_data=payload)
+            # Payload salts and Authorization header must come from the same token
+            async with self.token_manager.pinned():
+                payload = {"id": await payload_generator()}
+                response = await self.client.post(
+                    self.get_full_url(api_url=url),
+                    headers=await self.getAuthorizationHeaders(),
+                    json=payload,
+                    # data=payload,
+                )
+                data = self.handle_response(response, request_data=payload)
+            self._cacheStore(url, "POST", response, data, ttl)
+            return data
 
         return await self._retry_request(_make_request)
 
@@ -208,31 +335,23 @@ class AsyncNepseClient(_NepseBase):
         Returns:
            Dictionary of HTTP headers
         """
-        access_token = await self.token_manager.getAccessToken()
-        return {
-            "Authorization": f"Salter {access_token}",
-            "Content-Type": "application/json",
-            **self.headers,
-            "User-Agent": self.get_random_user_agent(),
-        }
+        return self.build_headers(await self.token_manager.getAccessToken())
 
     # Payload ID generators
 
     async def getPOSTPayloadIDForScrips(self) -> int:
         """Generate payload ID for scrip-related requests."""
-        dummy_id = self.getDummyID()
-        return int(self.getDummyData()[dummy_id] + dummy_id + 2 * date.today().day)
+        dummy_id = await self.dummy_id_manager.getDummyID()
+        return int(self.getDummyData()[dummy_id] + dummy_id + 2 * self.clock.today().day)
 
     async def getPOSTPayloadID(self) -> int:
         """Generate general payload ID."""
         e = await self.getPOSTPayloadIDForScrips()
-        # Wait for token manager update to complete
-        await self.token_manager.update_completed.wait()
 
         salt_index = 3 if e % 10 < 5 else 1
         return int(
             e
-            + self.token_manager.salts[salt_index] * date.today().day
+            + self.token_manager.salts[salt_index] * self.clock.today().day
             - self.token_manager.salts[salt_index - 1]
         )
 
@@ -249,12 +368,10 @@ class AsyncNepseClient(_NepseBase):
            Payload ID integer
         """
         e = await self.getPOSTPayloadIDForScrips()
-        # Wait for token manager update to complete
-        await self.token_manager.update_completed.wait()
 
         # Parse business_date
         if business_date is None:
-            day = date.today().day
+            day = self.clock.today().day
         elif isinstance(business_date, (date, datetime)):
             day = business_date.day
         else:
@@ -372,19 +489,77 @@ class AsyncNepseClient(_NepseBase):
 
     # Company and Security data methods
 
+    async def _referenceData(self, name: str, url: str) -> Any:
+        """
+        Get a reference dataset from :attr:`reference_cache`, or the API.
+
+        Stale datasets are returned as stored while a background task
+        fetches a fresh copy (see :class:`~nepse_client.ReferenceCache`).
+
+        Args:
+           name: Dataset name in the reference cache
+           url: API endpoint URL of the dataset
+
+        Returns:
+           Parsed response data
+        """
+        cache = self.reference_cache
+        if cache is None:
+            return await self.requestGETAPI(url=url)
+        entry = cache.get(name)
+        if entry is None or (cache.isStale(entry) and not cache.background_refresh):
+            data = await self.requestGETAPI(url=url)
+            cache.put(name, data)
+            return data
+        if self.response_cache is not None:
+            self.response_cache.observe(url, entry.data)
+        if cache.isStale(entry) and cache.claimRefresh(name):
+            task = asyncio.ensure_future(self._refreshReferenceData(name, url))
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+        return entry.data
+
+    async def _refreshReferenceData(self, name: str, url: str) -> None:
+        """Fetch a stale reference dataset and reset the maps derived from it."""
+        assert self.reference_cache is not None
+        failed = False
+        try:
+            self.reference_cache.put(name, await self.requestGETAPI(url=url))
+            self._resetReferenceMaps()
+            self.logger.debug(f"Refreshed reference data {name}")
+        except Exception as e:
+            failed = True
+            self.logger.warning(f"Failed to refresh reference data {name}: {e}")
+        finally:
+            self.reference_cache.releaseRefresh(name, failed=failed)
+
     async def getCompanyList(self) -> list[dict[str, Any]]:
         """Get list of all listed companies."""
-        self.company_list = await self.requestGETAPI(url=self.api_end_points["company_list_url"])
+        self.company_list = await self._referenceData(
+            "company_list", self.api_end_points["company_list_url"]
+        )
         return list(self.company_list)
 
     async def getSecurityList(self) -> list[dict[str, Any]]:
         """Get list of all securities (non-delisted)."""
-        self.security_list = await self.requestGETAPI(url=self.api_end_points["security_list_url"])
+        self.security_list = await self._referenceData(
+            "security_list", self.api_end_points["security_list_url"]
+        )
         return list(self.security_list)
 
+    async def getHolidayList(self, year: int = 2025) -> list[dict[str, Any]]:
+        """Get list of market holidays for specified year."""
+        url = f"{self.api_end_points['holiday-list']}?year={year}"
+        self.holiday_list = await self._referenceData(f"holiday_list_{year}", url)
+        return list(self.holiday_list)
+
     async def getCompanyIDKeyMap(self, force_update: bool = False) -> dict[str, int]:
         """Get mapping of company symbols to IDs."""
-        if self.company_symbol_id_keymap is None or force_update:
+        if (
+            self.company_symbol_id_keymap is None
+            or force_update
+            or self._isReferenceStale("company_list")
+        ):
             company_list = await self.getCompanyList()
             self.company_symbol_id_keymap = {
                 company["symbol"]: company["id"] for company in company_list
@@ -393,7 +568,11 @@ class AsyncNepseClient(_NepseBase):
 
     async def getSecurityIDKeyMap(self, force_update: bool = False) -> dict[str, int]:
         """Get mapping of security symbols to IDs."""
-        if self.security_symbol_id_keymap is None or force_update:
+        if (
+            self.security_symbol_id_keymap is None
+            or force_update
+            or self._isReferenceStale("security_list")
+        ):
             security_list = await self.getSecurityList()
             self.security_symbol_id_keymap = {
                 security["symbol"]: security["id"] for security in security_list
@@ -446,7 +625,7 @@ class AsyncNepseClient(_NepseBase):
             start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
 
         # Default dates
-        end_date = end_date or date.today()
+        end_date = end_date or self.clock.today()
         start_date = start_date or (end_date - timedelta(days=365))
 
         symbol = symbol.upper()
@@ -472,21 +651,43 @@ class AsyncNepseClient(_NepseBase):
 
     # Floor sheet methods
 
-    async def getFloorSheet(self, show_progress: bool = False) -> list[dict[str, Any]]:
+    async def getFloorSheet(
+        self,
+        show_progress: bool = False,
+        since_contract_id: Optional[int] = None,
+        columnar: bool = False,
+    ) -> Union[list[dict[str, Any]], dict[str, Any], FloorSheetColumns]:
         """
         Get complete floor sheet data.
 
         Args:
            show_progress: Show progress bar during download
+           since_contract_id: Incremental mode. Fetch pages only until this
+              contract ID (the last one the caller already has) is reached and
+              return ``{"content": new_rows, "last_contract_id": new_mark}``.
+           columnar: Return a :class:`FloorSheetColumns` instead of a list of dicts
 
         Returns:
-           List of all floor sheet records
+           List of all floor sheet records, or the incremental result
         """
+        if columnar and since_contract_id is not None:
+            raise NepseValidationError(
+                "columnar cannot be combined with since_contract_id",
+                field="columnar",
+                value=columnar,
+            )
+
         url = (
             f"{self.api_end_points['floor_sheet']}"
             f"?size={self.floor_sheet_size}&sort=contractId,desc"
         )
 
+        if since_contract_id is not None:
+            return await self._getFloorSheetSince(url, since_contract_id)
+
+        if columnar:
+            return await self._getFloorSheetColumns(url)
+
         # Get first page
         sheet = await self.requestPOSTAPI(
             url=url, payload_generator=self.getPOSTPayloadIDForFloorSheet
@@ -500,6 +701,8 @@ class AsyncNepseClient(_NepseBase):
 
         # Execute with optional progress bar
         if show_progress:
+            import tqdm.asyncio
+
             remaining_pages = await tqdm.asyncio.tqdm.gather(*tasks)
         else:
             remaining_pages = await asyncio.gather(*tasks)
@@ -508,6 +711,164 @@ class AsyncNepseClient(_NepseBase):
         all_pages = [first_page] + remaining_pages
         return cast(list[dict[str, Any]], [row for page in all_pages for row in page])
 
+    async def aiter_floorsheet(
+        self, concurrency: int = 4, ordered: bool = True
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream floor sheet rows while keeping a bounded number of requests in flight.
+
+        Unlike :meth:`getFloorSheet`, at most ``concurrency`` page requests are
+        outstanding at any time and rows are yielded as soon as their page
+        arrives, so peak memory is bounded by the window instead of the whole day.
+
+        Args:
+           concurrency: Maximum number of page requests in flight
+           ordered: Yield pages in page order. With ``False`` pages are yielded
+              in completion order, which avoids waiting on a slow page.
+
+        Yields:
+           Floor sheet records
+
+        Example::
+
+           async for row in client.aiter_floorsheet(concurrency=8):
+              writer.writerow(row)
+        """
+        url = (
+            f"{self.api_end_points['floor_sheet']}"
+            f"?size={self.floor_sheet_size}&sort=contractId,desc"
+        )
+        async for page in self._aiterFloorSheetPages(url, concurrency, ordered):
+            for row in page:
+                yield row
+
+    async def _aiterFloorSheetPages(
+        self, url: str, concurrency: int, ordered: bool = True
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Yield floor sheet pages using a sliding window of page requests.
+
+        Args:
+           url: Base floor sheet URL
+           concurrency: Maximum number of page requests in flight
+           ordered: Yield pages in page order instead of completion order
+
+        Yields:
+           List of records for each page
+        """
+        if concurrency < 1:
+            raise NepseValidationError(
+                "concurrency must be at least 1", field="concurrency", value=concurrency
+            )
+
+        sheet = await self.requestPOSTAPI(
+            url=url, payload_generator=self.getPOSTPayloadIDForFloorSheet
+        )
+        if not sheet:
+            return
+
+        page_numbers = iter(range(1, sheet["floorsheets"]["totalPages"]))
+        first_page = sheet["floorsheets"]["content"]
+        del sheet
+
+        def _schedule(page_num: int) -> asyncio.Task:
+            return asyncio.create_task(self._getFloorSheetPageNumber(url, page_num))
+
+        # Start the window before handing out the first page
+        window = deque(_schedule(page_num) for page_num in islice(page_numbers, concurrency))
+        try:
+            yield first_page
+
+            while window:
+                done: set[asyncio.Task]
+                if ordered:
+                    done = {window[0]}
+                    await window[0]
+                else:
+                    done, _ = await asyncio.wait(window, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    window.remove(task)
+                    next_page = next(page_numbers, None)
+                    if next_page is not None:
+                        window.append(_schedule(next_page))
+
+                for task in done:
+                    yield task.result()
+        finally:
+            # Stop outstanding requests if the consumer stops early or a page failed
+            pending = [task for task in window if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _getFloorSheetColumns(self, url: str, concurrency: int = 4) -> FloorSheetColumns:
+        """
+        Build a columnar floor sheet page by page, as the pages arrive.
+
+        Args:
+           url: Base floor sheet URL
+           concurrency: Maximum number of page requests in flight
+
+        Returns:
+           Columnar floor sheet
+        """
+        columns = FloorSheetColumns()
+        async for page in self._aiterFloorSheetPages(url, concurrency):
+            columns.extend(page)
+        return columns
+
+    async def _aiterFloorSheetPagesOnDemand(
+        self, url: str
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Yield floor sheet pages in order, requesting each one only when it is consumed.
+
+        Args:
+           url: Base floor sheet URL
+
+        Yields:
+           List of records for each page
+        """
+        sheet = await self.requestPOSTAPI(
+            url=url, payload_generator=self.getPOSTPayloadIDForFloorSheet
+        )
+        if not sheet:
+            return
+
+        total_pages = sheet["floorsheets"]["totalPages"]
+        first_page = sheet["floorsheets"]["content"]
+        del sheet
+
+        yield first_page
+        for page_num in range(1, total_pages):
+            yield await self._getFloorSheetPageNumber(url, page_num)
+
+    async def _getFloorSheetSince(self, url: str, since_contract_id: int) -> dict[str, Any]:
+        """
+        Fetch floor sheet pages until a known contract ID is reached.
+
+        Args:
+           url: Base floor sheet URL
+           since_contract_id: Last contract ID the caller already has
+
+        Returns:
+           Dictionary with the new ``content`` and the new ``last_contract_id``
+        """
+        rows: list[dict[str, Any]] = []
+        seen: set[int] = set()
+        # No prefetching: pages past the mark must not be requested at all
+        pages = self._aiterFloorSheetPagesOnDemand(url)
+        try:
+            async for page in pages:
+                new_rows, crossed = self._takeNewFloorSheetRows(page, since_contract_id, seen)
+                rows.extend(new_rows)
+                if crossed:
+                    break
+        finally:
+            await pages.aclose()
+        return self._incrementalFloorSheetResult(rows, since_contract_id)
+
     async def _getFloorSheetPageNumber(self, url: str, page_number: int) -> list[dict[str, Any]]:
         """
         Get a specific page of floor sheet data.
@@ -531,8 +892,28 @@ class AsyncNepseClient(_NepseBase):
         self,
         symbol: str,
         business_date: Optional[Union[str, date]] = None,
-    ) -> list[dict[str, Any]]:
-        """Get floor sheet for a specific company."""
+        since_contract_id: Optional[int] = None,
+        columnar: bool = False,
+    ) -> Union[list[dict[str, Any]], dict[str, Any], FloorSheetColumns]:
+        """
+        Get floor sheet for a specific company.
+
+        Args:
+           symbol: Company symbol
+           business_date: Business date (YYYY-MM-DD string or date object)
+           since_contract_id: Incremental mode, see :meth:`getFloorSheet`
+           columnar: Return a :class:`FloorSheetColumns` instead of a list of dicts
+
+        Returns:
+           List of floor sheet records, or the incremental result
+        """
+        if columnar and since_contract_id is not None:
+            raise NepseValidationError(
+                "columnar cannot be combined with since_contract_id",
+                field="columnar",
+                value=columnar,
+            )
+
         symbol = symbol.upper()
         company_id = (await self.getSecurityIDKeyMap())[symbol]
 
@@ -540,7 +921,7 @@ class AsyncNepseClient(_NepseBase):
             if isinstance(business_date, str):
                 business_date = date.fromisoformat(business_date)
         else:
-            business_date = date.today()
+            business_date = self.clock.today()
 
         url = (
             f"{self.api_end_points['company_floorsheet']}{company_id}"
@@ -548,6 +929,12 @@ class AsyncNepseClient(_NepseBase):
             f"&sort=contractid,desc"
         )
 
+        if since_contract_id is not None:
+            return await self._getFloorSheetSince(url, since_contract_id)
+
+        if columnar:
+            return await self._getFloorSheetColumns(url)
+
         sheet = await self.requestPOSTAPI(
             url=url, payload_generator=self.getPOSTPayloadIDForFloorSheet
         )
@@ -0,0 +1,520 @@
+"""
+Response caching.
+
+This module provides :class:`ResponseCache`, an in-memory LRU cache of API
+response bodies with a time-to-live per API endpoint, shared safely by the
+sync and async clients, and :class:`MarketHoursPolicy`, which keeps market
+data cached from the close of a session until the next one opens.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from datetime import date, datetime
+from datetime import time as dt_time
+from datetime import timedelta
+from typing import Any, NamedTuple, Optional, Union
+
+from .clock import ServerClock
+
+
+logger = logging.getLogger(__name__)
+
+# Regular NEPSE session hours (exchange time)
+NEPSE_OPEN = dt_time(10, 30)
+NEPSE_CLOSE = dt_time(15, 0)
+
+# Index graph endpoints (POST), served for the current session only
+INDEX_GRAPH_ENDPOINTS = (
+    "nepse_index_daily_graph",
+    "sensitive_index_daily_graph",
+    "float_index_daily_graph",
+    "sensitive_float_index_daily_graph",
+    "banking_sub_index_graph",
+    "development_bank_sub_index_graph",
+    "finance_sub_index_graph",
+    "hotel_tourism_sub_index_graph",
+    "hydro_sub_index_graph",
+    "investment_sub_index_graph",
+    "life_insurance_sub_index_graph",
+    "manufacturing_sub_index_graph",
+    "microfinance_sub_index_graph",
+    "mutual_fund_sub_index_graph",
+    "non_life_insurance_sub_index_graph",
+    "others_sub_index_graph",
+    "trading_sub_index_graph",
+)
+
+
+class CacheEntry(NamedTuple):
+    """A cached response body, the time (``time_function``) it expires and its endpoint."""
+
+    content: bytes
+    expires_at: float
+    endpoint: Optional[str] = None
+
+
+class EndpointTable:
+    """
+    Lookup of the ``API_ENDPOINTS.json`` endpoint name of API URLs.
+
+    Args:
+       api_end_points: Endpoint name -> URL path
+    """
+
+    def __init__(self, api_end_points: Optional[dict[str, str]] = None):
+        """Initialize table."""
+        # Longest paths first, so e.g. company_floorsheet wins over company_details
+        self._endpoints = sorted(
+            ((path, name) for name, path in (api_end_points or {}).items()),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        # A bare path other endpoints live below, such as /api/nots (the
+        # subindices), is only matched exactly, so unknown URLs under it are
+        # not cached with its TTL
+        paths = [path.split("?", 1)[0] for path, _ in self._endpoints]
+        self._prefixes = [
+            (path, name)
+            for path, name in self._endpoints
+            if path[-1] in "/="
+            or not any(other.startswith(path.split("?", 1)[0] + "/") for other in paths)
+        ]
+
+    def name(self, url: str) -> Optional[str]:
+        """
+        Return the endpoint name of an API URL.
+
+        Args:
+           url: API URL path, optionally with the query string and a
+              parameter appended to the endpoint path
+
+        Returns:
+           Endpoint name, or None if the URL is not in the endpoint table
+        """
+        path = url.split("?", 1)[0]
+        for endpoint_path, name in self._endpoints:
+            if url == endpoint_path or path == endpoint_path:
+                return name
+        for endpoint_path, name in self._prefixes:
+            if not url.startswith(endpoint_path):
+                continue
+            # Endpoints are extended with an ID, a path segment or a query string
+            if endpoint_path[-1] in "/=" or url[len(endpoint_path)] in "/?":
+                return name
+        return None
+
+
+class MarketHoursPolicy:
+    """
+    Trading calendar deciding how long market data stays valid.
+
+    Prices, summaries, top-ten lists and index graphs only change during a
+    trading session. Outside one, :class:`ResponseCache` keeps these
+    responses until the next session opens, so pollers running overnight or
+    over a weekend are served from the cache.
+
+    The schedule (trading weekdays and hours) is corrected with what the
+    cache sees in API responses: holidays from ``getHolidayList``, and
+    ``getMarketStatus`` results revealing an unscheduled closure (the market
+    is not open and ``asOf`` is still a previous day) or session. The market
+    status itself is cached for at most ``status_ttl`` while closed, so such
+    changes are noticed.
+
+    Args:
+       open_time: Start of a session (pre-open), exchange time
+       close_time: End of a session, exchange time
+       settle: Seconds after ``close_time`` until end-of-day figures are final
+       trading_days: Trading weekdays (``date.weekday()``), Sunday to Thursday
+       holidays: Known market holidays, in addition to those observed
+       status_ttl: Longest time the market status is cached while closed
+       endpoints: Endpoint names whose responses are frozen while closed
+
+    Example:
+       >>> cache = ResponseCache(policy=MarketHoursPolicy())
+       >>> client = NepseClient(response_cache=cache)
+       >>> client.getHolidayList(year=2025)  # teaches the policy the holidays
+       >>> client.getSummary()  # after the close: cached until the next open
+    """
+
+    # Endpoints whose data only changes during a session
+    MARKET_ENDPOINTS = frozenset(
+        {
+            "live-market",
+            "price_volume_url",
+            "summary_url",
+            "supply_demand_url",
+            "top_gainers_url",
+            "top_losers_url",
+            "top_ten_trade_url",
+            "top_ten_transaction_url",
+            "top_ten_turnover_url",
+            "turnover_url",
+            "nepse_index_url",
+            "nepse_subindices_url",
+            "market-depth",
+            "company-market-depth",
+            "company_details",
+            "company_daily_graph",
+            "trading-average",
+            *INDEX_GRAPH_ENDPOINTS,
+        }
+    )
+    STATUS_ENDPOINT = "nepse_open_url"
+    HOLIDAY_ENDPOINT = "holiday-list"
+    # A status that still reports a previous day this long after the open
+    # means there is no session today
+    CLOSURE_GRACE = timedelta(minutes=30)
+
+    def __init__(
+        self,
+        open_time: dt_time = NEPSE_OPEN,
+        close_time: dt_time = NEPSE_CLOSE,
+        settle: float = 900,
+        trading_days: Iterable[int] = (6, 0, 1, 2, 3),
+        holidays: Iterable[Union[str, date]] = (),
+        status_ttl: float = 3600,
+        endpoints: Optional[Iterable[str]] = None,
+    ):
+        """Initialize policy with the regular NEPSE schedule."""
+        self.open_time = open_time
+        self.close_time = close_time
+        self.settle = timedelta(seconds=settle)
+        self.trading_days = frozenset(trading_days)
+        self.holidays = {self._parseDate(day) for day in holidays}
+        self.sessions: set[date] = set()
+        self.status_ttl = status_ttl
+        self.endpoints = frozenset(endpoints) if endpoints is not None else self.MARKET_ENDPOINTS
+
+    @staticmethod
+    def _parseDate(value: Union[str, date]) -> date:
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return date.fromisoformat(value[:10])
+
+    def isTradingDay(self, day: date) -> bool:
+        """Return whether a session is expected on a calendar date."""
+        if day in self.sessions:
+            return True
+        return day.weekday() in self.trading_days and day not in self.holidays
+
+    def isLive(self, now: datetime) -> bool:
+        """
+        Return whether market data may still change.
+
+        Args:
+           now: Current exchange time (naive)
+        """
+        day = now.date()
+        if not self.isTradingDay(day):
+            return False
+        opens = datetime.combine(day, self.open_time)
+        return opens <= now < datetime.combine(day, self.close_time) + self.settle
+
+    def nextOpen(self, now: datetime) -> datetime:
+        """
+        Return the start of the next session.
+
+        Args:
+           now: Current exchange time (naive)
+        """
+        day = now.date()
+        if now.time() >= self.open_time:
+            day += timedelta(days=1)
+        for _ in range(366):
+            if self.isTradingDay(day):
+                break
+            day += timedelta(days=1)
+        return datetime.combine(day, self.open_time)
+
+    def ttl(self, endpoint: Optional[str], base_ttl: float, now: datetime) -> float:
+        """
+        Return how long a response stays fresh.
+
+        Args:
+           endpoint: Endpoint name of the response
+           base_ttl: Regular TTL of the endpoint
+           now: Current exchange time (naive)
+
+        Returns:
+           ``base_ttl`` during a session, otherwise up to the next open
+        """
+        if base_ttl <= 0 or self.isLive(now):
+            return base_ttl
+        until_open = (self.nextOpen(now) - now).total_seconds()
+        if endpoint == self.STATUS_ENDPOINT:
+            return max(base_ttl, min(self.status_ttl, until_open))
+        if endpoint in self.endpoints:
+            return max(base_ttl, until_open)
+        return base_ttl
+
+    def observeMarketStatus(self, status: dict[str, Any], now: datetime) -> bool:
+        """
+        Correct the calendar with a ``getMarketStatus`` response.
+
+        Args:
+           status: Market status, with ``isOpen`` and ``asOf``
+           now: Exchange time the status was received (naive)
+
+        Returns:
+           True if the market is open although the calendar had it closed
+        """
+        today = now.date()
+        if status.get("isOpen") == "OPEN":
+            reopened = not self.isLive(now)
+            if reopened:
+                logger.info(f"Market open outside the schedule on {today}")
+                self.sessions.add(today)
+                self.holidays.discard(today)
+            return reopened
+
+        try:
+            as_of = self._parseDate(status["asOf"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        grace = datetime.combine(today, self.open_time) + self.CLOSURE_GRACE
+        if as_of < today and now >= grace and self.isTradingDay(today):
+            logger.info(f"No session on {today}, market data cached until the next open")
+            self.sessions.discard(today)
+            self.holidays.add(today)
+        return False
+
+    def observeHolidays(self, holidays: list[dict[str, Any]]) -> None:
+        """
+        Add the dates of a ``getHolidayList`` response to :attr:`holidays`.
+
+        Args:
+           holidays: Holiday records with a ``holidayDate``
+        """
+        for holiday in holidays:
+            try:
+                self.holidays.add(self._parseDate(holiday["holidayDate"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def __repr__(self) -> str:
+        """Return the string representation of the policy."""
+        return (
+            f"MarketHoursPolicy(open={self.open_time}, close={self.close_time}, "
+            f"holidays={len(self.holidays)})"
+        )
+
+
+class ResponseCache:
+    """
+    LRU cache of API response bodies with per-endpoint TTLs.
+
+    Entries are raw response bodies, decoded again on every hit, so callers
+    never share (and accidentally modify) cached objects and ``max_bytes``
+    bounds exactly what the cache holds. TTLs are keyed by the endpoint names
+    of ``API_ENDPOINTS.json``; endpoints without a TTL (and URLs outside the
+    endpoint table, such as authentication) are never cached.
+
+    With a :class:`MarketHoursPolicy`, market data fetched outside a trading
+    session is kept until the next session opens.
+
+    Args:
+       max_bytes: Maximum total size of the cached bodies; least recently
+          used entries are evicted beyond it
+       ttls: TTL overrides in seconds by endpoint name, merged over
+          :attr:`DEFAULT_TTLS` (0 disables caching an endpoint)
+       time_function: Monotonic clock used for expiry
+       policy: Optional trading calendar extending TTLs while the market is closed
+
+    Example:
+       >>> cache = ResponseCache(ttls={"summary_url": 30})
+       >>> client = NepseClient(response_cache=cache)
+       >>> client.getSummary()  # network
+       >>> client.getSummary()  # cache hit
+       >>> cache.stats["hits"]
+       1
+    """
+
+    # Seconds each endpoint's response is reused. Market data refreshes every
+    # few seconds while trading; reference data changes rarely.
+    DEFAULT_TTLS: dict[str, float] = {
+        "nepse_open_url": 10,
+        "live-market": 5,
+        "price_volume_url": 10,
+        "summary_url": 10,
+        "supply_demand_url": 10,
+        "top_gainers_url": 10,
+        "top_losers_url": 10,
+        "top_ten_trade_url": 10,
+        "top_ten_transaction_url": 10,
+        "top_ten_turnover_url": 10,
+        "turnover_url": 10,
+        "nepse_index_url": 10,
+        "nepse_subindices_url": 10,
+        "market-depth": 5,
+        "company-market-depth": 5,
+        "company_details": 10,
+        "company_daily_graph": 30,
+        **dict.fromkeys(INDEX_GRAPH_ENDPOINTS, 30),
+        "trading-average": 60,
+        "company_list_url": 3600,
+        "security_list_url": 3600,
+        "holiday-list": 86400,
+        "debenture-and-bond": 3600,
+        "company-financial": 3600,
+        "company-agm": 3600,
+        "company-dividend": 3600,
+        "company-news": 300,
+        "news-alerts": 300,
+        "press-release": 300,
+        "nepse-notice": 300,
+    }
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttls: Optional[dict[str, float]] = None,
+        time_function: Callable[[], float] = time.monotonic,
+        policy: Optional[MarketHoursPolicy] = None,
+    ):
+        """Initialize an empty cache."""
+        self.max_bytes = max_bytes
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.time_function = time_function
+        self.policy = policy
+        self.clock = ServerClock()
+        self.size = 0
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self.endpoints = EndpointTable()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    def bind(self, api_end_points: dict[str, str], clock: Optional[ServerClock] = None) -> None:
+        """
+        Set the endpoint table used to find the TTL of a URL.
+
+        Args:
+           api_end_points: Endpoint name -> URL path, as in ``API_ENDPOINTS.json``
+           clock: Server clock of the client, used by :attr:`policy`
+        """
+        if clock is not None:
+            self.clock = clock
+        self.endpoints = EndpointTable(api_end_points)
+
+    def endpoint(self, url: str) -> Optional[str]:
+        """Return the endpoint name of an API URL (see :meth:`EndpointTable.name`)."""
+        return self.endpoints.name(url)
+
+    def ttl(self, url: str) -> float:
+        """Return the time-to-live of the response of an API URL (0 if not cached)."""
+        name = self.endpoint(url)
+        ttl = float(self.ttls.get(name, 0)) if name is not None else 0.0
+        if self.policy is not None:
+            return self.policy.ttl(name, ttl, self.clock.now())
+        return ttl
+
+    def observe(self, url: str, data: Any) -> None:
+        """
+        Feed a decoded response to :attr:`policy`.
+
+        Market status and holiday list responses update the trading calendar.
+        When the market turns out to be open, responses kept until the next
+        session are dropped.
+
+        Args:
+           url: API URL path of the response
+           data: Decoded response
+        """
+        if self.policy is None:
+            return
+        name = self.endpoint(url)
+        if name == self.policy.STATUS_ENDPOINT and isinstance(data, dict):
+            if self.policy.observeMarketStatus(data, self.clock.now()):
+                self.discard(self.policy.endpoints)
+        elif name == self.policy.HOLIDAY_ENDPOINT and isinstance(data, list):
+            self.policy.observeHolidays(data)
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """
+        Return a fresh cached body and mark it recently used.
+
+        Args:
+           key: Cache key
+
+        Returns:
+           Cached body, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            if entry.expires_at <= self.time_function():
+                self._remove(key)
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry.content
+
+    def put(
+        self, key: Hashable, content: bytes, ttl: float, endpoint: Optional[str] = None
+    ) -> None:
+        """
+        Cache a response body.
+
+        Args:
+           key: Cache key
+           content: Raw response body
+           ttl: Seconds the body stays fresh; nothing is cached if not positive
+           endpoint: Endpoint name of the response, for :meth:`discard`
+        """
+        if ttl <= 0 or len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CacheEntry(content, self.time_function() + ttl, endpoint)
+            self.size += len(content)
+            while self.size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats["evictions"] += 1
+
+    def _remove(self, key: Hashable) -> None:
+        self.size -= len(self._entries.pop(key).content)
+
+    def discard(self, endpoints: Iterable[str]) -> None:
+        """
+        Remove the entries of some endpoints.
+
+        Args:
+           endpoints: Endpoint names
+        """
+        endpoints = frozenset(endpoints)
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry.endpoint in endpoints]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit/miss/eviction counters and the current number and size of entries."""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self.size}
+
+    def __len__(self) -> int:
+        """Return the number of cached entries (including expired ones not yet evicted)."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the cache."""
+        return f"ResponseCache(entries={len(self._entries)}, bytes={self.size})"
+
+
+__all__ = ["CacheEntry", "EndpointTable", "MarketHoursPolicy", "ResponseCache"]
@@ -5,15 +5,21 @@ This module provides the foundation for both sync and async clients,
 including common utilities, configuration loading, and response handling.
 """
 
+import itertools
 import json
 import logging
 import pathlib
 import random
+import threading
 import time
-from datetime import datetime
-from functools import singledispatch
-from typing import Any, Optional, Union, cast
+from collections.abc import Hashable
+from functools import lru_cache, singledispatch
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
+import httpx
+
+from .cache import ResponseCache
+from .clock import ServerClock
 from .exceptions import (
     NepseAuthenticationError,
     NepseBadGatewayError,
@@ -21,15 +27,89 @@ from .exceptions import (
     NepseConfigurationError,
     NepseNetworkError,
     NepseServerError,
+    NepseValidationError,
 )
+from .json_decoder import JSONDecoder, get_json_decoder
 
 
-# from nepse_client.data import USER_AGENTS
+if TYPE_CHECKING:
+    import ssl
 
+    from .history_cache import HistoryCache
+    from .reference_cache import ReferenceCache
+    from .token_store import FileTokenStore
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+DATA_DIR = pathlib.Path(__file__).parent / "data"
+
+# How requests pick their User-Agent from the pool
+USER_AGENT_POLICIES = ("random", "round_robin", "fixed")
+
+# Marks a response cache miss (a cached body may decode to None)
+_MISSING = object()
+
+
+def _method(kind: Hashable) -> str:
+    """Return the HTTP method of a request kind used in cache keys."""
+    return "POST" if kind == "POST" else "GET"
+
+
+@lru_cache(maxsize=None)
+def load_config_file(name: str) -> Union[dict, list]:
+    """
+    Load a JSON file from the package data directory (read once per process).
+
+    The parsed data is shared by every client, so callers must copy it
+    before modifying it.
+
+    Args:
+        name: File name inside ``nepse_client/data``
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        NepseConfigurationError: If the file cannot be loaded
+    """
+    return _NepseBase._load_json_file(DATA_DIR / name)
+
+
+@lru_cache(maxsize=None)
+def get_ssl_context(http2: bool = False) -> "ssl.SSLContext":
+    """
+    Return the certificate-verifying SSL context shared by clients of one kind.
+
+    Loading the CA bundle dominates client construction, so it is done once
+    per process and HTTP version. HTTP/2 and HTTP/1.1 clients must not share
+    a context: the transport sets the ALPN protocols on the context of every
+    connection it opens, so a shared one could make an HTTP/1.1 client
+    offer ``h2``.
+
+    Args:
+        http2: Whether the context is for HTTP/2-enabled clients
+    """
+    return httpx.create_ssl_context(verify=True)
+
+
+@lru_cache(maxsize=None)
+def load_user_agents() -> tuple[str, ...]:
+    """
+    Load the User-Agent pool shipped with the package (read once per process).
+
+    Returns:
+        Tuple of User-Agent strings
+
+    Raises:
+        NepseConfigurationError: If USER_AGENTS.json is missing, invalid or empty
+    """
+    data = load_config_file("USER_AGENTS.json")
+    user_agents = data.get("USER_AGENTS", []) if isinstance(data, dict) else []
+    if not user_agents:
+        raise NepseConfigurationError("USER_AGENTS.json contains no user agents")
+    return tuple(str(user_agent) for user_agent in user_agents)
+
 
 def mask_sensitive_data(
     data: dict[str, Any], keys: tuple = ("token", "password", "Authorization")
@@ -44,9 +124,11 @@ def mask_sensitive_data(
     Returns:
         Dictionary with masked sensitive values
     """
+    # Header names arrive lowercased from httpx, so match case-insensitively
+    sensitive = {key.lower() for key in keys}
     masked = data.copy()
-    for key in keys:
-        if key in masked:
+    for key in masked:
+        if isinstance(key, str) and key.lower() in sensitive:
             masked[key] = "***MASKED***"
     return masked
 
@@ -80,6 +162,12 @@ def _(obj: list) -> list:
     return [safe_serialize(item) for item in obj]
 
 
+# Same defaults httpx uses when no limits are given
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0
+)
+
+
 class _NepseBase:
     """
     Base class for NEPSE client implementations.
@@ -93,6 +181,16 @@ class _NepseBase:
         logger: Optional custom logger instance
         mask_request_data: Whether to mask sensitive data in logs
         timeout: Request timeout in seconds
+        keep_alive: Reuse pooled connections instead of sending ``Connection: close``
+        limits: Optional ``httpx.Limits`` for the connection pool
+        token_store: Optional token store shared with other processes
+        user_agent_policy: How each request picks its User-Agent: ``"random"``,
+            ``"round_robin"`` or ``"fixed"`` (one agent for the client's lifetime)
+        json_decoder: JSON backend name (``"orjson"``, ``"msgspec"``, ``"json"``),
+            a callable decoding response bytes, or None for the fastest installed
+        response_cache: Optional cache of API responses, may be shared by clients
+        history_cache: Optional persistent cache of responses for past business dates
+        reference_cache: Optional on-disk cache of the company, security and holiday lists
     """
 
     headers: dict[str, str]
@@ -104,6 +202,14 @@ class _NepseBase:
         logger: Optional[logging.Logger] = None,
         mask_request_data: bool = True,
         timeout: float = 100.0,
+        keep_alive: bool = False,
+        limits: Optional["httpx.Limits"] = None,
+        token_store: Optional["FileTokenStore"] = None,
+        user_agent_policy: str = "random",
+        json_decoder: Optional[Union[str, JSONDecoder]] = None,
+        response_cache: Optional[ResponseCache] = None,
+        history_cache: Optional["HistoryCache"] = None,
+        reference_cache: Optional["ReferenceCache"] = None,
     ):
         """Initialize the base client."""
         # Setup logging
@@ -111,11 +217,34 @@ class _NepseBase:
         self.mask_request_data = mask_request_data
         self.timeout = timeout
 
+        # User-Agent rotation
+        if user_agent_policy not in USER_AGENT_POLICIES:
+            raise NepseValidationError(
+                f"Invalid user_agent_policy: {user_agent_policy}. "
+                f"Expected one of {', '.join(USER_AGENT_POLICIES)}.",
+                field="user_agent_policy",
+                value=user_agent_policy,
+            )
+        self.user_agent_policy = user_agent_policy
+        self._user_agent_counter = itertools.count(random.randrange(len(load_user_agents())))
+
+        # Response decoding
+        self.json_decoder_name, self._decode_json = get_json_decoder(json_decoder)
+        self.decode_stats = {"responses": 0, "bytes": 0, "seconds": 0.0}
+        self._decode_stats_lock = threading.Lock()
+
+        # Connection pooling
+        self.keep_alive = keep_alive
+        self.limits = limits
+
+        # Server clock estimate, shared by the managers below
+        self.clock = ServerClock()
+
         # Initialize managers
-        self.token_manager = token_manager_class(self)
+        self.token_manager = token_manager_class(self, token_store=token_store)
         self.dummy_id_manager = dummy_id_manager_class(
             market_status_function=self.getMarketStatus,
-            date_function=datetime.now,
+            date_function=self.clock.now,
         )
 
         # TLS verification flag
@@ -136,32 +265,83 @@ class _NepseBase:
         # Load configuration files
         self._load_configurations()
 
+        # Response caches, keyed by the endpoint names loaded above
+        self.response_cache = response_cache
+        if response_cache is not None:
+            response_cache.bind(self.api_end_points, self.clock)
+        self.history_cache = history_cache
+        if history_cache is not None:
+            history_cache.bind(self.api_end_points)
+        self.reference_cache = reference_cache
+
     def get_random_user_agent(self) -> str:
-        """Get random user agent.
+        """
+        Get a random user agent from the cached pool.
 
         Returns:
-            str: _description_
+            User-Agent string
         """
-        data_dir = pathlib.Path(__file__).parent / "data"
-        user_agents = cast(dict[str, Any], self._load_json_file(data_dir / "USER_AGENTS.json"))
-        user_agents = user_agents.get("USER_AGENTS", [])
-        return str(random.choice(user_agents))
+        return random.choice(load_user_agents())
 
-    def _load_configurations(self) -> None:
-        """Load API endpoints, dummy data, and headers from JSON files."""
-        data_dir = pathlib.Path(__file__).parent / "data"
+    def get_user_agent(self) -> str:
+        """
+        Get the User-Agent for the next request according to ``user_agent_policy``.
+
+        Returns:
+            User-Agent string
+        """
+        if self.user_agent_policy == "random":
+            return self.get_random_user_agent()
+        if self.user_agent_policy == "fixed":
+            return self.headers["User-Agent"]
+        user_agents = load_user_agents()
+        return user_agents[next(self._user_agent_counter) % len(user_agents)]
+
+    def _build_header_templates(self) -> None:
+        """
+        Prebuild the per-request header dicts from :attr:`headers`.
+
+        Requests copy a template and only fill in Authorization (and the
+        rotated User-Agent), so call this again after changing ``headers``.
+        """
+        self._header_template = dict(self.headers)
+        self._auth_header_template = {
+            "Authorization": "",
+            "Content-Type": "application/json",
+            **self.headers,
+        }
 
+    def build_headers(self, access_token: Optional[str] = None) -> dict[str, str]:
+        """
+        Build request headers from the prebuilt templates.
+
+        Args:
+            access_token: Access token for the Authorization header, or None
+                for unauthenticated requests
+
+        Returns:
+            Dictionary of HTTP headers
+        """
+        if access_token is None:
+            headers = self._header_template.copy()
+        else:
+            headers = self._auth_header_template.copy()
+            headers["Authorization"] = f"Salter {access_token}"
+        if self.user_agent_policy != "fixed":
+            headers["User-Agent"] = self.get_user_agent()
+        return headers
+
+    def _load_configurations(self) -> None:
+        """Load API endpoints, dummy data, and headers from JSON files (cached per process)."""
         try:
             # Load API endpoints
-            self.api_end_points = cast(
-                dict[str, str], self._load_json_file(data_dir / "API_ENDPOINTS.json")
-            )
+            self.api_end_points = dict(cast(dict[str, str], load_config_file("API_ENDPOINTS.json")))
 
             # Load dummy data
-            self.dummy_data = cast(list[int], self._load_json_file(data_dir / "DUMMY_DATA.json"))
+            self.dummy_data = list(cast(list[int], load_config_file("DUMMY_DATA.json")))
 
             # Load headers
-            headers_raw = self._load_json_file(data_dir / "HEADERS.json")
+            headers_raw = load_config_file("HEADERS.json")
             if not isinstance(headers_raw, dict):
                 raise NepseConfigurationError("HEADERS.json must contain a JSON object")
             self.headers = headers_raw.copy()
@@ -177,7 +357,9 @@ class _NepseBase:
         self.headers["Host"] = self.base_url.replace("https://", "")
         self.headers["Referer"] = self.base_url
         self.headers["User-Agent"] = self.get_random_user_agent()
-        time.sleep(random.uniform(0.1, 0.5))
+        if self.keep_alive:
+            self.headers["Connection"] = "keep-alive"
+        self._build_header_templates()
 
     @staticmethod
     def _load_json_file(filepath: pathlib.Path) -> Union[dict, list]:
@@ -235,35 +417,168 @@ class _NepseBase:
         """
         return int(self.dummy_id_manager.getDummyID())
 
-    def handle_response(self, response: Any, request_data: Optional[dict] = None) -> Any:
+    @staticmethod
+    def _takeNewFloorSheetRows(
+        page: list[dict[str, Any]], since_contract_id: int, seen: set[int]
+    ) -> tuple[list[dict[str, Any]], bool]:
         """
-        Process HTTP response and handle errors.
+        Select rows newer than a high-water mark from a floor sheet page.
+
+        Floor sheets are requested with ``sort=contractId,desc``, so once a row
+        at or below the mark is seen every later page is already known.
 
         Args:
-            response: HTTP response object
-            request_data: Optional request data for logging
+           page: Floor sheet records of one page
+           since_contract_id: Last contract ID the caller already has
+           seen: Contract IDs collected so far (rows shifting between pages
+              during trading hours are skipped)
 
         Returns:
-            Parsed response data
+           Tuple of (new rows, whether the mark was crossed)
+        """
+        new_rows: list[dict[str, Any]] = []
+        for row in page:
+            contract_id = int(row["contractId"])
+            if contract_id <= since_contract_id:
+                return new_rows, True
+            if contract_id not in seen:
+                seen.add(contract_id)
+                new_rows.append(row)
+        return new_rows, False
+
+    @staticmethod
+    def _incrementalFloorSheetResult(
+        rows: list[dict[str, Any]], since_contract_id: int
+    ) -> dict[str, Any]:
+        """
+        Build the result of an incremental floor sheet sync.
+
+        Args:
+           rows: New floor sheet records
+           since_contract_id: Previous high-water mark
+
+        Returns:
+           Dictionary with the new ``content`` and the new ``last_contract_id``
+        """
+        last_contract_id = max((int(row["contractId"]) for row in rows), default=since_contract_id)
+        return {"content": rows, "last_contract_id": last_contract_id}
+
+    def _observeServerDate(self, response: Any) -> None:
+        """Feed the ``Date`` header of a response to :attr:`clock`."""
+        if self.clock.samples:
+            return
+        date_header = response.headers.get("Date")
+        if not date_header:
+            return
+        received_at = time.time()
+        try:
+            sent_at = received_at - response.elapsed.total_seconds()
+        except (AttributeError, RuntimeError, TypeError):
+            sent_at = received_at
+        self.clock.observeDateHeader(date_header, sent_at, received_at)
+
+    def _decodeBody(self, content: bytes) -> Any:
+        """
+        Decode a response body with the configured JSON decoder.
+
+        Args:
+            content: Raw response body
+
+        Returns:
+            Decoded JSON data
 
         Raises:
-            NepseClientError: For 4xx errors
-            NepseAuthenticationError: For 401 errors
-            NepseBadGatewayError: For 502 errors
-            NepseServerError: For 5xx errors
-            NepseNetworkError: For unexpected errors
+            ValueError: If the body is not valid JSON
         """
-        self.logger.debug(
-            f"HTTP {response.request.method} {response.url} - Status: {response.status_code}"
-        )
+        start = time.perf_counter()
+        try:
+            return self._decode_json(content)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._decode_stats_lock:
+                self.decode_stats["responses"] += 1
+                self.decode_stats["bytes"] += len(content)
+                self.decode_stats["seconds"] += elapsed
+
+    def _cacheLookup(self, url: str, kind: Hashable) -> tuple[float, Any]:
+        """
+        Look up a response in :attr:`history_cache`, then :attr:`response_cache`.
+
+        Args:
+            url: API endpoint URL
+            kind: Request kind in the cache key: whether a GET carries
+                authorization headers, or ``"POST"``
 
-        # Parse response data
+        Returns:
+            Tuple of (TTL of the endpoint, decoded response or ``_MISSING``)
+        """
+        if self.history_cache is not None and self.history_cache.isImmutable(
+            url, self.clock.today()
+        ):
+            content = self.history_cache.get(self.history_cache.key(_method(kind), url))
+            if content is not None:
+                return 0.0, self._decodeCached(content)
+        if self.response_cache is None:
+            return 0.0, _MISSING
+        ttl = self.response_cache.ttl(url)
+        if ttl <= 0:
+            return ttl, _MISSING
+        content = self.response_cache.get((self.get_full_url(url), kind))
+        if content is None:
+            return ttl, _MISSING
+        return ttl, self._decodeCached(content)
+
+    def _decodeCached(self, content: bytes) -> Any:
+        """Decode a cached response body like :meth:`handle_response` does."""
         try:
-            data = response.json()
+            return self._decodeBody(content)
         except ValueError:
-            data = response.text.strip()
+            return content.decode("utf-8", errors="replace").strip()
+
+    def _cacheStore(self, url: str, kind: Hashable, response: Any, data: Any, ttl: float) -> None:
+        """Store a successful response in the caches that keep its endpoint."""
+        if self.history_cache is not None and self.history_cache.isImmutable(
+            url, self.clock.today()
+        ):
+            self.history_cache.put(self.history_cache.key(_method(kind), url), response.content)
+        if self.response_cache is None:
+            return
+        self.response_cache.observe(url, data)
+        if ttl > 0:
+            self.response_cache.put(
+                (self.get_full_url(url), kind),
+                response.content,
+                ttl,
+                endpoint=self.response_cache.endpoint(url),
+            )
 
-        # Prepare logging context
+    def _resetReferenceMaps(self) -> None:
+        """Drop the maps derived from the reference lists, so they are rebuilt on next use."""
+        self.company_symbol_id_keymap = None
+        self.security_symbol_id_keymap = None
+        self.sector_scrips = None
+
+    def _isReferenceStale(self, name: str) -> bool:
+        """Return whether a reference dataset is due for a refresh in :attr:`reference_cache`."""
+        if self.reference_cache is None:
+            return False
+        entry = self.reference_cache.get(name)
+        return entry is not None and self.reference_cache.isStale(entry)
+
+    def _buildLogContext(
+        self, response: Any, request_data: Optional[dict], data: Any
+    ) -> dict[str, Any]:
+        """
+        Build the ``extra`` logging context of a failed request.
+
+        Args:
+            response: HTTP response object
+            request_data: Optional request data
+            data: Parsed response data
+
+        Returns:
+            Logging context with sensitive values masked if enabled
+        """
         log_context = {
             "url": str(response.url),
             "method": response.request.method,
@@ -278,6 +593,37 @@ class _NepseBase:
             log_context["request_body"] = mask_sensitive_data(log_context["request_body"])
         if self.mask_request_data and isinstance(log_context["request_headers"], dict):
             log_context["request_headers"] = mask_sensitive_data(log_context["request_headers"])
+        return log_context
+
+    def handle_response(self, response: Any, request_data: Optional[dict] = None) -> Any:
+        """
+        Process HTTP response and handle errors.
+
+        Args:
+            response: HTTP response object
+            request_data: Optional request data for logging
+
+        Returns:
+            Parsed response data
+
+        Raises:
+            NepseClientError: For 4xx errors
+            NepseAuthenticationError: For 401 errors
+            NepseBadGatewayError: For 502 errors
+            NepseServerError: For 5xx errors
+            NepseNetworkError: For unexpected errors
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"HTTP {response.request.method} {response.url} - Status: {response.status_code}"
+            )
+        self._observeServerDate(response)
+
+        # Parse response data straight from the body bytes
+        try:
+            data = self._decodeBody(response.content)
+        except ValueError:
+            data = response.text.strip()
 
         # Handle response based on status code
         status_code = response.status_code
@@ -285,7 +631,10 @@ class _NepseBase:
         if 200 <= status_code < 300:
             return data
 
-        elif status_code == 400:
+        # Only failed requests are logged with their full context
+        log_context = self._buildLogContext(response, request_data, data)
+
+        if status_code == 400:
             msg = f"Client Error 400: {safe_serialize(data)}"
             self.logger.warning(msg, extra=log_context)
             raise NepseClientError(msg, status_code=status_code, response_data=data)
@@ -0,0 +1,117 @@
+"""
+Server clock tracking.
+
+This module estimates the offset between the local clock and the NEPSE
+server clock, so token expiry, business-date rollover and polling can be
+scheduled on server time even when the local host is skewed.
+"""
+
+import logging
+import threading
+import time as _time
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Nepal Standard Time (UTC+05:45), the exchange's time zone
+NEPAL_TZ = timezone(timedelta(hours=5, minutes=45), "NPT")
+
+
+class ServerClock:
+    """
+    Estimate of the NEPSE server clock.
+
+    Every sample is taken at the midpoint of the request round trip, which
+    bounds its error by half the RTT. Millisecond ``serverTime`` values
+    from token responses are blended into the offset with an exponentially
+    weighted moving average. The second-resolution ``Date`` response header
+    is only used until the first such sample arrives.
+
+    Args:
+       tz: Time zone of the exchange, used for :meth:`now` and :meth:`today`
+       smoothing: Weight of each new sample in the moving average (0-1]
+
+    Example:
+       >>> client.clock.offset
+       -1.82
+       >>> client.clock.today()
+       datetime.date(2024, 1, 15)
+    """
+
+    def __init__(self, tz: timezone = NEPAL_TZ, smoothing: float = 0.25):
+        """Initialize clock with no offset."""
+        self.tz = tz
+        self.smoothing = smoothing
+        self.offset = 0.0
+        self.rtt: Optional[float] = None
+        self.samples = 0
+        self._lock = threading.Lock()
+
+    def observe(self, server_time: float, sent_at: float, received_at: float) -> None:
+        """
+        Record a precise server timestamp.
+
+        Args:
+           server_time: Server time (epoch seconds) reported in the response
+           sent_at: Local time the request was sent
+           received_at: Local time the response was received
+        """
+        sample = server_time - (sent_at + received_at) / 2
+        with self._lock:
+            if self.samples == 0:
+                self.offset = sample
+            else:
+                self.offset += self.smoothing * (sample - self.offset)
+            self.rtt = received_at - sent_at
+            self.samples += 1
+        logger.debug(f"Server clock offset {self.offset:+.3f}s (sample {sample:+.3f}s)")
+
+    def observeDateHeader(self, value: str, sent_at: float, received_at: float) -> None:
+        """
+        Record an HTTP ``Date`` header, while no precise sample is available.
+
+        Args:
+           value: ``Date`` header value
+           sent_at: Local time the request was sent
+           received_at: Local time the response was received
+        """
+        if self.samples:
+            return
+        try:
+            server_time = parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            return
+        # The header is truncated to the second
+        with self._lock:
+            self.offset = server_time + 0.5 - (sent_at + received_at) / 2
+
+    def time(self) -> float:
+        """Return the estimated server time in epoch seconds."""
+        return _time.time() + self.offset
+
+    def now(self) -> datetime:
+        """Return the estimated server time as a naive datetime in the exchange time zone."""
+        return datetime.fromtimestamp(self.time(), self.tz).replace(tzinfo=None)
+
+    def today(self) -> date:
+        """Return the current business calendar date at the exchange."""
+        return self.now().date()
+
+    def secondsUntil(self, server_time: float) -> float:
+        """
+        Return the local delay until a server timestamp, for scheduling polls.
+
+        Args:
+           server_time: Target server time in epoch seconds
+        """
+        return server_time - self.time()
+
+    def __repr__(self) -> str:
+        """Return the string representation of the clock."""
+        return f"ServerClock(offset={self.offset:+.3f}s, samples={self.samples})"
+
+
+__all__ = ["NEPAL_TZ", "ServerClock"]
@@ -115,6 +115,9 @@ class NepseAuthenticationError(NepseError):
        as the client manages token refresh automatically.
     """
 
+    # Token snapshot the rejected request was sent with, set by the token manager
+    rejected_token: Optional[Any] = None
+
     def __init__(
         self,
         message: str = "Authentication token expired",
@@ -0,0 +1,386 @@
+"""
+Floor sheet helpers.
+
+This module provides storage helpers used by the clients when downloading
+a full day's floor sheet, such as on-disk checkpoints for resumable downloads
+and a compact columnar representation of the records.
+"""
+
+import json
+import logging
+import os
+import pathlib
+import shutil
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional, Union
+
+from .exceptions import NepseValidationError
+
+
+logger = logging.getLogger(__name__)
+
+
+class FloorSheetCheckpoint:
+    """
+    On-disk checkpoint of the floor sheet pages downloaded for a business date.
+
+    Every completed page is written to ``<directory>/<business_date>/`` as
+    its own JSON file, so an interrupted download can be resumed by fetching
+    only the pages that are missing.
+
+    Args:
+       directory: Root checkpoint directory
+       business_date: Business date (YYYY-MM-DD) the pages belong to
+
+    Example:
+       >>> checkpoint = FloorSheetCheckpoint("checkpoints", "2024-01-15")
+       >>> checkpoint.start(total_pages=600)
+       >>> checkpoint.missing_pages()
+       [0, 1, 2, ...]
+    """
+
+    META_FILE = "meta.json"
+
+    def __init__(self, directory: Union[str, os.PathLike], business_date: str):
+        """Initialize checkpoint for a business date."""
+        self.business_date = str(business_date)
+        self.path = pathlib.Path(directory) / self.business_date
+        self.total_pages: Optional[int] = None
+        self.fingerprint: dict[str, Any] = {}
+
+        meta_path = self.path / self.META_FILE
+        if meta_path.exists():
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            self.total_pages = int(meta["totalPages"])
+            self.fingerprint = meta.get("fingerprint", {})
+
+    def start(self, total_pages: int, fingerprint: Optional[dict[str, Any]] = None) -> None:
+        """
+        Prepare the checkpoint for a download of ``total_pages`` pages.
+
+        Pages saved by an earlier run are kept if the page count and the
+        fingerprint are unchanged. Otherwise the sheet has changed since
+        (e.g. trading was still live) and the stale pages are discarded.
+
+        Args:
+           total_pages: Total number of pages reported by the API
+           fingerprint: Values identifying the sheet, such as the first
+              contract ID and the total number of records
+        """
+        fingerprint = fingerprint or {}
+        if self.total_pages is not None and (
+            self.total_pages != total_pages or self.fingerprint != fingerprint
+        ):
+            logger.warning(
+                f"Floor sheet for {self.business_date} changed from {self.total_pages} pages "
+                f"{self.fingerprint} to {total_pages} pages {fingerprint}, discarding checkpoint"
+            )
+            self.clear()
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._write_json(
+            self.path / self.META_FILE, {"totalPages": total_pages, "fingerprint": fingerprint}
+        )
+        self.total_pages = total_pages
+        self.fingerprint = fingerprint
+
+    def _page_path(self, page_number: int) -> pathlib.Path:
+        return self.path / f"page_{page_number:05d}.json"
+
+    @staticmethod
+    def _write_json(path: pathlib.Path, data: Any) -> None:
+        """Write JSON atomically so a crash never leaves a partial page behind."""
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def save_page(self, page_number: int, rows: list[dict[str, Any]]) -> None:
+        """
+        Save a downloaded page.
+
+        Args:
+           page_number: Page number (0-indexed)
+           rows: Floor sheet records of the page
+        """
+        self._write_json(self._page_path(page_number), rows)
+
+    def load_page(self, page_number: int) -> list[dict[str, Any]]:
+        """
+        Load a saved page.
+
+        Args:
+           page_number: Page number (0-indexed)
+
+        Returns:
+           Floor sheet records of the page
+        """
+        with open(self._page_path(page_number), encoding="utf-8") as f:
+            rows: list[dict[str, Any]] = json.load(f)
+        return rows
+
+    def completed_pages(self) -> set[int]:
+        """Return the page numbers already saved."""
+        if not self.path.exists():
+            return set()
+        return {int(path.stem.split("_")[1]) for path in self.path.glob("page_*.json")}
+
+    def missing_pages(self) -> list[int]:
+        """Return the page numbers still to be downloaded, in order."""
+        if self.total_pages is None:
+            raise NepseValidationError("Checkpoint has not been started", field="total_pages")
+        completed = self.completed_pages()
+        return [page for page in range(self.total_pages) if page not in completed]
+
+    def is_complete(self) -> bool:
+        """Return True if every page has been saved."""
+        return self.total_pages is not None and not self.missing_pages()
+
+    def iter_pages(self) -> Iterator[list[dict[str, Any]]]:
+        """
+        Reassemble the day by reading the saved pages in order.
+
+        Yields:
+           Floor sheet records of each page
+        """
+        if not self.is_complete():
+            raise NepseValidationError(
+                f"Checkpoint for {self.business_date} is incomplete", field="business_date"
+            )
+        assert self.total_pages is not None
+        for page_number in range(self.total_pages):
+            yield self.load_page(page_number)
+
+    def clear(self) -> None:
+        """Delete the checkpoint from disk."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.total_pages = None
+        self.fingerprint = {}
+
+    def __repr__(self) -> str:
+        """Return the string representation of the checkpoint."""
+        if self.total_pages is None:
+            return f"FloorSheetCheckpoint({self.business_date}: Not Started)"
+        done = len(self.completed_pages())
+        return f"FloorSheetCheckpoint({self.business_date}: {done}/{self.total_pages} pages)"
+
+
+# Low-cardinality string fields shared by many trades
+INTERNED_FIELDS = frozenset(
+    {
+        "stockSymbol",
+        "securityName",
+        "buyerMemberId",
+        "sellerMemberId",
+        "buyerBrokerName",
+        "sellerBrokerName",
+        "businessDate",
+        "contractType",
+    }
+)
+
+Column = Union["array[Any]", list[Any]]
+
+
+class FloorSheetColumns:
+    """
+    Column-oriented floor sheet records.
+
+    Instead of one dict per trade, every field is stored once as a column:
+    integers in an ``array('q')``, floats in an ``array('d')`` and everything
+    else in a list, with symbol, broker and date strings interned so each
+    distinct value is kept in memory only once. A numeric column that meets
+    a ``None`` or a value of another type falls back to a list.
+
+    Numeric columns expose the buffer protocol, so :meth:`to_numpy`,
+    :meth:`to_pandas` and :meth:`to_arrow` wrap them without copying.
+
+    Example:
+       >>> columns = client.getFloorSheet(columnar=True)
+       >>> len(columns)
+       120000
+       >>> sum(columns["contractAmount"])
+       5000000000.0
+       >>> df = columns.to_pandas()
+    """
+
+    def __init__(self, rows: Iterable[dict[str, Any]] = ()):
+        """Initialize columns, optionally from an iterable of records."""
+        self.columns: dict[str, Column] = {}
+        self._length = 0
+        self.extend(rows)
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[list[dict[str, Any]]]) -> "FloorSheetColumns":
+        """
+        Build columns from floor sheet pages, one page at a time.
+
+        Args:
+           pages: Iterable of floor sheet pages
+
+        Returns:
+           Columnar floor sheet
+        """
+        columns = cls()
+        for page in pages:
+            columns.extend(page)
+        return columns
+
+    @staticmethod
+    def _new_column(value: Any) -> Column:
+        if type(value) is int:
+            return array("q")
+        if type(value) is float:
+            return array("d")
+        return []
+
+    def append(self, row: dict[str, Any]) -> None:
+        """
+        Append a single record.
+
+        Args:
+           row: Floor sheet record
+        """
+        for key in row.keys() - self.columns.keys():
+            # Field first seen on this row: earlier rows did not have it
+            self.columns[key] = (
+                self._new_column(row[key]) if self._length == 0 else [None] * self._length
+            )
+
+        for key, column in self.columns.items():
+            value: Any = row.get(key)
+            if type(value) is str and key in INTERNED_FIELDS:
+                value = sys.intern(value)
+            if isinstance(column, list):
+                column.append(value)
+                continue
+            try:
+                if column.typecode == "d" and type(value) is int:
+                    value = float(value)
+                elif column.typecode == "q" and type(value) is float:
+                    column = self.columns[key] = array("d", column)
+                column.append(value)
+            except (TypeError, OverflowError):
+                self.columns[key] = list(column) + [value]
+
+        self._length += 1
+
+    def extend(self, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Append several records.
+
+        Args:
+           rows: Floor sheet records
+        """
+        for row in rows:
+            self.append(row)
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return self._length
+
+    def __getitem__(self, key: str) -> Column:
+        """Return the column for a field."""
+        return self.columns[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the field is present."""
+        return key in self.columns
+
+    def keys(self) -> list[str]:
+        """Return the field names."""
+        return list(self.columns)
+
+    def row(self, index: int) -> dict[str, Any]:
+        """
+        Rebuild a single record as a dict.
+
+        Args:
+           index: Row index
+
+        Returns:
+           Floor sheet record
+        """
+        return {key: column[index] for key, column in self.columns.items()}
+
+    def to_rows(self) -> list[dict[str, Any]]:
+        """Rebuild the records as a list of dicts."""
+        return [self.row(index) for index in range(self._length)]
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        Convert to NumPy arrays.
+
+        Numeric columns are zero-copy views of the underlying buffers; other
+        columns become ``object`` arrays.
+
+        Returns:
+           Mapping of field name to ``numpy.ndarray``
+
+        Raises:
+           ImportError: If NumPy is not installed
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("to_numpy() requires numpy: pip install numpy") from e
+
+        result = {}
+        for key, column in self.columns.items():
+            if isinstance(column, array):
+                dtype = np.int64 if column.typecode == "q" else np.float64
+                result[key] = np.frombuffer(column, dtype=dtype)
+            else:
+                values = np.empty(len(column), dtype=object)
+                values[:] = column
+                result[key] = values
+        return result
+
+    def to_pandas(self) -> Any:
+        """
+        Convert to a ``pandas.DataFrame`` built on :meth:`to_numpy`.
+
+        Raises:
+           ImportError: If pandas is not installed
+        """
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("to_pandas() requires pandas: pip install pandas") from e
+
+        return pd.DataFrame(self.to_numpy(), copy=False)
+
+    def to_arrow(self) -> Any:
+        """
+        Convert to a ``pyarrow.Table``.
+
+        Numeric columns are wrapped without copying their buffers.
+
+        Raises:
+           ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("to_arrow() requires pyarrow: pip install pyarrow") from e
+
+        arrays = {}
+        for key, column in self.columns.items():
+            if isinstance(column, array):
+                arrow_type = pa.int64() if column.typecode == "q" else pa.float64()
+                arrays[key] = pa.Array.from_buffers(
+                    arrow_type, len(column), [None, pa.py_buffer(column)]
+                )
+            else:
+                arrays[key] = pa.array(column)
+        return pa.table(arrays)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the columns."""
+        return f"FloorSheetColumns({self._length} rows, {len(self.columns)} columns)"
+
+
+__all__ = ["FloorSheetCheckpoint", "FloorSheetColumns"]
@@ -0,0 +1,213 @@
+"""
+Persistent cache of historical responses.
+
+This module provides :class:`HistoryCache`, a SQLite-backed store of API
+responses for past business dates. Those never change, so once fetched they
+are served from disk by every later process.
+"""
+
+import hashlib
+import logging
+import os
+import pathlib
+import sqlite3
+import threading
+import zlib
+from datetime import date
+from typing import Optional, Union
+from urllib.parse import parse_qs, urlsplit
+
+from .cache import EndpointTable
+
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryCache:
+    """
+    Content-addressed, persistent cache of immutable API responses.
+
+    A request is immutable when it asks for a business date (or a date range
+    ending) before the current exchange date, e.g. ``getPriceVolumeHistory``,
+    ``getFloorSheetOf`` or ``getTradingAverage`` with a past ``business_date``
+    and ``getCompanyPriceVolumeHistory`` with a past ``end_date``. Bodies are
+    stored zlib-compressed under their SHA-256 digest, and requests map to
+    digests, so identical bodies (such as the empty results of holidays) are
+    stored once. SQLite in WAL mode lets several processes share the file.
+
+    Args:
+       path: SQLite database file
+       compression_level: zlib compression level (0-9)
+       timeout: Seconds to wait for another process holding the database lock
+
+    Example:
+       >>> history = HistoryCache("nepse-history.sqlite3")
+       >>> client = NepseClient(history_cache=history)
+       >>> client.getPriceVolumeHistory(business_date="2024-01-15")  # network
+       >>> client.getPriceVolumeHistory(business_date="2024-01-15")  # disk
+    """
+
+    # Endpoint name -> query parameter holding the (last) business date
+    IMMUTABLE_ENDPOINTS: dict[str, str] = {
+        "todays_price": "businessDate",
+        "company_floorsheet": "businessDate",
+        "trading-average": "businessDate",
+        "company_price_volume_history": "endDate",
+    }
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS blobs ("
+        "digest TEXT PRIMARY KEY, content BLOB NOT NULL, size INTEGER NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "request TEXT PRIMARY KEY, digest TEXT NOT NULL REFERENCES blobs(digest))",
+    )
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        compression_level: int = 6,
+        timeout: float = 30.0,
+    ):
+        """Open (or create) the cache database."""
+        self.path = pathlib.Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.compression_level = compression_level
+        self.endpoints = EndpointTable()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+        self._connection = sqlite3.connect(
+            str(self.path), timeout=timeout, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        for statement in self.SCHEMA:
+            self._connection.execute(statement)
+
+    def bind(self, api_end_points: dict[str, str]) -> None:
+        """
+        Set the endpoint table used to recognize immutable requests.
+
+        Args:
+           api_end_points: Endpoint name -> URL path, as in ``API_ENDPOINTS.json``
+        """
+        self.endpoints = EndpointTable(api_end_points)
+
+    def isImmutable(self, url: str, today: date) -> bool:
+        """
+        Return whether the response of an API URL can never change.
+
+        Args:
+           url: API URL path with its query string
+           today: Current business calendar date at the exchange
+
+        Returns:
+           True if the URL asks for a date before ``today``
+        """
+        parameter = self.IMMUTABLE_ENDPOINTS.get(self.endpoints.name(url) or "")
+        if parameter is None:
+            return False
+        values = parse_qs(urlsplit(url).query).get(parameter)
+        if not values:
+            return False
+        try:
+            return date.fromisoformat(values[0][:10]) < today
+        except ValueError:
+            return False
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        """Return the cache key of a request: method and API URL path with its query string."""
+        return f"{method} {url}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return a stored response body.
+
+        Args:
+           key: Request key (see :meth:`key`)
+
+        Returns:
+           Raw response body, or None on a miss
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT blobs.content FROM responses JOIN blobs USING (digest) "
+                "WHERE responses.request = ?",
+                (key,),
+            ).fetchone()
+            self._stats["hits" if row else "misses"] += 1
+        return zlib.decompress(row[0]) if row else None
+
+    def put(self, key: str, content: bytes) -> None:
+        """
+        Store a response body.
+
+        Args:
+           key: Request key (see :meth:`key`)
+           content: Raw response body
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        compressed = zlib.compress(content, self.compression_level)
+        with self._lock:
+            try:
+                with self._connection:
+                    self._connection.execute("BEGIN IMMEDIATE")
+                    self._connection.execute(
+                        "INSERT OR IGNORE INTO blobs (digest, content, size) VALUES (?, ?, ?)",
+                        (digest, compressed, len(content)),
+                    )
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO responses (request, digest) VALUES (?, ?)",
+                        (key, digest),
+                    )
+            except sqlite3.Error as e:
+                # A read-only or locked database only costs the cache
+                logger.warning(f"Failed to store {key} in {self.path}: {e}")
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether a request is stored."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM responses WHERE request = ?", (key,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        """Return the number of stored requests."""
+        with self._lock:
+            return int(self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters of this process and the number and size of stored bodies."""
+        with self._lock:
+            requests = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            blobs, size, stored = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(content)), 0) "
+                "FROM blobs"
+            ).fetchone()
+            return {
+                **self._stats,
+                "requests": requests,
+                "blobs": blobs,
+                "bytes": size,
+                "stored_bytes": stored,
+            }
+
+    def clear(self) -> None:
+        """Remove every stored response."""
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._connection.execute("DELETE FROM responses")
+            self._connection.execute("DELETE FROM blobs")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __repr__(self) -> str:
+        """Return the string representation of the cache."""
+        return f"HistoryCache(path={str(self.path)!r})"
+
+
+__all__ = ["HistoryCache"]
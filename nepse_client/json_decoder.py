@@ -0,0 +1,95 @@
+"""
+JSON decoding backends.
+
+This module picks the function used to decode API responses. orjson and
+msgspec are used when installed because large floor sheet and price pages
+make decoding the dominant CPU cost of bulk downloads; the standard library
+is the fallback. Every backend decodes the raw response bytes directly and
+raises :class:`ValueError` for invalid JSON.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any, Optional, Union, cast
+
+from .exceptions import NepseValidationError
+
+
+JSONDecoder = Callable[[bytes], Any]
+
+# Backends tried, in order, when none is requested
+JSON_DECODERS = ("orjson", "msgspec", "json")
+
+
+def _orjson_decoder() -> JSONDecoder:
+    import orjson
+
+    # orjson.JSONDecodeError is a ValueError subclass
+    return cast(JSONDecoder, orjson.loads)
+
+
+def _msgspec_decoder() -> JSONDecoder:
+    import msgspec
+
+    decode = msgspec.json.Decoder().decode
+
+    def loads(content: bytes) -> Any:
+        try:
+            return decode(content)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return loads
+
+
+def _stdlib_decoder() -> JSONDecoder:
+    # json.loads detects the encoding of bytes input itself
+    return json.loads
+
+
+_FACTORIES = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": _stdlib_decoder,
+}
+
+
+def get_json_decoder(
+    decoder: Optional[Union[str, JSONDecoder]] = None,
+) -> tuple[str, JSONDecoder]:
+    """
+    Resolve a JSON decoder.
+
+    Args:
+       decoder: Backend name (``"orjson"``, ``"msgspec"`` or ``"json"``), a
+          callable taking the response bytes, or None for the fastest
+          installed backend
+
+    Returns:
+       Tuple of (backend name, decode function)
+
+    Raises:
+       NepseValidationError: If the backend name is unknown
+       ImportError: If the requested backend is not installed
+    """
+    if callable(decoder):
+        return getattr(decoder, "__name__", "custom"), decoder
+    if decoder is None:
+        for name in JSON_DECODERS:
+            try:
+                return name, _FACTORIES[name]()
+            except ImportError:
+                continue
+    if decoder not in _FACTORIES:
+        raise NepseValidationError(
+            f"Unknown JSON decoder: {decoder}. Expected one of {', '.join(JSON_DECODERS)}.",
+            field="json_decoder",
+            value=decoder,
+        )
+    try:
+        return decoder, _FACTORIES[decoder]()
+    except ImportError as e:
+        raise ImportError(f"JSON decoder {decoder!r} requires: pip install {decoder}") from e
+
+
+__all__ = ["JSON_DECODERS", "JSONDecoder", "get_json_decoder"]
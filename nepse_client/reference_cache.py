@@ -0,0 +1,173 @@
+"""
+Persistent reference data.
+
+This module provides :class:`ReferenceCache`, a directory of JSON files
+holding the company, security and holiday lists, so a new client process
+starts from local disk instead of downloading them again.
+"""
+
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple, Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReferenceEntry(NamedTuple):
+    """Stored reference data and the time (epoch seconds) it was fetched."""
+
+    data: Any
+    fetched_at: float
+
+
+class ReferenceCache:
+    """
+    On-disk cache of slowly changing reference data.
+
+    Every dataset (``company_list``, ``security_list``, ``holiday_list_<year>``)
+    is kept as ``<directory>/<name>.json`` and replaced atomically, so
+    processes on one host can share the directory. Once read, an entry is
+    served from memory.
+
+    Entries older than ``refresh_interval`` are still served, while clients
+    fetch a fresh copy in the background (or before returning, without
+    ``background_refresh``). When it arrives, clients rebuild the symbol and
+    sector maps derived from the lists, which picks up new listings. After a
+    failed refresh, the next one starts no earlier than ``retry_delay``
+    seconds later.
+
+    Args:
+       directory: Directory holding the JSON files
+       refresh_interval: Seconds after which an entry is refreshed
+       background_refresh: Refresh stale entries without blocking the caller
+       time_function: Wall clock used for the entry age
+       retry_delay: Seconds to wait after a failed refresh before retrying
+          (at most ``refresh_interval``)
+
+    Example:
+       >>> reference = ReferenceCache("~/.cache/nepse/reference", refresh_interval=6 * 3600)
+       >>> client = NepseClient(reference_cache=reference)
+       >>> client.getCompanyDetails("NABIL")  # security list read from disk
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        refresh_interval: float = 86400.0,
+        background_refresh: bool = True,
+        time_function: Callable[[], float] = time.time,
+        retry_delay: float = 300.0,
+    ):
+        """Initialize reference cache."""
+        self.path = pathlib.Path(directory).expanduser()
+        self.refresh_interval = refresh_interval
+        self.background_refresh = background_refresh
+        self.time_function = time_function
+        self.retry_delay = retry_delay
+        self._entries: dict[str, ReferenceEntry] = {}
+        self._refreshing: set[str] = set()
+        self._retry_after: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _file(self, name: str) -> pathlib.Path:
+        return self.path / f"{name}.json"
+
+    def get(self, name: str) -> Optional[ReferenceEntry]:
+        """
+        Return a stored dataset, reading it from disk on first use.
+
+        Args:
+           name: Dataset name
+
+        Returns:
+           Stored entry, or None if nothing (readable) is stored
+        """
+        entry = self._entries.get(name)
+        if entry is not None:
+            return entry
+        try:
+            with open(self._file(name), encoding="utf-8") as f:
+                stored = json.load(f)
+            entry = ReferenceEntry(stored["data"], float(stored["fetched_at"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        with self._lock:
+            return self._entries.setdefault(name, entry)
+
+    def put(self, name: str, data: Any) -> None:
+        """
+        Store a freshly fetched dataset atomically.
+
+        Args:
+           name: Dataset name
+           data: Decoded API response
+        """
+        entry = ReferenceEntry(data, self.time_function())
+        with self._lock:
+            self._entries[name] = entry
+        path = self._file(name)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": entry.fetched_at, "data": data}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to store reference data {path}: {e}")
+
+    def isStale(self, entry: ReferenceEntry) -> bool:
+        """Return whether an entry is older than ``refresh_interval``."""
+        return self.time_function() - entry.fetched_at >= self.refresh_interval
+
+    def claimRefresh(self, name: str) -> bool:
+        """
+        Mark a dataset as being refreshed.
+
+        Returns:
+           False if a refresh of the dataset is already running, or the last
+           one failed less than ``retry_delay`` ago
+        """
+        with self._lock:
+            if name in self._refreshing:
+                return False
+            if self.time_function() < self._retry_after.get(name, float("-inf")):
+                return False
+            self._refreshing.add(name)
+            return True
+
+    def releaseRefresh(self, name: str, failed: bool = False) -> None:
+        """
+        Mark the refresh of a dataset as finished.
+
+        Args:
+           name: Dataset name
+           failed: The refresh failed, so postpone the next one
+        """
+        with self._lock:
+            self._refreshing.discard(name)
+            if failed:
+                delay = min(self.retry_delay, self.refresh_interval)
+                self._retry_after[name] = self.time_function() + delay
+            else:
+                self._retry_after.pop(name, None)
+
+    def clear(self) -> None:
+        """Remove every stored dataset."""
+        with self._lock:
+            self._entries.clear()
+            self._retry_after.clear()
+        for path in self.path.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the cache."""
+        return f"ReferenceCache(path={str(self.path)!r}, refresh_interval={self.refresh_interval})"
+
+
+__all__ = ["ReferenceCache", "ReferenceEntry"]
@@ -6,22 +6,39 @@ suitable for scripts, notebooks, and applications that don't require concurrency
 """
 
 import logging
-from collections import defaultdict
+import os
+import threading
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from itertools import islice
 from typing import Any, Optional, Union, cast
 
 import httpx
-import tqdm
 
-from .client import _NepseBase
+from .cache import ResponseCache
+from .client import _MISSING, DEFAULT_POOL_LIMITS, _NepseBase, get_ssl_context
 from .dummy_id_manager import DummyIDManager
 from .exceptions import NepseAuthenticationError, NepseNetworkError, NepseValidationError
+from .floorsheet import FloorSheetCheckpoint, FloorSheetColumns
+from .history_cache import HistoryCache
+from .json_decoder import JSONDecoder
+from .reference_cache import ReferenceCache
 from .token_manager import TokenManager
+from .token_store import FileTokenStore
 
 
 logger = logging.getLogger(__name__)
 
 
+def _progress_bar(**kwargs: Any) -> Any:
+    """Create a tqdm progress bar, importing tqdm only when progress is shown."""
+    import tqdm
+
+    return tqdm.tqdm(**kwargs)
+
+
 class NepseClient(_NepseBase):
     """
     Synchronous client for NEPSE API.
@@ -33,6 +50,27 @@ class NepseClient(_NepseBase):
        logger: Optional custom logger instance
        mask_request_data: Whether to mask sensitive data in logs (default: True)
        timeout: Request timeout in seconds (default: 100.0)
+       keep_alive: Keep connections open and reuse them across requests
+          instead of sending ``Connection: close`` (default: False)
+       limits: Optional ``httpx.Limits`` controlling the connection pool
+          (max connections, keep-alive connections and keep-alive expiry).
+          NEPSE is served from a single origin, so these limits also act as
+          the per-host limits.
+       token_store: Optional :class:`~nepse_client.FileTokenStore` shared by
+          several client processes, so a token fetched by one is reused by
+          the others instead of every process authenticating separately
+       user_agent_policy: How requests pick their User-Agent from the bundled
+          pool: ``"random"`` (default), ``"round_robin"`` or ``"fixed"``
+       json_decoder: Backend used to decode responses: ``"orjson"``,
+          ``"msgspec"``, ``"json"`` or a callable taking the body bytes.
+          Defaults to the fastest one installed.
+       response_cache: Optional :class:`~nepse_client.ResponseCache` reusing
+          API responses for a per-endpoint TTL; may be shared by clients
+       history_cache: Optional :class:`~nepse_client.HistoryCache` keeping
+          responses for past business dates on disk, across processes
+       reference_cache: Optional :class:`~nepse_client.ReferenceCache` loading
+          the company, security and holiday lists from disk, refreshed in
+          the background once older than its ``refresh_interval``
 
     Example:
        Basic usage::
@@ -54,11 +92,21 @@ class NepseClient(_NepseBase):
        token expiration transparently.
     """
 
+    client: httpx.Client
+
     def __init__(
         self,
         logger: Optional[logging.Logger] = None,
         mask_request_data: bool = True,
         timeout: float = 100.0,
+        keep_alive: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        token_store: Optional[FileTokenStore] = None,
+        user_agent_policy: str = "random",
+        json_decoder: Optional[Union[str, JSONDecoder]] = None,
+        response_cache: Optional[ResponseCache] = None,
+        history_cache: Optional[HistoryCache] = None,
+        reference_cache: Optional[ReferenceCache] = None,
     ):
         """Initialize synchronous NEPSE client."""
         super().__init__(
@@ -67,6 +115,14 @@ class NepseClient(_NepseBase):
             logger=logger,
             mask_request_data=mask_request_data,
             timeout=timeout,
+            keep_alive=keep_alive,
+            limits=limits,
+            token_store=token_store,
+            user_agent_policy=user_agent_policy,
+            json_decoder=json_decoder,
+            response_cache=response_cache,
+            history_cache=history_cache,
+            reference_cache=reference_cache,
         )
         self.init_client(tls_verify=self._tls_verify)
 
@@ -77,11 +133,16 @@ class NepseClient(_NepseBase):
         Args:
            tls_verify: Whether to verify TLS certificates
         """
+        # Release pooled connections held by a previous client
+        if hasattr(self, "client"):
+            self.client.close()
+
         self.client = httpx.Client(
-            verify=tls_verify,
+            verify=get_ssl_context(http2=True) if tls_verify else False,
             http2=True,
             timeout=self.timeout,
             follow_redirects=True,
+            limits=self.limits or DEFAULT_POOL_LIMITS,
         )
         self.logger.debug(f"HTTP client initialized (TLS verify: {tls_verify})")
 
@@ -95,6 +156,7 @@ class NepseClient(_NepseBase):
 
     def close(self) -> None:
         """Close HTTP client and cleanup resources."""
+        self.token_manager.stopBackgroundRefresh()
         if hasattr(self, "client"):
             self.client.close()
             self.logger.debug("HTTP client closed")
@@ -132,9 +194,9 @@ class NepseClient(_NepseBase):
                 self.logger.warning(
                     f"Request failed (attempt {attempt + 1}/{max_retries}), retrying..."
                 )
-            except NepseAuthenticationError:
+            except NepseAuthenticationError as e:
                 self.logger.info("Token expired, refreshing...")
-                self.token_manager.update()
+                self.token_manager.renewRejected(e.rejected_token)
                 # Retry immediately after token refresh
                 return request_func(*args, **kwargs)
 
@@ -165,18 +227,26 @@ class NepseClient(_NepseBase):
         Returns:
            Parsed response data
         """
+        ttl, cached = self._cacheLookup(url, include_authorization_headers)
+        if cached is not _MISSING:
+            return cached
 
         def _make_request():
-            headers = (
-                self.getAuthorizationHeaders()
-                if include_authorization_headers
-                else {**self.headers, "User-Agent": self.get_random_user_agent()}
-            )
-            response = self.client.get(
-                self.get_full_url(api_url=url),
-                headers=headers,
-            )
-            return self.handle_response(response)
+            if not include_authorization_headers:
+                response = self.client.get(
+                    self.get_full_url(api_url=url),
+                    headers=self.build_headers(),
+                )
+                data = self.handle_response(response)
+            else:
+                with self.token_manager.pinned():
+                    response = self.client.get(
+                        self.get_full_url(api_url=url),
+                        headers=self.getAuthorizationHeaders(),
+                    )
+                    data = self.handle_response(response)
+            self._cacheStore(url, include_authorization_headers, response, data, ttl)
+            return data
 
         return self._retry_request(_make_request)
 
@@ -191,16 +261,24 @@ class NepseClient(_NepseBase):
         Returns:
            Parsed response data
         """
+        # The payload only proves the token, so the URL identifies the response
+        ttl, cached = self._cacheLookup(url, "POST")
+        if cached is not _MISSING:
+            return cached
 
         def _make_request():
-            payload = {"id": payload_generator()}
-            response = self.client.post(
-                self.get_full_url(api_url=url),
-                headers=self.getAuthorizationHeaders(),
-                json=payload,
-                # data=payload,
-            )
-            return self.handle_response(response, request_data=payload)
+            # Payload salts and Authorization header must come from the same token
+            with self.token_manager.pinned():
+                payload = {"id": payload_generator()}
+                response = self.client.post(
+                    self.get_full_url(api_url=url),
+                    headers=self.getAuthorizationHeaders(),
+                    json=payload,
+                    # data=payload,
+                )
+                data = self.handle_response(response, request_data=payload)
+            self._cacheStore(url, "POST", response, data, ttl)
+            return data
 
         return self._retry_request(_make_request)
 
@@ -211,20 +289,14 @@ class NepseClient(_NepseBase):
         Returns:
            Dictionary of HTTP headers
         """
-        access_token = self.token_manager.getAccessToken()
-        return {
-            "Authorization": f"Salter {access_token}",
-            "Content-Type": "application/json",
-            **self.headers,
-            "User-Agent": self.get_random_user_agent(),
-        }
+        return self.build_headers(self.token_manager.getAccessToken())
 
     # Payload ID generators
 
     def getPOSTPayloadIDForScrips(self) -> int:
         """Generate payload ID for scrip-related requests."""
         dummy_id = self.getDummyID()
-        return self.getDummyData()[dummy_id] + dummy_id + 2 * date.today().day
+        return self.getDummyData()[dummy_id] + dummy_id + 2 * self.clock.today().day
 
     def getPOSTPayloadID(self) -> int:
         """Generate general payload ID."""
@@ -232,7 +304,7 @@ class NepseClient(_NepseBase):
         salt_index = 3 if e % 10 < 5 else 1
         return int(
             e
-            + self.token_manager.salts[salt_index] * date.today().day
+            + self.token_manager.salts[salt_index] * self.clock.today().day
             - self.token_manager.salts[salt_index - 1]
         )
 
@@ -252,7 +324,7 @@ class NepseClient(_NepseBase):
 
         # Parse business_date
         if business_date is None:
-            day = date.today().day
+            day = self.clock.today().day
         elif isinstance(business_date, (date, datetime)):
             day = business_date.day
         else:
@@ -275,6 +347,53 @@ class NepseClient(_NepseBase):
 
     # Company and Security data methods
 
+    def _referenceData(self, name: str, url: str) -> Any:
+        """
+        Get a reference dataset from :attr:`reference_cache`, or the API.
+
+        Stale datasets are returned as stored while a background thread
+        fetches a fresh copy (see :class:`~nepse_client.ReferenceCache`).
+
+        Args:
+           name: Dataset name in the reference cache
+           url: API endpoint URL of the dataset
+
+        Returns:
+           Parsed response data
+        """
+        cache = self.reference_cache
+        if cache is None:
+            return self.requestGETAPI(url=url)
+        entry = cache.get(name)
+        if entry is None or (cache.isStale(entry) and not cache.background_refresh):
+            data = self.requestGETAPI(url=url)
+            cache.put(name, data)
+            return data
+        if self.response_cache is not None:
+            self.response_cache.observe(url, entry.data)
+        if cache.isStale(entry) and cache.claimRefresh(name):
+            threading.Thread(
+                target=self._refreshReferenceData,
+                args=(name, url),
+                name=f"nepse-refresh-{name}",
+                daemon=True,
+            ).start()
+        return entry.data
+
+    def _refreshReferenceData(self, name: str, url: str) -> None:
+        """Fetch a stale reference dataset and reset the maps derived from it."""
+        assert self.reference_cache is not None
+        failed = False
+        try:
+            self.reference_cache.put(name, self.requestGETAPI(url=url))
+            self._resetReferenceMaps()
+            self.logger.debug(f"Refreshed reference data {name}")
+        except Exception as e:
+            failed = True
+            self.logger.warning(f"Failed to refresh reference data {name}: {e}")
+        finally:
+            self.reference_cache.releaseRefresh(name, failed=failed)
+
     def getCompanyList(self) -> list[dict[str, Any]]:
         """
         Get list of all listed companies.
@@ -286,7 +405,9 @@ class NepseClient(_NepseBase):
            Results are cached internally. Subsequent calls return cached data
            unless cache is cleared.
         """
-        self.company_list = self.requestGETAPI(url=self.api_end_points["company_list_url"])
+        self.company_list = self._referenceData(
+            "company_list", self.api_end_points["company_list_url"]
+        )
         return list(self.company_list)
 
     def getSecurityList(self) -> list[dict[str, Any]]:
@@ -296,7 +417,9 @@ class NepseClient(_NepseBase):
         Returns:
            List of security dictionaries
         """
-        self.security_list = self.requestGETAPI(url=self.api_end_points["security_list_url"])
+        self.security_list = self._referenceData(
+            "security_list", self.api_end_points["security_list_url"]
+        )
         return list(self.security_list)
 
     def getCompanyIDKeyMap(self, force_update: bool = False) -> dict[str, int]:
@@ -309,7 +432,11 @@ class NepseClient(_NepseBase):
         Returns:
            Dictionary mapping symbol to company ID
         """
-        if self.company_symbol_id_keymap is None or force_update:
+        if (
+            self.company_symbol_id_keymap is None
+            or force_update
+            or self._isReferenceStale("company_list")
+        ):
             company_list = self.getCompanyList()
             self.company_symbol_id_keymap = {
                 company["symbol"]: company["id"] for company in company_list
@@ -326,7 +453,11 @@ class NepseClient(_NepseBase):
         Returns:
            Dictionary mapping symbol to security ID
         """
-        if self.security_symbol_id_keymap is None or force_update:
+        if (
+            self.security_symbol_id_keymap is None
+            or force_update
+            or self._isReferenceStale("security_list")
+        ):
             security_list = self.getSecurityList()
             self.security_symbol_id_keymap = {
                 security["symbol"]: security["id"] for security in security_list
@@ -547,7 +678,7 @@ class NepseClient(_NepseBase):
         """
         # Default end_date to today
         if end_date is None:
-            end_date_date = date.today()
+            end_date_date = self.clock.today()
         elif isinstance(end_date, str):
             end_date_date = datetime.strptime(end_date, "%Y-%m-%d").date()
         else:
@@ -597,7 +728,13 @@ class NepseClient(_NepseBase):
         show_progress: bool = False,
         paginated: bool = False,
         page: Optional[int] = None,
-    ) -> Union[list[dict[str, Any]], list[list[dict[str, Any]]], dict[str, Any]]:
+        max_workers: Optional[int] = None,
+        since_contract_id: Optional[int] = None,
+        checkpoint_dir: Optional[Union[str, os.PathLike]] = None,
+        columnar: bool = False,
+    ) -> Union[
+        list[dict[str, Any]], list[list[dict[str, Any]]], dict[str, Any], FloorSheetColumns
+    ]:
         """
         Get floor sheet data.
 
@@ -605,12 +742,43 @@ class NepseClient(_NepseBase):
            show_progress: Show progress bar during download
            paginated: Return list of pages instead of flattened list
            page: Get specific page number (0-indexed)
+           max_workers: Fetch the remaining pages concurrently on a thread pool
+              of this size. Pages are still returned in order. ``None`` or 1
+              fetches pages one after another.
+           since_contract_id: Incremental mode. Fetch pages only until this
+              contract ID (the last one the caller already has) is reached and
+              return ``{"content": new_rows, "last_contract_id": new_mark}``.
+           checkpoint_dir: Resumable mode. Save every completed page for the
+              business date under this directory; a later call fetches only
+              the missing pages and reassembles the day from disk.
+           columnar: Return a :class:`FloorSheetColumns` built page by page
+              instead of a list of dicts (not combined with ``paginated``,
+              ``page`` or ``since_contract_id``)
 
         Returns:
            Floor sheet data (format depends on parameters)
+
+        Example:
+           Poll only the trades made since the previous call::
+
+              mark = 0
+              while True:
+                 result = client.getFloorSheet(since_contract_id=mark)
+                 store(result["content"])
+                 mark = result["last_contract_id"]
         """
         url = f"{self.api_end_points['floor_sheet']}?size={self.floor_sheet_size}&sort=contractId,desc"
 
+        if columnar and (paginated or page is not None or since_contract_id is not None):
+            raise NepseValidationError(
+                "columnar cannot be combined with paginated, page or since_contract_id",
+                field="columnar",
+                value=columnar,
+            )
+
+        if since_contract_id is not None:
+            return self._getFloorSheetSince(url, since_contract_id)
+
         # Fetch specific page
         if page is not None:
             page_url = f"{url}&page={page}"
@@ -623,47 +791,313 @@ class NepseClient(_NepseBase):
             )
 
         # Fetch all pages
+        pages = (
+            self._iterCheckpointedFloorSheetPages(url, checkpoint_dir, max_workers, show_progress)
+            if checkpoint_dir is not None
+            else self._iterFloorSheetPages(
+                url, max_workers=max_workers, show_progress=show_progress
+            )
+        )
+
+        if columnar:
+            return FloorSheetColumns.from_pages(pages)
+
+        if paginated:
+            return list(pages)
+
+        # Flatten all pages
+        return [row for page in pages for row in page]
+
+    def iter_floorsheet(
+        self,
+        paginated: bool = False,
+        max_workers: Optional[int] = None,
+        show_progress: bool = False,
+    ) -> Iterator[Union[dict[str, Any], list[dict[str, Any]]]]:
+        """
+        Lazily iterate over today's floor sheet.
+
+        Pages are requested only as the caller consumes them, so memory stays
+        constant regardless of the day's volume and rows can be streamed
+        straight to disk or a database.
+
+        Args:
+           paginated: Yield one list per page instead of individual rows
+           max_workers: Prefetch up to this many pages on a thread pool
+           show_progress: Show progress bar during download
+
+        Yields:
+           Floor sheet records (or pages when ``paginated`` is True)
+
+        Example::
+
+           for row in client.iter_floorsheet():
+              writer.writerow(row)
+        """
+        url = f"{self.api_end_points['floor_sheet']}?size={self.floor_sheet_size}&sort=contractId,desc"
+        pages = self._iterFloorSheetPages(url, max_workers=max_workers, show_progress=show_progress)
+        if paginated:
+            yield from pages
+        else:
+            for page in pages:
+                yield from page
+
+    def _iterFloorSheetPages(
+        self, url: str, max_workers: Optional[int] = None, show_progress: bool = False
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield floor sheet pages in order, fetching them on demand.
+
+        With ``max_workers`` a sliding window of that many pages is fetched
+        on a thread pool that shares this client's connection pool and token
+        manager; otherwise pages are fetched one after another.
+
+        Args:
+           url: Base floor sheet URL
+           max_workers: Thread pool size (``None`` or 1 for sequential)
+           show_progress: Show progress bar during download
+
+        Yields:
+           List of records for each page
+        """
         sheet = self.requestPOSTAPI(url=url, payload_generator=self.getPOSTPayloadIDForFloorSheet)
+        if not sheet:
+            return
+
+        page_numbers = range(1, sheet["floorsheets"]["totalPages"])
         first_page = sheet["floorsheets"]["content"]
-        total_pages = sheet["floorsheets"]["totalPages"]
+        del sheet
 
-        # Setup iterator with optional progress bar
-        page_iterator = (
-            tqdm.tqdm(range(1, total_pages), desc="Downloading floor sheet")
+        progress = (
+            _progress_bar(total=len(page_numbers), desc="Downloading floor sheet")
             if show_progress
-            else range(1, total_pages)
+            else None
         )
+        executor = (
+            ThreadPoolExecutor(max_workers=max_workers)
+            if max_workers is not None and max_workers > 1
+            else None
+        )
+        try:
+            if executor is None:
+                yield first_page
+                for page_num in page_numbers:
+                    page = self._getFloorSheetPageNumber(url, page_num)
+                    if progress is not None:
+                        progress.update()
+                    yield page
+                return
+
+            remaining = iter(page_numbers)
+            window = deque(
+                executor.submit(self._getFloorSheetPageNumber, url, page_num)
+                for page_num in islice(remaining, max_workers)
+            )
+            yield first_page
+            while window:
+                page = window.popleft().result()
+                next_page = next(remaining, None)
+                if next_page is not None:
+                    window.append(executor.submit(self._getFloorSheetPageNumber, url, next_page))
+                if progress is not None:
+                    progress.update()
+                yield page
+        finally:
+            if executor is not None:
+                # Don't keep downloading the rest of the day if a page failed
+                executor.shutdown(wait=True, cancel_futures=True)
+            if progress is not None:
+                progress.close()
+
+    def _iterCheckpointedFloorSheetPages(
+        self,
+        url: str,
+        checkpoint_dir: Union[str, os.PathLike],
+        max_workers: Optional[int] = None,
+        show_progress: bool = False,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Download the missing floor sheet pages into a checkpoint, then read it back.
+
+        Args:
+           url: Base floor sheet URL
+           checkpoint_dir: Root checkpoint directory
+           max_workers: Thread pool size (``None`` or 1 for sequential)
+           show_progress: Show progress bar during download
 
-        all_pages = [first_page]
-        for page_num in page_iterator:
-            current_sheet = self.requestPOSTAPI(
-                url=f"{url}&page={page_num}",
-                payload_generator=self.getPOSTPayloadIDForFloorSheet,
+        Returns:
+           Iterator over the pages of the day, read from the checkpoint
+        """
+        sheet = self.requestPOSTAPI(url=url, payload_generator=self.getPOSTPayloadIDForFloorSheet)
+        if not sheet:
+            return iter(())
+
+        first_page = sheet["floorsheets"]["content"]
+        business_date = (
+            first_page[0].get("businessDate") if first_page else None
+        ) or self.clock.today().isoformat()
+
+        # A sheet still growing (live trading) no longer matches the saved pages
+        fingerprint = {
+            "totalElements": sheet["floorsheets"].get("totalElements"),
+            "firstContractId": first_page[0].get("contractId") if first_page else None,
+        }
+        checkpoint = FloorSheetCheckpoint(checkpoint_dir, business_date)
+        checkpoint.start(sheet["floorsheets"]["totalPages"], fingerprint)
+        checkpoint.save_page(0, first_page)
+        del sheet, first_page
+
+        missing = checkpoint.missing_pages()
+        if missing:
+            self.logger.info(
+                f"Resuming floor sheet for {business_date}: {len(missing)} page(s) missing"
+            )
+        progress = (
+            _progress_bar(total=len(missing), desc="Downloading floor sheet")
+            if show_progress
+            else None
+        )
+        window_size = max_workers if max_workers else 1
+        executor = ThreadPoolExecutor(max_workers=window_size)
+        try:
+            remaining = iter(missing)
+            window = deque(
+                (page_num, executor.submit(self._getFloorSheetPageNumber, url, page_num))
+                for page_num in islice(remaining, window_size)
             )
-            all_pages.append(current_sheet["floorsheets"]["content"])
+            while window:
+                page_num, future = window.popleft()
+                checkpoint.save_page(page_num, future.result())
+                next_page = next(remaining, None)
+                if next_page is not None:
+                    window.append(
+                        (next_page, executor.submit(self._getFloorSheetPageNumber, url, next_page))
+                    )
+                if progress is not None:
+                    progress.update()
+        finally:
+            # Pages saved so far are kept for the next attempt
+            executor.shutdown(wait=True, cancel_futures=True)
+            if progress is not None:
+                progress.close()
+
+        return checkpoint.iter_pages()
+
+    def _getFloorSheetSince(self, url: str, since_contract_id: int) -> dict[str, Any]:
+        """
+        Fetch floor sheet pages until a known contract ID is reached.
 
-        if paginated:
-            return all_pages
+        Args:
+           url: Base floor sheet URL
+           since_contract_id: Last contract ID the caller already has
 
-        # Flatten all pages
-        return [row for page in all_pages for row in page]
+        Returns:
+           Dictionary with the new ``content`` and the new ``last_contract_id``
+        """
+        rows: list[dict[str, Any]] = []
+        seen: set[int] = set()
+        for page in self._iterFloorSheetPages(url):
+            new_rows, crossed = self._takeNewFloorSheetRows(page, since_contract_id, seen)
+            rows.extend(new_rows)
+            if crossed:
+                break
+        return self._incrementalFloorSheetResult(rows, since_contract_id)
+
+    def _getFloorSheetPageNumber(self, url: str, page_number: int) -> list[dict[str, Any]]:
+        """
+        Get a specific page of floor sheet data.
+
+        Args:
+           url: Base floor sheet URL
+           page_number: Page number to fetch
+
+        Returns:
+           List of records for the page
+        """
+        current_sheet = self.requestPOSTAPI(
+            url=f"{url}&page={page_number}",
+            payload_generator=self.getPOSTPayloadIDForFloorSheet,
+        )
+        return cast(
+            list[dict[str, Any]], current_sheet["floorsheets"]["content"] if current_sheet else []
+        )
 
     def getFloorSheetOf(
         self,
         symbol: str,
         business_date: Optional[Union[str, date]] = None,
         size: int = 500,
-    ) -> list[dict[str, Any]]:
+        since_contract_id: Optional[int] = None,
+        columnar: bool = False,
+    ) -> Union[list[dict[str, Any]], dict[str, Any], FloorSheetColumns]:
         """
         Get floor sheet for a specific company.
 
         Args:
            symbol: Company symbol
            business_date: Business date (YYYY-MM-DD string or date object)
+           since_contract_id: Incremental mode, see :meth:`getFloorSheet`
+           columnar: Return a :class:`FloorSheetColumns` instead of a list of dicts
 
         Returns:
-           List of floor sheet records
+           List of floor sheet records, or ``{"content": new_rows,
+           "last_contract_id": new_mark}`` in incremental mode
         """
+        if columnar and since_contract_id is not None:
+            raise NepseValidationError(
+                "columnar cannot be combined with since_contract_id",
+                field="columnar",
+                value=columnar,
+            )
+
+        if since_contract_id is not None:
+            return self._getFloorSheetSince(
+                self._getFloorSheetOfURL(symbol, business_date, size), since_contract_id
+            )
+
+        if columnar:
+            return FloorSheetColumns.from_pages(
+                self._iterFloorSheetPages(self._getFloorSheetOfURL(symbol, business_date, size))
+            )
+
+        return cast(
+            list[dict[str, Any]],
+            list(self.iter_floorsheet_of(symbol, business_date=business_date, size=size)),
+        )
+
+    def iter_floorsheet_of(
+        self,
+        symbol: str,
+        business_date: Optional[Union[str, date]] = None,
+        size: int = 500,
+        paginated: bool = False,
+    ) -> Iterator[Union[dict[str, Any], list[dict[str, Any]]]]:
+        """
+        Lazily iterate over the floor sheet of a specific company.
+
+        Args:
+           symbol: Company symbol
+           business_date: Business date (YYYY-MM-DD string or date object)
+           size: Page size
+           paginated: Yield one list per page instead of individual rows
+
+        Yields:
+           Floor sheet records (or pages when ``paginated`` is True)
+        """
+        pages = self._iterFloorSheetPages(self._getFloorSheetOfURL(symbol, business_date, size))
+        if paginated:
+            yield from pages
+        else:
+            for page in pages:
+                yield from page
+
+    def _getFloorSheetOfURL(
+        self,
+        symbol: str,
+        business_date: Optional[Union[str, date]] = None,
+        size: int = 500,
+    ) -> str:
+        """Build the company floor sheet URL (page 0)."""
         symbol = symbol.upper()
         company_id = self.getSecurityIDKeyMap()[symbol]
 
@@ -671,29 +1105,12 @@ class NepseClient(_NepseBase):
             if isinstance(business_date, str):
                 business_date = date.fromisoformat(business_date)
         else:
-            business_date = date.today()
+            business_date = self.clock.today()
 
         query_string = self._build_query_params(
             businessDate=business_date, size=size or self.floor_sheet_size
         )
-        url = f"{self.api_end_points['company_floorsheet']}{company_id}?{query_string}&sort=contractid,desc"
-
-        sheet = self.requestPOSTAPI(url=url, payload_generator=self.getPOSTPayloadIDForFloorSheet)
-
-        if not sheet:
-            return []
-
-        floor_sheets = sheet["floorsheets"]["content"]
-        total_pages = sheet["floorsheets"]["totalPages"]
-
-        for page_num in range(1, total_pages):
-            next_sheet = self.requestPOSTAPI(
-                url=f"{url}&page={page_num}",
-                payload_generator=self.getPOSTPayloadIDForFloorSheet,
-            )
-            floor_sheets.extend(next_sheet["floorsheets"]["content"])
-
-        return cast(list[dict[str, Any]], floor_sheets)
+        return f"{self.api_end_points['company_floorsheet']}{company_id}?{query_string}&sort=contractid,desc"
 
     def getSymbolMarketDepth(self, symbol: str) -> dict[str, Any]:
         """
@@ -716,7 +1133,7 @@ class NepseClient(_NepseBase):
         """Get list of market holidays for specified year."""
         query_string = self._build_query_params(year=year)
         url = f"{self.api_end_points['holiday-list']}?{query_string}"
-        self.holiday_list = self.requestGETAPI(url=url)
+        self.holiday_list = self._referenceData(f"holiday_list_{year}", url)
         return list(self.holiday_list)
 
     def getDebentureAndBondList(self, bond_type: str = "debenture") -> list[dict[str, Any]]:
@@ -7,117 +7,253 @@ for both synchronous and asynchronous clients.
 """
 
 import asyncio
+import contextlib
+import functools
 import logging
 import pathlib
+import threading
 import time
+from collections.abc import AsyncIterator, Iterator
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Any, Optional, cast
+from typing import Any, NamedTuple, Optional, cast
 
-import pywasm
+import httpx
 
-from .exceptions import NepseValidationError
+from .exceptions import NepseAuthenticationError, NepseError, NepseValidationError
+from .token_store import FileTokenStore
 
 
 logger = logging.getLogger(__name__)
 
 
+# Lookup table from the data segment of css.wasm (offset 1024)
+_INDEX_TABLE = (
+    5, 8, 4, 7, 9, 4, 6, 9, 5, 5, 6, 5, 3, 5, 4, 4, 9, 6, 6, 8,
+    8, 6, 8, 6, 5, 8, 4, 9, 5, 9, 8, 5, 3, 4, 7, 7, 4, 7, 3, 9,
+)  # fmt: skip
+
+_I32_MIN = -(2**31)
+_I32_MAX = 2**31 - 1
+
+
+def _salt_digits(salt: int) -> tuple[int, int, int]:
+    """
+    Split a salt the way css.wasm does.
+
+    Division and remainder truncate toward zero as in WASM ``i32.div_s`` /
+    ``i32.rem_s``, so negative salts yield negative digits.
+
+    Returns:
+       Tuple of (tens digit, hundreds digit, table value)
+    """
+    magnitude = abs(salt)
+    sign = -1 if salt < 0 else 1
+    ones = sign * (magnitude % 10)
+    tens = sign * (magnitude // 10 % 10)
+    hundreds = sign * (magnitude // 100 % 10)
+    digit_sum = ones + tens + hundreds
+    # Negative sums read zeroed memory below the table
+    return tens, hundreds, _INDEX_TABLE[digit_sum] if digit_sum >= 0 else 0
+
+
+def _cdx(salt: int) -> int:
+    _, _, value = _salt_digits(salt)
+    return value + 22
+
+
+def _rdx(salt: int) -> int:
+    tens, hundreds, value = _salt_digits(salt)
+    return tens + hundreds + value + 32
+
+
+def _bdx(salt: int) -> int:
+    tens, hundreds, value = _salt_digits(salt)
+    return tens + hundreds + value + 60
+
+
+def _ndx(salt: int) -> int:
+    tens, _, value = _salt_digits(salt)
+    return tens + value + 88
+
+
+def _mdx(salt: int) -> int:
+    _, hundreds, value = _salt_digits(salt)
+    return hundreds + value + 110
+
+
+# Native ports of the css.wasm exports. Every export reads only its second
+# argument; the others are accepted for signature compatibility.
+INDEX_FUNCTIONS = {"cdx": _cdx, "rdx": _rdx, "bdx": _bdx, "ndx": _ndx, "mdx": _mdx}
+
+
 class TokenParser:
     """
-    Parse authentication tokens using WebAssembly module.
+    Parse authentication tokens.
+
+    The token indices are computed by pure-Python ports of the functions
+    exported by the ``css.wasm`` module shipped with the NEPSE website. The
+    WASM module itself is only loaded (through pywasm) when ``use_wasm`` is
+    set or a salt falls outside the 32-bit range the ports are verified for,
+    and is then shared by every parser in the process.
 
-    This class uses a WASM module to decode and parse the authentication
-    tokens returned by the NEPSE API.
+    Indices depend only on the salts, so they are memoized per salt tuple.
+    Token managers share one parser through :func:`get_token_parser`.
+
+    Args:
+       use_wasm: Always evaluate the indices with the WASM module
     """
 
-    def __init__(self):
-        """Initialize token parser with WASM runtime."""
-        self.runtime = pywasm.core.Runtime()
-        wasm_path = pathlib.Path(__file__).parent / "data" / "css.wasm"
+    WASM_PATH = pathlib.Path(__file__).parent / "data" / "css.wasm"
+
+    # Process-wide WASM instance, created on first use. pywasm is not
+    # thread-safe, so invocations are serialized with the same lock.
+    _wasm: Optional[tuple[Any, Any]] = None
+    _wasm_lock = threading.Lock()
+
+    def __init__(self, use_wasm: bool = False):
+        """Initialize token parser."""
+        self.use_wasm = use_wasm
+        self.token_indices = functools.lru_cache(maxsize=256)(self._computeTokenIndices)
+        if use_wasm:
+            self._loadWasm()
+
+    @classmethod
+    def _loadWasm(cls) -> tuple[Any, Any]:
+        """Return the shared ``(runtime, module)``, instantiating it on first use."""
+        with cls._wasm_lock:
+            if cls._wasm is None:
+                import pywasm
+
+                runtime = pywasm.core.Runtime()
+                try:
+                    module = runtime.instance_from_file(str(cls.WASM_PATH))
+                    logger.debug("WASM module loaded successfully")
+                except Exception as e:
+                    logger.error(f"Failed to load WASM module: {e}")
+                    raise
+                cls._wasm = (runtime, module)
+            return cls._wasm
+
+    def index(self, name: str, salts: list[int]) -> int:
+        """
+        Evaluate one of the token index functions.
+
+        Args:
+           name: Function name (``cdx``, ``rdx``, ``bdx``, ``ndx`` or ``mdx``)
+           salts: Function arguments
 
-        try:
-            self.wasm_module = self.runtime.instance_from_file(str(wasm_path))
-            logger.debug("WASM module loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load WASM module: {e}")
-            raise
+        Returns:
+           Index into the token
+        """
+        if not self.use_wasm and _I32_MIN <= salts[1] <= _I32_MAX:
+            return INDEX_FUNCTIONS[name](salts[1])
 
-    def parse_token_response(self, token_response: dict) -> tuple[str, str]:
+        runtime, module = self._loadWasm()
+        with self._wasm_lock:
+            return cast(int, runtime.invocate(module, name, salts)[0])
+
+    def _computeTokenIndices(
+        self, salts: tuple[int, ...]
+    ) -> tuple[tuple[int, ...], tuple[int, ...]]:
         """
-        Parse access and refresh tokens from API response.
+        Compute the positions of the padding characters in both tokens.
 
         Args:
-           token_response: Raw token response from API
+           salts: The five salts of the token response
 
         Returns:
-           Tuple of (access_token, refresh_token)
+           Tuple of (access token indices, refresh token indices)
         """
-        salts = [
-            token_response["salt1"],
-            token_response["salt2"],
-            token_response["salt3"],
-            token_response["salt4"],
-            token_response["salt5"],
-        ]
+        s1, s2, s3, s4, s5 = salts
 
         # Calculate indices for access token
-        n = self.runtime.invocate(self.wasm_module, "cdx", salts)[0]
-        access_token_l_index = self.runtime.invocate(
-            self.wasm_module, "rdx", [salts[0], salts[1], salts[3], salts[2], salts[4]]
-        )[0]
-        o = self.runtime.invocate(
-            self.wasm_module, "bdx", [salts[0], salts[1], salts[3], salts[2], salts[4]]
-        )[0]
-        p = self.runtime.invocate(
-            self.wasm_module, "ndx", [salts[0], salts[1], salts[3], salts[2], salts[4]]
-        )[0]
-        q = self.runtime.invocate(
-            self.wasm_module, "mdx", [salts[0], salts[1], salts[3], salts[2], salts[4]]
-        )[0]
+        access = (
+            self.index("cdx", [s1, s2, s3, s4, s5]),
+            self.index("rdx", [s1, s2, s4, s3, s5]),
+            self.index("bdx", [s1, s2, s4, s3, s5]),
+            self.index("ndx", [s1, s2, s4, s3, s5]),
+            self.index("mdx", [s1, s2, s4, s3, s5]),
+        )
 
         # Calculate indices for refresh token
-        salts_reversed = [salts[1], salts[0], salts[2], salts[4], salts[3]]
-        a = self.runtime.invocate(
-            self.wasm_module, "cdx", [salts[1], salts[0], salts[2], salts[4], salts[3]]
-        )[0]
-        b = self.runtime.invocate(
-            self.wasm_module, "rdx", [salts[1], salts[0], salts[2], salts[3], salts[4]]
-        )[0]
-        c = self.runtime.invocate(
-            self.wasm_module, "bdx", [salts[1], salts[0], salts[3], salts[2], salts[4]]
-        )[0]
-        d = self.runtime.invocate(
-            self.wasm_module, "ndx", [salts[1], salts[0], salts[3], salts[2], salts[4]]
-        )[0]
-        e = self.runtime.invocate(
-            self.wasm_module, "mdx", [salts[1], salts[0], salts[3], salts[2], salts[4]]
-        )[0]
-        print(salts_reversed)
-
-        # Extract tokens
-        access_token = token_response["accessToken"]
-        refresh_token = token_response["refreshToken"]
-
-        # Parse access token
-        parsed_access_token = (
-            access_token[0:n]
-            + access_token[n + 1 : access_token_l_index]
-            + access_token[access_token_l_index + 1 : o]
-            + access_token[o + 1 : p]
-            + access_token[p + 1 : q]
-            + access_token[q + 1 :]
+        refresh = (
+            self.index("cdx", [s2, s1, s3, s5, s4]),
+            self.index("rdx", [s2, s1, s3, s4, s5]),
+            self.index("bdx", [s2, s1, s4, s3, s5]),
+            self.index("ndx", [s2, s1, s4, s3, s5]),
+            self.index("mdx", [s2, s1, s4, s3, s5]),
         )
+        return access, refresh
+
+    @staticmethod
+    def _stripPadding(token: str, indices: tuple[int, ...]) -> str:
+        """Remove the characters at ``indices`` (ascending) from ``token``."""
+        parts = []
+        start = 0
+        for index in indices:
+            parts.append(token[start:index])
+            start = index + 1
+        parts.append(token[start:])
+        return "".join(parts)
 
-        # Parse refresh token
-        parsed_refresh_token = (
-            refresh_token[0:a]
-            + refresh_token[a + 1 : b]
-            + refresh_token[b + 1 : c]
-            + refresh_token[c + 1 : d]
-            + refresh_token[d + 1 : e]
-            + refresh_token[e + 1 :]
+    def parse_token_response(self, token_response: dict) -> tuple[str, str]:
+        """
+        Parse access and refresh tokens from API response.
+
+        Args:
+           token_response: Raw token response from API
+
+        Returns:
+           Tuple of (access_token, refresh_token)
+        """
+        salts = tuple(int(token_response[f"salt{i}"]) for i in range(1, 6))
+        access_indices, refresh_indices = self.token_indices(salts)
+
+        return (
+            self._stripPadding(token_response["accessToken"], access_indices),
+            self._stripPadding(token_response["refreshToken"], refresh_indices),
         )
 
-        return (parsed_access_token, parsed_refresh_token)
+
+_token_parser: Optional[TokenParser] = None
+_token_parser_lock = threading.Lock()
+
+
+def get_token_parser() -> TokenParser:
+    """
+    Return the process-wide token parser, creating it on first use.
+
+    Returns:
+       Shared :class:`TokenParser`
+    """
+    global _token_parser
+    if _token_parser is None:
+        with _token_parser_lock:
+            if _token_parser is None:
+                _token_parser = TokenParser()
+    return _token_parser
+
+
+class TokenSnapshot(NamedTuple):
+    """
+    Immutable set of token values published together by a refresh.
+
+    Readers take one snapshot and use it for the whole request, so the salts
+    in a payload always belong to the token in its ``Authorization`` header.
+    """
+
+    access_token: str
+    refresh_token: str
+    timestamp: int
+    salts: tuple[int, ...]
+
+
+# Snapshots pinned to the request running in the current thread/task, keyed by
+# token manager; set and reset by ``pinned()``
+_pinned_tokens: ContextVar[Optional[dict["_TokenManagerBase", TokenSnapshot]]] = ContextVar(
+    "nepse_pinned_tokens", default=None
+)
 
 
 class _TokenManagerBase:
@@ -129,25 +265,84 @@ class _TokenManagerBase:
 
     Args:
        nepse: Reference to parent NEPSE client
+       token_store: Optional store shared with other processes; tokens
+          fetched by one process are reused by the others while valid
     """
 
     # Token validity period in seconds (45 seconds as per original)
     MAX_UPDATE_PERIOD = 45
 
-    def __init__(self, nepse):
+    # Background refresh: renew this many seconds before expiry, and never
+    # more often than MIN_REFRESH_INTERVAL (also the retry delay on failure)
+    REFRESH_LEAD_TIME = 5.0
+    MIN_REFRESH_INTERVAL = 1.0
+
+    # After the refresh-token endpoint fails, renew with prove for this many seconds
+    REFRESH_ENDPOINT_COOLDOWN = 600.0
+
+    TOKEN_RESPONSE_KEYS = ("accessToken", "refreshToken", "serverTime") + tuple(
+        f"salt{i}" for i in range(1, 6)
+    )
+
+    def __init__(self, nepse, token_store: Optional[FileTokenStore] = None):
         """Initialize token manager."""
         self.nepse = nepse
-        self.token_parser = TokenParser()
+        self.token_parser = get_token_parser()
+        self.token_store = token_store
 
         # Token endpoints
         self.token_url = "/api/authenticate/prove"
         self.refresh_url = "/api/authenticate/refresh-token"
 
-        # Token state
-        self.access_token: Optional[str] = None
-        self.refresh_token: Optional[str] = None
-        self.token_time_stamp: Optional[int] = None
-        self.salts: Optional[list[int]] = None
+        # Token state, replaced as a whole on every refresh
+        self._snapshot: Optional[TokenSnapshot] = None
+
+        # time.monotonic() until which the refresh-token endpoint is skipped
+        self._refresh_endpoint_disabled_until = 0.0
+
+    def _pinnedSnapshot(self) -> Optional[TokenSnapshot]:
+        """Return the snapshot pinned to the request running in this thread/task."""
+        pins = _pinned_tokens.get()
+        return pins.get(self) if pins else None
+
+    def _pin(self, snapshot: TokenSnapshot) -> Any:
+        """Pin ``snapshot`` to the current thread/task and return the reset token."""
+        return _pinned_tokens.set({**(_pinned_tokens.get() or {}), self: snapshot})
+
+    @staticmethod
+    def _markRejected(error: NepseAuthenticationError, snapshot: TokenSnapshot) -> None:
+        """Record the token a rejected request was sent with, for :meth:`renewRejected`."""
+        if error.rejected_token is None:
+            error.rejected_token = snapshot
+
+    @property
+    def snapshot(self) -> Optional[TokenSnapshot]:
+        """Return the token pinned to the current request, else the latest token."""
+        return self._pinnedSnapshot() or self._snapshot
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """Return the access token of :attr:`snapshot`."""
+        snapshot = self.snapshot
+        return snapshot.access_token if snapshot else None
+
+    @property
+    def refresh_token(self) -> Optional[str]:
+        """Return the refresh token of :attr:`snapshot`."""
+        snapshot = self.snapshot
+        return snapshot.refresh_token if snapshot else None
+
+    @property
+    def token_time_stamp(self) -> Optional[int]:
+        """Return the server timestamp (seconds) of :attr:`snapshot`."""
+        snapshot = self.snapshot
+        return snapshot.timestamp if snapshot else None
+
+    @property
+    def salts(self) -> Optional[tuple[int, ...]]:
+        """Return the salts of :attr:`snapshot`."""
+        snapshot = self.snapshot
+        return snapshot.salts if snapshot else None
 
     def isTokenValid(self) -> bool:
         """
@@ -156,13 +351,117 @@ class _TokenManagerBase:
         Returns:
            True if token is valid, False otherwise
         """
-        if self.token_time_stamp is None:
+        return self._isFresh(self._snapshot)
+
+    def _isFresh(self, snapshot: Optional[TokenSnapshot]) -> bool:
+        """Return True if ``snapshot`` has not expired yet."""
+        if snapshot is None:
             return False
 
-        elapsed = int(time.time()) - self.token_time_stamp
+        # Token timestamps are server time, so compare against the server clock
+        elapsed = int(self.nepse.clock.time()) - snapshot.timestamp
         return elapsed < self.MAX_UPDATE_PERIOD
 
-    def _getValidTokenFromJSON(self, token_response: dict) -> tuple[str, str, int, list[int]]:
+    def _adoptStoredToken(self) -> bool:
+        """
+        Publish the token from :attr:`token_store` if it is newer than ours.
+
+        Returns:
+           True if a stored token was adopted
+        """
+        if self.token_store is None:
+            return False
+        stored = self.token_store.load()
+        if stored is None:
+            return False
+        try:
+            snapshot = self._getValidTokenFromJSON(self._checkTokenResponse(stored))
+        except (NepseValidationError, TypeError, ValueError):
+            logger.warning(f"Ignoring unreadable token in {self.token_store}")
+            return False
+        if not self._isFresh(snapshot) or (
+            self._snapshot is not None and snapshot.timestamp <= self._snapshot.timestamp
+        ):
+            return False
+        self._snapshot = snapshot
+        logger.debug("Reusing authentication token from token store")
+        return True
+
+    def _storeToken(self, token_response: dict) -> None:
+        """Share a freshly fetched token response through :attr:`token_store`."""
+        if self.token_store is None:
+            return
+        try:
+            self.token_store.save(token_response)
+        except OSError as e:
+            logger.warning(f"Failed to save token to {self.token_store}: {e}")
+
+    def _isRejectedTokenCurrent(self, rejected: Optional[TokenSnapshot]) -> bool:
+        """Return True if the rejected token (None if unknown) is still the latest."""
+        return rejected is None or self._snapshot is None or self._snapshot is rejected
+
+    def _canUseRefreshEndpoint(self) -> bool:
+        """Return whether the next renewal should try the refresh-token endpoint."""
+        return (
+            self._snapshot is not None
+            and time.monotonic() >= self._refresh_endpoint_disabled_until
+        )
+
+    def _disableRefreshEndpoint(self, error: Exception) -> None:
+        """Skip the refresh-token endpoint for REFRESH_ENDPOINT_COOLDOWN after a failure."""
+        self._refresh_endpoint_disabled_until = time.monotonic() + self.REFRESH_ENDPOINT_COOLDOWN
+        logger.info(
+            f"Token refresh failed, re-authenticating for the next "
+            f"{self.REFRESH_ENDPOINT_COOLDOWN:.0f}s: {error}"
+        )
+
+    def _refreshRequestArgs(self) -> dict[str, Any]:
+        """Build the keyword arguments of the refresh-token POST request."""
+        return {
+            "url": self.nepse.get_full_url(api_url=self.refresh_url),
+            "headers": {
+                **self.nepse.build_headers(),
+                "Content-Type": "application/json",
+            },
+            "json": {"refreshToken": self._snapshot.refresh_token if self._snapshot else None},
+        }
+
+    def _checkTokenResponse(self, response: Any) -> dict[str, Any]:
+        """
+        Validate the shape of a token response.
+
+        Raises:
+           NepseValidationError: If a token field is missing
+        """
+        if not isinstance(response, dict) or any(
+            key not in response for key in self.TOKEN_RESPONSE_KEYS
+        ):
+            raise NepseValidationError(f"Unexpected token response: {type(response)}")
+        return response
+
+    def _secondsUntilRefresh(self, lead_time: float) -> float:
+        """
+        Return how long the background refresher can sleep.
+
+        Args:
+           lead_time: Seconds before expiry at which to refresh
+
+        Returns:
+           Seconds until the token should be renewed (<= 0 if due now)
+        """
+        if self._snapshot is None:
+            return 0.0
+        return float(
+            self.nepse.clock.secondsUntil(
+                self._snapshot.timestamp + self.MAX_UPDATE_PERIOD - lead_time
+            )
+        )
+
+    def _observeServerTime(self, token_response: dict, sent_at: float) -> None:
+        """Feed the ``serverTime`` of a token response to the client's clock."""
+        self.nepse.clock.observe(token_response["serverTime"] / 1000, sent_at, time.time())
+
+    def _getValidTokenFromJSON(self, token_response: dict) -> TokenSnapshot:
         """
         Extract and validate token data from API response.
 
@@ -170,10 +469,10 @@ class _TokenManagerBase:
            token_response: Raw token response from API
 
         Returns:
-           Tuple of (access_token, refresh_token, timestamp, salts)
+           TokenSnapshot of (access_token, refresh_token, timestamp, salts)
         """
         # Extract salts
-        salts = [int(token_response[f"salt{i}"]) for i in range(1, 6)]
+        salts = tuple(int(token_response[f"salt{i}"]) for i in range(1, 6))
 
         # Parse tokens
         access_token, refresh_token = self.token_parser.parse_token_response(token_response)
@@ -181,7 +480,7 @@ class _TokenManagerBase:
         # Extract timestamp
         timestamp = int(token_response["serverTime"] / 1000)
 
-        return (access_token, refresh_token, timestamp, salts)
+        return TokenSnapshot(access_token, refresh_token, timestamp, salts)
 
     def __repr__(self) -> str:
         """Return the string representation of the token manager.
@@ -208,12 +507,58 @@ class TokenManager(_TokenManagerBase):
     Synchronous token manager.
 
     Manages authentication tokens for synchronous NEPSE client,
-    automatically refreshing tokens when they expire.
+    automatically refreshing tokens when they expire. Safe to share
+    between threads: only one thread refreshes an expired or rejected
+    token while the others wait for it, and each refresh publishes a new
+    :class:`TokenSnapshot` in a single assignment.
     """
 
-    def __init__(self, nepse):
+    def __init__(self, nepse, token_store: Optional[FileTokenStore] = None):
         """Initialize synchronous token manager."""
-        super().__init__(nepse)
+        super().__init__(nepse, token_store)
+        self._update_lock = threading.RLock()
+        self._refresher: Optional[threading.Thread] = None
+        self._refresher_stop = threading.Event()
+
+    def _ensureValidToken(self) -> None:
+        """Refresh the token if it has expired (double-checked under lock)."""
+        if not self.isTokenValid():
+            with self._update_lock:
+                if not self.isTokenValid():
+                    self._renewShared()
+
+    def _renewShared(self) -> None:
+        """
+        Renew the token, coordinating with other processes through the store.
+
+        A token stored by another process is reused if it is newer; otherwise
+        the cross-process lock makes sure only one process fetches a new one.
+        """
+        if self._adoptStoredToken():
+            return
+        if self.token_store is None:
+            self._setToken()
+            return
+        handle = self.token_store.acquire()
+        try:
+            if not self._adoptStoredToken():
+                self._setToken()
+        finally:
+            self.token_store.release(handle)
+
+    def getSnapshot(self) -> TokenSnapshot:
+        """
+        Get the token for the current request, refreshing if necessary.
+
+        Returns:
+           The pinned snapshot inside :meth:`pinned`, else a valid snapshot
+        """
+        pinned = self._pinnedSnapshot()
+        if pinned is not None:
+            return pinned
+        self._ensureValidToken()
+        assert self._snapshot is not None
+        return self._snapshot
 
     def getAccessToken(self) -> str:
         """
@@ -222,10 +567,7 @@ class TokenManager(_TokenManagerBase):
         Returns:
            Valid access token
         """
-        if not self.isTokenValid():
-            self.update()
-        assert self.access_token is not None
-        return self.access_token
+        return self.getSnapshot().access_token
 
     def getRefreshToken(self) -> str:
         """
@@ -234,29 +576,138 @@ class TokenManager(_TokenManagerBase):
         Returns:
            Valid refresh token
         """
-        if not self.isTokenValid():
-            self.update()
-        assert self.refresh_token is not None
-        return self.refresh_token
+        return self.getSnapshot().refresh_token
+
+    @contextlib.contextmanager
+    def pinned(self) -> Iterator[TokenSnapshot]:
+        """
+        Use one token snapshot for everything inside the block.
+
+        Headers and payload IDs built inside the block read the same token
+        and salts even if another thread refreshes the token meanwhile.
+
+        A :class:`~nepse_client.exceptions.NepseAuthenticationError` raised
+        in the block records the pinned snapshot as its ``rejected_token``.
+
+        Yields:
+           The pinned snapshot
+        """
+        pinned = self._pinnedSnapshot()
+        if pinned is not None:
+            yield pinned
+            return
+        snapshot = self.getSnapshot()
+        reset = self._pin(snapshot)
+        try:
+            yield snapshot
+        except NepseAuthenticationError as e:
+            self._markRejected(e, snapshot)
+            raise
+        finally:
+            _pinned_tokens.reset(reset)
 
     def update(self) -> None:
         """Fetch and update authentication tokens."""
-        self._setToken()
+        with self._update_lock:
+            self._setToken()
+
+    def renewRejected(self, rejected: Optional[TokenSnapshot] = None) -> None:
+        """
+        Refresh after the server rejected a token.
+
+        Single-flight: when many threads are rejected at once, the first one
+        refreshes and the rest reuse its token instead of refreshing again.
+
+        Args:
+           rejected: Token the request was sent with (the ``rejected_token``
+              of the error), or None to always refresh
+        """
+        with self._update_lock:
+            if self._isRejectedTokenCurrent(rejected):
+                self._renewShared()
+
+    def startBackgroundRefresh(self, lead_time: Optional[float] = None) -> None:
+        """
+        Keep the token fresh from a daemon thread.
+
+        The token is renewed ``lead_time`` seconds before it expires, so
+        requests never have to wait for authentication. Does nothing if the
+        refresher is already running.
+
+        Args:
+           lead_time: Seconds before expiry to refresh (default: REFRESH_LEAD_TIME)
+        """
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        self._refresher_stop = threading.Event()
+        self._refresher = threading.Thread(
+            target=self._backgroundRefreshLoop,
+            args=(self.REFRESH_LEAD_TIME if lead_time is None else lead_time, self._refresher_stop),
+            name="nepse-token-refresh",
+            daemon=True,
+        )
+        self._refresher.start()
+
+    def stopBackgroundRefresh(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background refresher started by :meth:`startBackgroundRefresh`.
+
+        Args:
+           timeout: Seconds to wait for the thread to exit
+        """
+        self._refresher_stop.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout)
+            self._refresher = None
+
+    def _backgroundRefreshLoop(self, lead_time: float, stop: threading.Event) -> None:
+        """Refresh the token shortly before expiry until ``stop`` is set."""
+        while not stop.is_set():
+            delay = self._secondsUntilRefresh(lead_time)
+            if delay <= 0:
+                try:
+                    with self._update_lock:
+                        self._renewShared()
+                except Exception as e:
+                    logger.warning(f"Background token refresh failed: {e}")
+                delay = max(self._secondsUntilRefresh(lead_time), self.MIN_REFRESH_INTERVAL)
+            stop.wait(delay)
 
     def _setToken(self) -> None:
         """Fetch tokens from API and update internal state."""
-        logger.debug("Fetching new authentication token")
-        json_response = self._getTokenHttpRequest()
+        json_response = None
+        if self._canUseRefreshEndpoint():
+            try:
+                logger.debug("Refreshing authentication token")
+                sent_at = time.time()
+                json_response = self._refreshTokenHttpRequest()
+            except (NepseError, httpx.HTTPError) as e:
+                self._disableRefreshEndpoint(e)
+
+        if json_response is None:
+            logger.debug("Fetching new authentication token")
+            sent_at = time.time()
+            json_response = self._getTokenHttpRequest()
 
-        (
-            self.access_token,
-            self.refresh_token,
-            self.token_time_stamp,
-            self.salts,
-        ) = self._getValidTokenFromJSON(json_response)
+        self._observeServerTime(json_response, sent_at)
+        self._snapshot = self._getValidTokenFromJSON(json_response)
+        self._storeToken(json_response)
 
         logger.info("Authentication token refreshed successfully")
 
+    def _refreshTokenHttpRequest(self) -> dict[str, Any]:
+        """
+        Renew the tokens with the stored refresh token.
+
+        Bypasses ``requestPOSTAPI`` because its retry path would call back
+        into :meth:`update` on an authentication error.
+
+        Returns:
+           Token response dictionary
+        """
+        response = self.nepse.client.post(**self._refreshRequestArgs())
+        return self._checkTokenResponse(self.nepse.handle_response(response))
+
     def _getTokenHttpRequest(self) -> dict[str, Any]:
         """
         Make HTTP request to get token.
@@ -278,13 +729,30 @@ class AsyncTokenManager(_TokenManagerBase):
     with support for concurrent token refresh operations.
     """
 
-    def __init__(self, nepse):
+    def __init__(self, nepse, token_store: Optional[FileTokenStore] = None):
         """Initialize asynchronous token manager."""
-        super().__init__(nepse)
+        super().__init__(nepse, token_store)
 
         # Synchronization events for concurrent operations
         self.update_started = asyncio.Event()
         self.update_completed = asyncio.Event()
+        self._renew_lock = asyncio.Lock()
+        self._refresher: Optional[asyncio.Task] = None
+
+    async def getSnapshot(self) -> TokenSnapshot:
+        """
+        Get the token for the current request, refreshing if necessary.
+
+        Returns:
+           The pinned snapshot inside :meth:`pinned`, else a valid snapshot
+        """
+        pinned = self._pinnedSnapshot()
+        if pinned is not None:
+            return pinned
+        if not self.isTokenValid():
+            await self._renewShared()
+        assert self._snapshot is not None
+        return self._snapshot
 
     async def getAccessToken(self) -> str:
         """
@@ -293,10 +761,7 @@ class AsyncTokenManager(_TokenManagerBase):
         Returns:
            Valid access token
         """
-        if not self.isTokenValid():
-            await self.update()
-        assert self.access_token is not None
-        return self.access_token
+        return (await self.getSnapshot()).access_token
 
     async def getRefreshToken(self) -> str:
         """
@@ -305,15 +770,142 @@ class AsyncTokenManager(_TokenManagerBase):
         Returns:
            Valid refresh token
         """
-        if not self.isTokenValid():
-            await self.update()
-        assert self.refresh_token is not None
-        return self.refresh_token
+        return (await self.getSnapshot()).refresh_token
+
+    @contextlib.asynccontextmanager
+    async def pinned(self) -> AsyncIterator[TokenSnapshot]:
+        """
+        Use one token snapshot for everything inside the block.
+
+        Headers and payload IDs built inside the block read the same token
+        and salts even if another task refreshes the token meanwhile.
+
+        A :class:`~nepse_client.exceptions.NepseAuthenticationError` raised
+        in the block records the pinned snapshot as its ``rejected_token``.
+
+        Yields:
+           The pinned snapshot
+        """
+        pinned = self._pinnedSnapshot()
+        if pinned is not None:
+            yield pinned
+            return
+        snapshot = await self.getSnapshot()
+        reset = self._pin(snapshot)
+        try:
+            yield snapshot
+        except NepseAuthenticationError as e:
+            self._markRejected(e, snapshot)
+            raise
+        finally:
+            _pinned_tokens.reset(reset)
 
     async def update(self) -> None:
         """Fetch and update authentication tokens asynchronously."""
         await self._setToken()
 
+    async def renewRejected(self, rejected: Optional[TokenSnapshot] = None) -> None:
+        """
+        Refresh after the server rejected a token.
+
+        Single-flight: tasks rejected at the same time share one refresh.
+
+        Args:
+           rejected: Token the request was sent with (the ``rejected_token``
+              of the error), or None to always refresh
+        """
+        if self._isRejectedTokenCurrent(rejected):
+            await self._renewShared()
+
+    async def _renewShared(self) -> None:
+        """
+        Renew the token, coordinating with other processes through the store.
+
+        Tasks of this process queue on an in-process lock, and a task that
+        finds the token already replaced when it gets the lock returns. A
+        token stored by another process is reused if it is newer; otherwise
+        the cross-process lock (waited for off the event loop) makes sure only
+        one process fetches a new one.
+        """
+        snapshot = self._snapshot
+        async with self._renew_lock:
+            if self._snapshot is not snapshot:
+                return
+            if self._adoptStoredToken():
+                return
+            if self.token_store is None:
+                await self.update()
+                return
+            handle = await self._acquireStoreLock(self.token_store)
+            try:
+                if not self._adoptStoredToken():
+                    await self.update()
+            finally:
+                self.token_store.release(handle)
+
+    @staticmethod
+    async def _acquireStoreLock(store: FileTokenStore) -> Optional[int]:
+        """
+        Take the cross-process lock of a store on a worker thread.
+
+        If the waiting task is cancelled, the lock is released as soon as the
+        worker thread gets it instead of being held until the process exits.
+        """
+        acquire = asyncio.ensure_future(asyncio.to_thread(store.acquire))
+        try:
+            return await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+
+            def release(task: "asyncio.Future[Optional[int]]") -> None:
+                if not task.cancelled() and task.exception() is None:
+                    store.release(task.result())
+
+            acquire.add_done_callback(release)
+            raise
+
+    def startBackgroundRefresh(self, lead_time: Optional[float] = None) -> asyncio.Task:
+        """
+        Keep the token fresh from a task on the running event loop.
+
+        The token is renewed ``lead_time`` seconds before it expires, so
+        requests never have to wait for authentication. Returns the running
+        task if the refresher is already started.
+
+        Args:
+           lead_time: Seconds before expiry to refresh (default: REFRESH_LEAD_TIME)
+
+        Returns:
+           The refresher task
+        """
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.get_running_loop().create_task(
+                self._backgroundRefreshLoop(
+                    self.REFRESH_LEAD_TIME if lead_time is None else lead_time
+                ),
+                name="nepse-token-refresh",
+            )
+        return self._refresher
+
+    async def stopBackgroundRefresh(self) -> None:
+        """Cancel the refresher started by :meth:`startBackgroundRefresh`."""
+        task, self._refresher = self._refresher, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _backgroundRefreshLoop(self, lead_time: float) -> None:
+        """Refresh the token shortly before expiry until cancelled."""
+        while True:
+            delay = self._secondsUntilRefresh(lead_time)
+            if delay <= 0:
+                try:
+                    await self._renewShared()
+                except Exception as e:
+                    logger.warning(f"Background token refresh failed: {e}")
+                delay = max(self._secondsUntilRefresh(lead_time), self.MIN_REFRESH_INTERVAL)
+            await asyncio.sleep(delay)
+
     async def _setToken(self) -> None:
         """
         Fetch tokens from API and update internal state.
@@ -328,15 +920,23 @@ class AsyncTokenManager(_TokenManagerBase):
             self.update_completed.clear()
 
             try:
-                logger.debug("Fetching new authentication token")
-                json_response = await self._getTokenHttpRequest()
-
-                (
-                    self.access_token,
-                    self.refresh_token,
-                    self.token_time_stamp,
-                    self.salts,
-                ) = self._getValidTokenFromJSON(json_response)
+                json_response = None
+                if self._canUseRefreshEndpoint():
+                    try:
+                        logger.debug("Refreshing authentication token")
+                        sent_at = time.time()
+                        json_response = await self._refreshTokenHttpRequest()
+                    except (NepseError, httpx.HTTPError) as e:
+                        self._disableRefreshEndpoint(e)
+
+                if json_response is None:
+                    logger.debug("Fetching new authentication token")
+                    sent_at = time.time()
+                    json_response = await self._getTokenHttpRequest()
+
+                self._observeServerTime(json_response, sent_at)
+                self._snapshot = self._getValidTokenFromJSON(json_response)
+                self._storeToken(json_response)
 
                 logger.info("Authentication token refreshed successfully")
 
@@ -348,6 +948,19 @@ class AsyncTokenManager(_TokenManagerBase):
             # Wait for ongoing update to complete
             await self.update_completed.wait()
 
+    async def _refreshTokenHttpRequest(self) -> dict[str, Any]:
+        """
+        Renew the tokens with the stored refresh token.
+
+        Bypasses ``requestPOSTAPI`` because its retry path would call back
+        into :meth:`update` on an authentication error.
+
+        Returns:
+           Token response dictionary
+        """
+        response = await self.nepse.client.post(**self._refreshRequestArgs())
+        return self._checkTokenResponse(self.nepse.handle_response(response))
+
     async def _getTokenHttpRequest(self) -> dict:
         """
         Make async HTTP request to get token.
@@ -365,4 +978,6 @@ __all__ = [
     "TokenManager",
     "AsyncTokenManager",
     "TokenParser",
+    "TokenSnapshot",
+    "get_token_parser",
 ]
@@ -0,0 +1,149 @@
+"""
+Token persistence shared between processes.
+
+This module provides :class:`FileTokenStore`, a small file-backed store that
+lets every client process on a host reuse the token fetched by whichever
+process refreshed it first.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import pathlib
+import sys
+import time
+from collections.abc import Iterator
+from typing import Any, Optional, Union
+
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+logger = logging.getLogger(__name__)
+
+
+class FileTokenStore:
+    """
+    File-backed token store shared by the processes of one host.
+
+    The raw token response is kept in a JSON file readable only by the
+    current user (mode ``0o600``) and replaced atomically. A separate lock
+    file (``fcntl.flock`` on POSIX, ``msvcrt.locking`` on Windows) makes sure
+    only one process fetches a new token while the others wait and then
+    reuse it.
+
+    Args:
+       path: Token file path
+       lock_timeout: Seconds to wait for another process's refresh before
+          refreshing without the lock
+
+    Example:
+       >>> store = FileTokenStore("/tmp/nepse-token.json")
+       >>> client = NepseClient(token_store=store)
+    """
+
+    POLL_INTERVAL = 0.01
+
+    def __init__(self, path: Union[str, os.PathLike], lock_timeout: float = 30.0):
+        """Initialize token store."""
+        self.path = pathlib.Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.lock_timeout = lock_timeout
+
+    def load(self) -> Optional[dict[str, Any]]:
+        """
+        Read the stored token response.
+
+        Returns:
+           Token response, or None if nothing (readable) is stored
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def save(self, token_response: dict[str, Any]) -> None:
+        """
+        Store a token response atomically.
+
+        Args:
+           token_response: Raw token response from the API
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(token_response, f)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _tryLock(fd: int) -> bool:
+        try:
+            if sys.platform == "win32":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def _unlock(fd: int) -> None:
+        if sys.platform == "win32":
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def acquire(self) -> Optional[int]:
+        """
+        Take the cross-process refresh lock, waiting up to ``lock_timeout``.
+
+        Returns:
+           Lock handle to pass to :meth:`release`, or None on timeout
+        """
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        deadline = time.monotonic() + self.lock_timeout
+        while not self._tryLock(fd):
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                logger.warning(f"Timed out waiting for token lock {self.lock_path}")
+                return None
+            time.sleep(self.POLL_INTERVAL)
+        return fd
+
+    def release(self, handle: Optional[int]) -> None:
+        """
+        Release a lock taken with :meth:`acquire`.
+
+        Args:
+           handle: Lock handle returned by :meth:`acquire`
+        """
+        if handle is None:
+            return
+        try:
+            self._unlock(handle)
+        finally:
+            os.close(handle)
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the cross-process refresh lock for the duration of the block."""
+        handle = self.acquire()
+        try:
+            yield
+        finally:
+            self.release(handle)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the store."""
+        return f"FileTokenStore({str(self.path)!r})"
+
+
+__all__ = ["FileTokenStore"]
@@ -4,7 +4,10 @@ Pytest configuration and fixtures for NEPSE client tests.
 This module provides shared fixtures and configuration for all test modules.
 """
 
+import itertools
 import json
+import threading
+import time
 from datetime import datetime
 from unittest.mock import MagicMock, Mock
 
@@ -20,6 +23,7 @@ def mock_response():
         response = Mock(spec=httpx.Response)
         response.status_code = status_code
         response.json.return_value = json_data or {}
+        response.content = json.dumps(json_data or {}).encode()
         response.text = text
         response.headers = headers or {}
         response.url = "https://nepalstock.com.np/api/"
@@ -234,6 +238,115 @@ def mock_config_files(tmp_path, mock_api_endpoints, mock_dummy_data, mock_header
     return data_dir
 
 
+@pytest.fixture
+def mock_nepse_api(mock_token_response, mock_market_status, mock_security_list):
+    """
+    Create an in-memory NEPSE API served through ``httpx.MockTransport``.
+
+    Call the fixture with ``total_pages``/``rows_per_page`` and attach the
+    result to a client with ``api.attach(client)``.
+    """
+
+    class MockNepseAPI:
+        def __init__(self, total_pages=5, rows_per_page=3):
+            self.total_pages = total_pages
+            self.rows_per_page = rows_per_page
+            self.calls = []
+            self.lock = threading.Lock()
+            self.hooks = {}
+
+        def count(self, path):
+            return sum(1 for _, call_path, _ in self.calls if call_path == path)
+
+        def floorsheet_page(self, page):
+            first_id = self.total_pages * self.rows_per_page - page * self.rows_per_page
+            content = [
+                {
+                    "contractId": first_id - i,
+                    "stockSymbol": "NABIL" if (first_id - i) % 2 else "NICA",
+                    "buyerMemberId": str((first_id - i) % 58 + 1),
+                    "sellerMemberId": str((first_id - i) % 41 + 1),
+                    "contractQuantity": 10,
+                    "contractRate": 1200.0,
+                    "contractAmount": 12000.0,
+                    "businessDate": "2024-01-15",
+                }
+                for i in range(self.rows_per_page)
+            ]
+            return {
+                "floorsheets": {
+                    "content": content,
+                    "totalPages": self.total_pages,
+                    "totalElements": self.total_pages * self.rows_per_page,
+                    "size": self.rows_per_page,
+                    "number": page,
+                }
+            }
+
+        def handler(self, request):
+            path = request.url.path
+            page = int(request.url.params.get("page", 0))
+            with self.lock:
+                self.calls.append((request.method, path, page))
+            if path in self.hooks:
+                hooked = self.hooks[path](request)
+                if hooked is not None:
+                    return hooked
+            if path in ("/api/authenticate/prove", "/api/authenticate/refresh-token"):
+                token = dict(mock_token_response, serverTime=int(time.time() * 1000))
+                return httpx.Response(200, json=token)
+            if path == "/api/nots/nepse-data/market-open":
+                return httpx.Response(200, json=mock_market_status)
+            if path == "/api/nots/security":
+                return httpx.Response(200, json=mock_security_list)
+            if path == "/api/nots/nepse-data/floorsheet" or path.startswith(
+                "/api/nots/security/floorsheet/"
+            ):
+                return httpx.Response(200, json=self.floorsheet_page(page))
+            return httpx.Response(200, json={})
+
+        def attach(self, client):
+            transport = httpx.MockTransport(self.handler)
+            if isinstance(client.client, httpx.AsyncClient):
+                client.client = httpx.AsyncClient(transport=transport)
+            else:
+                client.client = httpx.Client(transport=transport)
+            return client
+
+    return MockNepseAPI
+
+
+@pytest.fixture
+def rotating_token_api(mock_nepse_api, mock_token_response):
+    """Mock API issuing a fresh token with fresh salts on every renewal."""
+    from nepse_client.token_manager import TokenParser
+
+    api = mock_nepse_api()
+    api.issued = {}
+    counter = itertools.count(1)
+    lock = threading.Lock()
+    parser = TokenParser()
+
+    def issue(request):
+        n = next(counter)
+        token = dict(
+            mock_token_response,
+            accessToken=f"{n:06d}" + "a" * 194,
+            salt2=100 + n,
+            salt3=300 + 2 * n,
+            salt4=400 + 3 * n,
+            serverTime=int(time.time() * 1000),
+        )
+        access_token, _ = parser.parse_token_response(token)
+        with lock:
+            api.issued[access_token] = tuple(token[f"salt{i}"] for i in range(1, 6))
+        return httpx.Response(200, json=token)
+
+    api.hooks["/api/authenticate/prove"] = issue
+    api.hooks["/api/authenticate/refresh-token"] = issue
+    return api
+
+
 @pytest.fixture
 def mock_httpx_client():
     """Create a mock httpx.Client."""
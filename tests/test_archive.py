@@ -0,0 +1,85 @@
+"""Tests for the floor sheet archive."""
+
+import pytest
+
+from nepse_client.archive import FloorsheetArchive
+from nepse_client.exceptions import NepseDataNotFoundError
+
+
+def make_day(business_date, count=50):
+    """Build ``count`` trades of three symbols for a business date."""
+    return [
+        {
+            "contractId": int(business_date.replace("-", "")) * 1000 + i,
+            "stockSymbol": ["NABIL", "NICA", "SCB"][i % 3],
+            "buyerMemberId": str(i % 7 + 1),
+            "sellerMemberId": str(i % 5 + 1),
+            "contractQuantity": 10,
+            "businessDate": business_date,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Archive of three business dates in 8-row blocks."""
+    archive = FloorsheetArchive(tmp_path, block_rows=8)
+    for day in ("2024-02-28", "2024-03-03", "2024-03-04"):
+        archive.write(make_day(day))
+    return archive
+
+
+def test_archive_round_trip_and_index(archive, tmp_path):
+    """Test a day is partitioned by month and indexed by symbol and contract ID."""
+    assert archive.dates() == ["2024-02-28", "2024-03-03", "2024-03-04"]
+    rows = archive.read("2024-03-03")
+    assert sorted(rows, key=lambda row: row["contractId"]) == make_day("2024-03-03")
+
+    index = FloorsheetArchive(tmp_path).index("2024-03-03")
+    assert (tmp_path / "2024-03" / index["dataFile"]).exists()
+    assert index["contractId"] == [20240303000, 20240303049]
+    assert index["symbols"]["NABIL"] == [0, 17]
+
+    with pytest.raises(NepseDataNotFoundError):
+        archive.index("2024-01-01")
+
+
+def test_archive_query_reads_only_matching_blocks(archive, monkeypatch):
+    """Test queries filter by date range, symbol and broker using the index."""
+    import zlib
+
+    decompressed = []
+    real_decompress = zlib.decompress
+    monkeypatch.setattr(
+        "nepse_client.archive.zlib.decompress",
+        lambda data: decompressed.append(data) or real_decompress(data),
+    )
+
+    march_nabil = list(
+        archive.query(symbol="nabil", start_date="2024-03-01", end_date="2024-03-31")
+    )
+    assert len(march_nabil) == 34
+    assert {row["businessDate"] for row in march_nabil} == {"2024-03-03", "2024-03-04"}
+    # NABIL rows 0-16 span 3 of the 7 blocks of each day
+    assert len(decompressed) == 6
+
+    by_broker = list(archive.query(symbol="NICA", buyer=3))
+    assert by_broker
+    assert all(row["buyerMemberId"] == "3" and row["stockSymbol"] == "NICA" for row in by_broker)
+    assert list(archive.query(symbol="UNKNOWN")) == []
+
+
+def test_archive_rewrite_replaces_generation(archive, tmp_path):
+    """Test rewriting a date commits through the index and refreshes cached indexes."""
+    reader = FloorsheetArchive(tmp_path)
+    assert reader.index("2024-03-04")["rows"] == 50
+
+    data_path = archive.write(make_day("2024-03-04", count=20))
+
+    assert sorted(path.name for path in data_path.parent.glob("2024-03-04*.data")) == [
+        data_path.name
+    ]
+    assert reader.index("2024-03-04")["dataFile"] == data_path.name
+    assert reader.read("2024-03-04") == archive.read("2024-03-04")
+    assert len(reader.read("2024-03-04")) == 20
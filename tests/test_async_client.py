@@ -1,6 +1,7 @@
 # tests/test_async_client.py
 """Tests for the AsyncNepse client class."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import httpx
@@ -28,3 +29,224 @@ def mock_httpx_async_client():
     """Create a mock httpx.AsyncClient."""
     mock_client = MagicMock(spec=httpx.AsyncClient)
     return mock_client
+
+
+@pytest.mark.asyncio
+async def test_keep_alive_pool_limits():
+    """Test async keep_alive mode keeps connections open with custom pool limits."""
+    from nepse_client import AsyncNepseClient
+
+    limits = httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=30.0)
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200, json={})
+
+    async with AsyncNepseClient(keep_alive=True, limits=limits) as client:
+        assert client.limits is limits
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        await client.requestGETAPI(
+            "/api/nots/nepse-data/market-open", include_authorization_headers=False
+        )
+
+    assert sent[0].headers["Connection"] == "keep-alive"
+
+
+def test_reinit_closes_previous_client():
+    """Test replacing the HTTP client closes the previous one, with or without a loop."""
+    from nepse_client import AsyncNepseClient
+
+    client = AsyncNepseClient()
+    previous = client.client
+    client.setTLSVerification(False)
+    assert previous.is_closed
+
+    async def replace_in_loop():
+        current = client.client
+        client.setTLSVerification(True)
+        await client.close()
+        return current
+
+    assert asyncio.run(replace_in_loop()).is_closed
+    assert client.client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_aiter_floorsheet_streams_rows(mock_nepse_api):
+    """Test the bounded iterator yields every row, ordered or not."""
+    from nepse_client import AsyncNepseClient
+
+    api = mock_nepse_api(total_pages=10, rows_per_page=3)
+    client = api.attach(AsyncNepseClient())
+
+    ordered = [row["contractId"] async for row in client.aiter_floorsheet(concurrency=3)]
+    unordered = [
+        row["contractId"] async for row in client.aiter_floorsheet(concurrency=3, ordered=False)
+    ]
+
+    assert ordered == list(range(30, 0, -1))
+    assert sorted(unordered, reverse=True) == ordered
+
+
+@pytest.mark.asyncio
+async def test_aiter_floorsheet_stops_when_consumer_stops(mock_nepse_api):
+    """Test breaking out of the iterator does not download the remaining pages."""
+    from nepse_client import AsyncNepseClient
+
+    api = mock_nepse_api(total_pages=50, rows_per_page=2)
+    client = api.attach(AsyncNepseClient())
+
+    rows = client.aiter_floorsheet(concurrency=2)
+    async for row in rows:
+        if row["contractId"] <= 95:
+            break
+    await rows.aclose()
+
+    assert api.count("/api/nots/nepse-data/floorsheet") <= 6
+
+
+@pytest.mark.asyncio
+async def test_incremental_floor_sheet_stops_at_mark(mock_nepse_api):
+    """Test async incremental mode returns only the new trades."""
+    from nepse_client import AsyncNepseClient
+
+    api = mock_nepse_api(total_pages=20, rows_per_page=5)
+    client = api.attach(AsyncNepseClient())
+
+    result = await client.getFloorSheet(since_contract_id=93)
+    assert [row["contractId"] for row in result["content"]] == list(range(100, 93, -1))
+    assert result["last_contract_id"] == 100
+    # Rows 93-91 are on the second page; nothing after it is requested
+    assert api.count("/api/nots/nepse-data/floorsheet") == 2
+
+
+@pytest.mark.asyncio
+async def test_columnar_floor_sheet(mock_nepse_api):
+    """Test async columnar mode streams pages and rejects incremental mode."""
+    from nepse_client import AsyncNepseClient, FloorSheetColumns
+    from nepse_client.exceptions import NepseValidationError
+
+    api = mock_nepse_api(total_pages=4, rows_per_page=5)
+    client = api.attach(AsyncNepseClient())
+
+    columns = await client.getFloorSheet(columnar=True)
+    assert isinstance(columns, FloorSheetColumns)
+    assert list(columns["contractId"]) == list(range(20, 0, -1))
+    company = await client.getFloorSheetOf("NABIL", columnar=True)
+    assert company.to_rows() == await client.getFloorSheetOf("NABIL")
+
+    with pytest.raises(NepseValidationError):
+        await client.getFloorSheet(columnar=True, since_contract_id=5)
+    with pytest.raises(NepseValidationError):
+        await client.getFloorSheetOf("NABIL", columnar=True, since_contract_id=5)
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_refreshed_once_across_tasks(rotating_token_api):
+    """Test 64 tasks rejected with the same token trigger a single renewal."""
+    import asyncio
+
+    from nepse_client import AsyncNepseClient
+
+    api = rotating_token_api
+    # Without coalescing every task really sends the rejected request
+    client = api.attach(AsyncNepseClient(coalesce_requests=False))
+    revoked = await client.token_manager.getAccessToken()
+
+    def reject_revoked(request):
+        if request.headers["Authorization"] == f"Salter {revoked}":
+            return httpx.Response(401, json={"message": "Token expired"})
+        return None
+
+    api.hooks["/api/nots/security"] = reject_revoked
+    results = await asyncio.gather(*(client.requestGETAPI("/api/nots/security") for _ in range(64)))
+
+    assert all(results)
+    assert len(api.issued) == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_gets_are_coalesced(mock_nepse_api):
+    """Test concurrent identical GETs share one upstream call."""
+    import asyncio
+
+    from nepse_client import AsyncNepseClient
+
+    api = mock_nepse_api()
+    client = api.attach(AsyncNepseClient())
+    await client.token_manager.getAccessToken()
+    client.coalesce_stats.update(upstream=0, coalesced=0)
+
+    statuses = await asyncio.gather(*(client.getMarketStatus() for _ in range(20)))
+    securities = await asyncio.gather(*(client.getSecurityList() for _ in range(20)))
+
+    assert all(status == statuses[0] for status in statuses)
+    assert all(security == securities[0] for security in securities)
+    assert api.count("/api/nots/nepse-data/market-open") == 1
+    assert api.count("/api/nots/security") == 1
+    assert client.coalesce_stats == {"upstream": 2, "coalesced": 38}
+    assert client._inflight == {}
+
+    # Finished requests are not reused
+    await client.getMarketStatus()
+    assert api.count("/api/nots/nepse-data/market-open") == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesced_waiters_get_separate_results(mock_nepse_api):
+    """Test a waiter modifying its result does not change the others."""
+    import asyncio
+
+    from nepse_client import AsyncNepseClient
+
+    api = mock_nepse_api()
+    client = api.attach(AsyncNepseClient())
+    await client.token_manager.getAccessToken()
+
+    first, second = await asyncio.gather(client.getSecurityList(), client.getSecurityList())
+    assert api.count("/api/nots/security") == 1
+    assert first == second
+
+    expected = [dict(security) for security in second]
+    first[0]["symbol"] = "CHANGED"
+    first.clear()
+    assert second == expected
+
+
+@pytest.mark.asyncio
+async def test_coalesced_waiters_survive_cancellation_and_share_errors(mock_nepse_api):
+    """Test cancelling one waiter keeps the call alive and errors reach every waiter."""
+    import asyncio
+
+    from nepse_client import AsyncNepseClient
+    from nepse_client.exceptions import NepseServerError
+
+    api = mock_nepse_api()
+    client = api.attach(AsyncNepseClient())
+    await client.token_manager.getAccessToken()
+    upstream = client.coalesce_stats["upstream"]
+    release = asyncio.Event()
+
+    async def slow(request):
+        await release.wait()
+        return httpx.Response(200, json={"isOpen": "OPEN"})
+
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(slow))
+    first = asyncio.ensure_future(client.getMarketStatus())
+    second = asyncio.ensure_future(client.getMarketStatus())
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == {"isOpen": "OPEN"}
+    assert first.cancelled()
+
+    client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(503, json={}))
+    )
+    results = await asyncio.gather(
+        *(client.getMarketStatus() for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, NepseServerError) for result in results)
+    assert client.coalesce_stats["upstream"] == upstream + 2
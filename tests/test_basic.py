@@ -78,3 +78,35 @@ def test_imports():
     assert NepseError is not None
     assert NepseClientError is not None
     assert NepseServerError is not None
+
+
+def test_import_is_lazy():
+    """Test importing the package does not load the clients or their dependencies."""
+    import subprocess
+    import sys
+
+    script = (
+        "import sys, nepse_client\n"
+        "from nepse_client import NepseError\n"
+        "heavy = ['httpx', 'tqdm', 'pywasm', 'nepse_client.sync_client']\n"
+        "print(nepse_client.__name__, [name for name in heavy if name in sys.modules])\n"
+        "nepse_client.NepseClient\n"
+        "print('httpx' in sys.modules, 'tqdm' in sys.modules)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert output.splitlines() == ["nepse_client []", "True False"]
+
+
+def test_lazy_attributes():
+    """Test lazily loaded names resolve to the submodule objects."""
+    import nepse_client
+    from nepse_client.sync_client import NepseClient as SyncClient
+
+    assert nepse_client.NepseClient is SyncClient
+    assert "AsyncNepseClient" in dir(nepse_client)
+    assert set(nepse_client.__all__) <= set(dir(nepse_client))
+    with pytest.raises(AttributeError):
+        nepse_client.DoesNotExist
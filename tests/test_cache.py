@@ -0,0 +1,238 @@
+# tests/test_cache.py
+"""Tests for the response cache and market hours policy."""
+
+from datetime import date, datetime
+
+import httpx
+import pytest
+
+from nepse_client import AsyncNepseClient, MarketHoursPolicy, NepseClient, ResponseCache
+from nepse_client.client import load_config_file
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+class FakeServerClock:
+    """Server clock stopped at a given exchange time."""
+
+    def __init__(self, now):
+        """Stop the clock at ``now``."""
+        self.current = now
+
+    def now(self):
+        """Return the stopped exchange time."""
+        return self.current
+
+
+@pytest.fixture
+def cache():
+    """Response cache bound to the packaged endpoint table, on a fake clock."""
+    cache = ResponseCache(time_function=FakeClock())
+    cache.bind(load_config_file("API_ENDPOINTS.json"))
+    return cache
+
+
+def test_endpoint_names(cache):
+    """Test URLs resolve to the most specific endpoint of API_ENDPOINTS.json."""
+    assert cache.endpoint("/api/nots/market-summary/") == "summary_url"
+    assert cache.endpoint("/api/nots") == "nepse_subindices_url"
+    assert cache.endpoint("/api/nots/security?nonDelisted=true") == "security_list_url"
+    assert cache.endpoint("/api/nots/security/floorsheet/131?size=500") == "company_floorsheet"
+    assert cache.endpoint("/api/nots/application/reports/131") == "company-financial"
+    assert cache.endpoint("/api/nots/holiday/list?year=2024") == "holiday-list"
+    assert cache.endpoint("/api/authenticate/prove") is None
+    assert cache.ttl("/api/authenticate/prove") == 0
+    assert cache.ttl("/api/nots/nepse-data/floorsheet?size=500") == 0
+
+
+def test_unknown_urls_below_an_endpoint_are_not_cached(cache):
+    """Test bare endpoint paths such as /api/nots do not lend their TTL to unknown URLs."""
+    assert cache.ttl("/api/nots") > 0
+    assert cache.endpoint("/api/nots/unknown/thing") is None
+    assert cache.ttl("/api/nots/unknown/thing") == 0
+    assert cache.endpoint("/api/nots?page=1") == "nepse_subindices_url"
+    assert cache.endpoint("/api/nots/nepse-data/marketdepth/131") == "market-depth"
+    assert cache.endpoint("/api/nots/security/131") == "company_details"
+
+
+def test_ttl_expiry(cache):
+    """Test entries are served until their TTL passes."""
+    cache.put("summary", b"{}", ttl=10)
+
+    cache.time_function.now = 9.9
+    assert cache.get("summary") == b"{}"
+    cache.time_function.now = 10.0
+    assert cache.get("summary") is None
+
+    assert cache.stats == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "expired": 1,
+        "entries": 0,
+        "bytes": 0,
+    }
+
+
+def test_lru_eviction_by_size():
+    """Test least recently used bodies are evicted beyond max_bytes."""
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", b"aaaa", ttl=60)
+    cache.put("b", b"bbbb", ttl=60)
+    cache.get("a")
+    cache.put("c", b"cccc", ttl=60)
+    cache.put("huge", b"x" * 11, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("c") == b"cccc"
+    assert cache.get("huge") is None
+    assert cache.size == 8
+    assert cache.stats["evictions"] == 1
+
+
+def test_sync_client_reuses_responses(mock_nepse_api, cache):
+    """Test cached GETs skip the network and return independent copies."""
+    api = mock_nepse_api()
+    client = api.attach(NepseClient(response_cache=cache))
+
+    first = client.getSecurityList()
+    first.clear()
+    second = client.getSecurityList()
+    client.getSecurityList()
+
+    assert second
+    assert api.count("/api/nots/security") == 1
+    assert cache.stats["hits"] == 2
+
+    cache.time_function.now = 3600
+    client.getSecurityList()
+    assert api.count("/api/nots/security") == 2
+
+
+def test_uncached_endpoints_always_hit_network(mock_nepse_api, cache):
+    """Test endpoints without a TTL are not cached."""
+    api = mock_nepse_api()
+    cache.ttls["nepse_open_url"] = 0
+    client = api.attach(NepseClient(response_cache=cache))
+
+    client.getMarketStatus()
+    client.getMarketStatus()
+
+    assert api.count("/api/nots/nepse-data/market-open") == 2
+    assert len(cache) == 0
+
+
+def test_errors_are_not_cached(mock_nepse_api, cache):
+    """Test failed responses are not stored."""
+    from nepse_client.exceptions import NepseServerError
+
+    api = mock_nepse_api()
+    api.hooks["/api/nots/market-summary/"] = lambda request: httpx.Response(503, json={})
+    client = api.attach(NepseClient(response_cache=cache))
+
+    with pytest.raises(NepseServerError):
+        client.getSummary()
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_cache(mock_nepse_api, cache):
+    """Test the async client reads entries stored by a sync client."""
+    api = mock_nepse_api()
+    sync_client = api.attach(NepseClient(response_cache=cache))
+    async_client = api.attach(AsyncNepseClient(response_cache=cache))
+    status = sync_client.getMarketStatus()
+
+    assert await async_client.getMarketStatus() == status
+    assert api.count("/api/nots/nepse-data/market-open") == 1
+
+
+def test_market_hours_schedule():
+    """Test sessions follow the Sunday-Thursday schedule and known holidays."""
+    policy = MarketHoursPolicy(holidays=["2024-01-21"])
+
+    assert policy.isLive(datetime(2024, 1, 18, 14, 0))
+    assert policy.isLive(datetime(2024, 1, 18, 15, 10))  # end-of-day figures settling
+    assert not policy.isLive(datetime(2024, 1, 18, 16, 0))
+    assert not policy.isLive(datetime(2024, 1, 19, 12, 0))  # Friday
+    # Thursday evening -> Monday, as Sunday is a holiday
+    assert policy.nextOpen(datetime(2024, 1, 18, 16, 0)) == datetime(2024, 1, 22, 10, 30)
+    assert policy.nextOpen(datetime(2024, 1, 22, 9, 0)) == datetime(2024, 1, 22, 10, 30)
+
+    thursday_night = datetime(2024, 1, 18, 22, 0)
+    assert policy.ttl("summary_url", 10, thursday_night) == (3 * 24 + 12.5) * 3600
+    assert policy.ttl("nepse_open_url", 10, thursday_night) == 3600
+    assert policy.ttl("company-news", 300, thursday_night) == 300
+    assert policy.ttl("floor_sheet", 0, thursday_night) == 0
+    assert policy.ttl("summary_url", 10, datetime(2024, 1, 18, 12, 0)) == 10
+
+
+def test_market_status_corrects_calendar():
+    """Test holidays, unscheduled closures and sessions are learned from responses."""
+    policy = MarketHoursPolicy()
+    policy.observeHolidays([{"holidayDate": "2024-01-23"}, {"description": "no date"}])
+    assert not policy.isTradingDay(date(2024, 1, 23))
+
+    # Still reporting Wednesday's session at noon on Thursday: no session today
+    thursday_noon = datetime(2024, 1, 18, 12, 0)
+    status = {"isOpen": "CLOSE", "asOf": "2024-01-17T15:00:00"}
+    assert not policy.observeMarketStatus(status, datetime(2024, 1, 18, 10, 40))
+    assert policy.isLive(thursday_noon)
+    assert not policy.observeMarketStatus(status, thursday_noon)
+    assert not policy.isLive(thursday_noon)
+
+    # A special session on a Saturday
+    saturday = datetime(2024, 1, 20, 11, 0)
+    assert policy.observeMarketStatus({"isOpen": "OPEN", "asOf": "2024-01-20T11:00:00"}, saturday)
+    assert policy.isLive(saturday)
+
+
+def test_closed_market_serves_frozen_data(mock_nepse_api):
+    """Test market data fetched after the close is reused until the next open."""
+    clock = FakeClock()
+    cache = ResponseCache(time_function=clock, policy=MarketHoursPolicy())
+    api = mock_nepse_api()
+    closed = {"id": 1, "isOpen": "CLOSE", "asOf": "2024-01-18T15:00:00"}
+    api.hooks["/api/nots/nepse-data/market-open"] = lambda request: httpx.Response(200, json=closed)
+    client = api.attach(NepseClient(response_cache=cache))
+    cache.clock = FakeServerClock(datetime(2024, 1, 19, 20, 0))  # Friday night
+
+    client.getSummary()
+    client.getDailyNepseIndexGraph()
+    clock.now = 36 * 3600
+    client.getSummary()
+    client.getDailyNepseIndexGraph()
+
+    assert api.count("/api/nots/market-summary/") == 1
+    assert api.count("/api/nots/graph/index/58") == 1
+
+    # Sunday's session
+    clock.now = 38.5 * 3600 + 1
+    client.getSummary()
+    assert api.count("/api/nots/market-summary/") == 2
+
+
+def test_unscheduled_session_discards_frozen_data(mock_nepse_api, mock_market_status):
+    """Test an open market status drops responses kept until the next open."""
+    cache = ResponseCache(time_function=FakeClock(), policy=MarketHoursPolicy())
+    api = mock_nepse_api()
+    client = api.attach(NepseClient(response_cache=cache))
+    cache.clock = FakeServerClock(datetime(2024, 1, 20, 11, 0))  # Saturday
+    client.getSummary()
+    assert len(cache) == 1
+
+    cache.observe("/api/nots/nepse-data/market-open", mock_market_status)  # isOpen: OPEN
+    client.getSummary()
+
+    assert api.count("/api/nots/market-summary/") == 2
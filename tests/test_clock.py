@@ -0,0 +1,65 @@
+"""Tests for the server clock."""
+
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+from nepse_client.clock import NEPAL_TZ, ServerClock
+
+
+def test_observe_uses_round_trip_midpoint():
+    """Test samples are taken at the RTT midpoint and smoothed."""
+    clock = ServerClock(smoothing=0.5)
+    clock.observe(server_time=1010.0, sent_at=1000.0, received_at=1002.0)
+    assert clock.offset == 9.0
+    assert clock.rtt == 2.0
+
+    clock.observe(server_time=1021.0, sent_at=1010.0, received_at=1010.0)
+    assert clock.offset == 10.0
+    assert abs(clock.time() - (time.time() + 10.0)) < 0.1
+
+
+def test_date_header_only_until_precise_sample():
+    """Test the coarse Date header is ignored once serverTime samples exist."""
+    clock = ServerClock()
+    clock.observeDateHeader("Mon, 15 Jan 2024 05:00:00 GMT", 1705294700.0, 1705294700.0)
+    assert clock.offset == 100.5
+
+    clock.observe(1705294800.0, 1705294800.0, 1705294800.0)
+    clock.observeDateHeader("Mon, 15 Jan 2024 06:00:00 GMT", 1705294800.0, 1705294800.0)
+    clock.observeDateHeader("not a date", 0.0, 0.0)
+    assert clock.offset == 0.0
+
+
+def test_today_uses_exchange_time_zone():
+    """Test the business date rolls over at midnight Nepal time."""
+    clock = ServerClock()
+    # 18:20 UTC is 00:05 the next day in Nepal
+    utc = datetime(2024, 1, 15, 18, 20, tzinfo=timezone.utc).timestamp()
+    clock.offset = utc - time.time()
+    assert clock.today().isoformat() == "2024-01-16"
+    assert clock.now().tzinfo is None
+    assert NEPAL_TZ.utcoffset(None).total_seconds() == 5.75 * 3600
+
+
+def test_token_validity_follows_server_clock(mock_nepse_api, mock_token_response):
+    """Test a server clock behind the local clock does not expire fresh tokens."""
+    from nepse_client import NepseClient
+
+    api = mock_nepse_api()
+    skewed = {"serverTime": 0}
+
+    def prove(request):
+        skewed["serverTime"] = int((time.time() - 120) * 1000)
+        return httpx.Response(200, json=dict(mock_token_response, **skewed))
+
+    api.hooks["/api/authenticate/prove"] = prove
+    client = api.attach(NepseClient())
+
+    for _ in range(3):
+        client.getSecurityList()
+
+    assert api.count("/api/authenticate/prove") == 1
+    assert abs(client.clock.offset + 120) < 1
+    assert client.token_manager.isTokenValid()
@@ -0,0 +1,71 @@
+"""Tests for the floor sheet helpers."""
+
+from array import array
+
+import pytest
+
+from nepse_client.floorsheet import FloorSheetColumns
+
+
+def make_rows(count):
+    """Build ``count`` records with numeric, interned and missing fields."""
+    return [
+        {
+            "contractId": 1000 - i,
+            "stockSymbol": "".join(["NA", "BIL"]) if i % 2 else "NICA",
+            "buyerMemberId": str(i % 58 + 1),
+            "contractQuantity": 10 + i,
+            "contractRate": 1200.5,
+            "contractType": None,
+        }
+        for i in range(count)
+    ]
+
+
+def test_columns_use_typed_buffers_and_round_trip():
+    """Test numeric fields are stored in arrays and rows rebuild unchanged."""
+    rows = make_rows(10)
+    columns = FloorSheetColumns(rows)
+
+    assert len(columns) == 10
+    assert columns["contractId"].typecode == "q"
+    assert columns["contractRate"].typecode == "d"
+    assert isinstance(columns["stockSymbol"], list)
+    assert columns["stockSymbol"][1] is columns["stockSymbol"][3]
+    assert columns.to_rows() == rows
+
+
+def test_columns_promote_and_demote_on_mixed_types():
+    """Test int columns widen to float and fall back to lists on None."""
+    columns = FloorSheetColumns([{"rate": 1, "qty": 5}, {"rate": 2.5, "qty": None}])
+    columns.append({"rate": 3, "qty": 7, "extra": "x"})
+
+    assert columns["rate"].typecode == "d"
+    assert list(columns["rate"]) == [1.0, 2.5, 3.0]
+    assert columns["qty"] == [5, None, 7]
+    assert columns["extra"] == [None, None, "x"]
+
+
+def test_columns_to_numpy_is_zero_copy():
+    """Test numeric NumPy columns share memory with the arrays."""
+    np = pytest.importorskip("numpy")
+
+    columns = FloorSheetColumns(make_rows(4))
+    converted = columns.to_numpy()
+
+    assert converted["contractId"].dtype == np.int64
+    assert np.shares_memory(converted["contractId"], np.frombuffer(columns["contractId"]))
+    assert converted["stockSymbol"].dtype == object
+
+
+def test_columns_are_smaller_than_dicts():
+    """Test the columnar layout uses far less memory than a list of dicts."""
+    import sys
+
+    rows = make_rows(1000)
+    columns = FloorSheetColumns(rows)
+
+    dict_size = sys.getsizeof(rows) + sum(sys.getsizeof(row) for row in rows)
+    column_size = sum(sys.getsizeof(column) for column in columns.columns.values())
+    assert column_size * 5 < dict_size
+    assert isinstance(columns["contractQuantity"], array)
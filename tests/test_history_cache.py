@@ -0,0 +1,83 @@
+# tests/test_history_cache.py
+"""Tests for the persistent cache of historical responses."""
+
+from datetime import date
+
+import pytest
+
+from nepse_client import HistoryCache, NepseClient
+from nepse_client.client import load_config_file
+
+
+@pytest.fixture
+def history(tmp_path):
+    """History cache in a temporary directory, bound to the packaged endpoint table."""
+    history = HistoryCache(tmp_path / "history.sqlite3")
+    history.bind(load_config_file("API_ENDPOINTS.json"))
+    yield history
+    history.close()
+
+
+def test_immutable_requests(history):
+    """Test only requests for dates before today are immutable."""
+    today = date(2024, 1, 16)
+
+    assert history.isImmutable(
+        "/api/nots/nepse-data/today-price?size=500&businessDate=2024-01-15", today
+    )
+    assert history.isImmutable(
+        "/api/nots/security/floorsheet/131?businessDate=2024-01-15&size=500"
+        "&sort=contractid,desc&page=3",
+        today,
+    )
+    assert history.isImmutable(
+        "/api/nots/market/history/security/131?size=500&startDate=2023-01-15&endDate=2024-01-15",
+        today,
+    )
+    assert not history.isImmutable(
+        "/api/nots/nepse-data/trading-average?businessDate=2024-01-16&nDays=180", today
+    )
+    assert not history.isImmutable("/api/nots/nepse-data/trading-average?nDays=180", today)
+    assert not history.isImmutable("/api/nots/nepse-data/today-price?size=500", today)
+    assert not history.isImmutable("/api/nots/market-summary/?businessDate=2024-01-15", today)
+    assert not history.isImmutable(
+        "/api/nots/nepse-data/trading-average?businessDate=yesterday", today
+    )
+
+
+def test_content_addressed_and_persistent(tmp_path, history):
+    """Test identical bodies are stored once and survive reopening the database."""
+    history.put("GET /a?businessDate=2024-01-13", b"[]")
+    history.put("GET /a?businessDate=2024-01-14", b"[]")
+    history.put("POST /b?businessDate=2024-01-14", b'{"x": 1}')
+    history.close()
+
+    reopened = HistoryCache(tmp_path / "history.sqlite3")
+    try:
+        assert reopened.get("GET /a?businessDate=2024-01-14") == b"[]"
+        assert reopened.get("GET /b?businessDate=2024-01-14") is None
+        assert "POST /b?businessDate=2024-01-14" in reopened
+        assert len(reopened) == 3
+        stats = reopened.stats
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["blobs"] == 2
+        assert stats["bytes"] == 10
+    finally:
+        reopened.close()
+
+
+def test_clients_share_past_responses(mock_nepse_api, tmp_path):
+    """Test a past-date query reaches the network once across client processes."""
+    path = tmp_path / "history.sqlite3"
+    api = mock_nepse_api()
+    for _ in range(2):
+        history = HistoryCache(path)
+        client = api.attach(NepseClient(history_cache=history))
+        client.getTradingAverage(business_date="2024-01-15")
+        client.getPriceVolumeHistory(business_date="2024-01-15")
+        client.getTradingAverage(business_date=client.clock.today().isoformat())
+        history.close()
+
+    assert api.count("/api/nots/nepse-data/trading-average") == 3
+    assert api.count("/api/nots/nepse-data/today-price") == 1
@@ -0,0 +1,92 @@
+# tests/test_json_decoder.py
+"""Tests for the pluggable JSON decoders."""
+
+import sys
+import types
+
+import httpx
+import pytest
+
+from nepse_client import NepseClient
+from nepse_client.exceptions import NepseValidationError
+from nepse_client.json_decoder import get_json_decoder
+
+
+def test_falls_back_to_stdlib(monkeypatch):
+    """Test the standard library is used when no faster backend is installed."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+
+    name, decode = get_json_decoder()
+
+    assert name == "json"
+    assert decode(b'{"a": [1, 2.5, "\xc3\xa9"]}') == {"a": [1, 2.5, "é"]}
+    with pytest.raises(ValueError):
+        decode(b"<html>")
+
+
+def test_msgspec_errors_are_value_errors(monkeypatch):
+    """Test msgspec decode errors surface as ValueError like the other backends."""
+
+    class DecodeError(Exception):
+        pass
+
+    class Decoder:
+        def decode(self, content):
+            if content.startswith(b"<"):
+                raise DecodeError("invalid")
+            return {"ok": True}
+
+    fake = types.ModuleType("msgspec")
+    fake.DecodeError = DecodeError
+    fake.json = types.SimpleNamespace(Decoder=Decoder)
+    monkeypatch.setitem(sys.modules, "msgspec", fake)
+
+    name, decode = get_json_decoder("msgspec")
+
+    assert name == "msgspec"
+    assert decode(b"{}") == {"ok": True}
+    with pytest.raises(ValueError):
+        decode(b"<html>")
+
+
+def test_unknown_or_missing_backend(monkeypatch):
+    """Test invalid names are rejected and missing backends name the package."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+
+    with pytest.raises(NepseValidationError):
+        get_json_decoder("simplejson")
+    with pytest.raises(ImportError, match="pip install orjson"):
+        get_json_decoder("orjson")
+
+
+def test_client_decodes_response_bytes():
+    """Test responses are decoded from bytes with the configured decoder."""
+    seen = []
+
+    def decode(content):
+        seen.append(content)
+        return {"decoded": len(content)}
+
+    client = NepseClient(json_decoder=decode)
+    client.client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b'{"x": 1}'))
+    )
+
+    result = client.requestGETAPI("/api/nots/nepse-data/market-open", False)
+
+    assert result == {"decoded": 8}
+    assert seen == [b'{"x": 1}']
+    assert client.json_decoder_name == "decode"
+    assert client.decode_stats["responses"] == 1
+    assert client.decode_stats["bytes"] == 8
+
+
+def test_non_json_body_falls_back_to_text():
+    """Test bodies that are not JSON are returned as stripped text."""
+    client = NepseClient(json_decoder="json")
+    client.client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, text=" plain \n"))
+    )
+
+    assert client.requestGETAPI("/api/nots/nepse-data/market-open", False) == "plain"
@@ -0,0 +1,207 @@
+# tests/test_reference_cache.py
+"""Tests for the persistent reference data cache."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from nepse_client import AsyncNepseClient, NepseClient, ReferenceCache
+from nepse_client.exceptions import NepseServerError
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        """Start the clock at a fixed epoch time."""
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+def new_listing_api(mock_nepse_api, mock_security_list):
+    """Mock API whose security list gains a listing once ``api.listed`` is set."""
+    api = mock_nepse_api()
+    api.listed = False
+
+    def securities(request):
+        listing = [{"id": 99, "symbol": "NEWCO", "securityName": "New Co", "activeStatus": "A"}]
+        return httpx.Response(200, json=mock_security_list + (listing if api.listed else []))
+
+    api.hooks["/api/nots/security"] = securities
+    return api
+
+
+def test_store_and_reload(tmp_path):
+    """Test datasets survive a new process and unreadable files are ignored."""
+    clock = FakeClock()
+    cache = ReferenceCache(tmp_path, refresh_interval=60, time_function=clock)
+    cache.put("company_list", [{"symbol": "NABIL"}])
+    (tmp_path / "security_list.json").write_text("{not json")
+
+    reloaded = ReferenceCache(tmp_path, refresh_interval=60, time_function=clock)
+    entry = reloaded.get("company_list")
+
+    assert entry.data == [{"symbol": "NABIL"}]
+    assert entry.fetched_at == clock.now
+    assert reloaded.get("security_list") is None
+    assert not reloaded.isStale(entry)
+    clock.now += 60
+    assert reloaded.isStale(entry)
+
+
+def test_fresh_client_loads_from_disk(mock_nepse_api, tmp_path):
+    """Test a new client resolves symbols without downloading the security list."""
+    api = mock_nepse_api()
+    first = api.attach(NepseClient(reference_cache=ReferenceCache(tmp_path)))
+    first.getSecurityIDKeyMap()
+
+    second = api.attach(NepseClient(reference_cache=ReferenceCache(tmp_path)))
+    second.getCompanyDetails("NABIL")
+
+    assert api.count("/api/nots/security") == 1
+    assert second.getSecurityIDKeyMap()["NICA"] == 2
+
+
+def test_background_refresh_picks_up_listings(mock_nepse_api, mock_security_list, tmp_path):
+    """Test stale data is served while a background refresh fetches new listings."""
+    clock = FakeClock()
+    api = new_listing_api(mock_nepse_api, mock_security_list)
+    cache = ReferenceCache(tmp_path, refresh_interval=3600, time_function=clock)
+    client = api.attach(NepseClient(reference_cache=cache))
+    assert "NEWCO" not in client.getSecurityIDKeyMap()
+
+    api.listed = True
+    clock.now += 3600
+    client.getSecurityList()
+    for thread in threading.enumerate():
+        if thread.name == "nepse-refresh-security_list":
+            thread.join()
+
+    assert api.count("/api/nots/security") == 2
+    assert client.getSecurityIDKeyMap()["NEWCO"] == 99
+    assert not cache.isStale(cache.get("security_list"))
+
+
+def test_blocking_refresh(mock_nepse_api, mock_security_list, tmp_path):
+    """Test stale data is refetched before returning without background refresh."""
+    clock = FakeClock()
+    api = new_listing_api(mock_nepse_api, mock_security_list)
+    cache = ReferenceCache(tmp_path, background_refresh=False, time_function=clock)
+    client = api.attach(NepseClient(reference_cache=cache))
+    client.getSecurityList()
+
+    api.listed = True
+    clock.now += cache.refresh_interval
+
+    assert len(client.getSecurityList()) == len(mock_security_list) + 1
+
+
+@pytest.mark.asyncio
+async def test_async_background_refresh(mock_nepse_api, mock_security_list, tmp_path):
+    """Test the async client refreshes stale data in a background task."""
+    clock = FakeClock()
+    api = new_listing_api(mock_nepse_api, mock_security_list)
+    cache = ReferenceCache(tmp_path, refresh_interval=3600, time_function=clock)
+    client = api.attach(AsyncNepseClient(reference_cache=cache))
+    await client.getSecurityIDKeyMap()
+
+    api.listed = True
+    clock.now += 3600
+    assert len(await client.getSecurityList()) == len(mock_security_list)
+    await asyncio.gather(*client._refresh_tasks)
+
+    assert (await client.getSecurityIDKeyMap())["NEWCO"] == 99
+    assert api.count("/api/nots/security") == 2
+
+
+def test_key_map_refreshes_stale_list(mock_nepse_api, mock_security_list, tmp_path):
+    """Test a long-running client that only uses the symbol map still picks up listings."""
+    clock = FakeClock()
+    api = new_listing_api(mock_nepse_api, mock_security_list)
+    cache = ReferenceCache(tmp_path, background_refresh=False, time_function=clock)
+    client = api.attach(NepseClient(reference_cache=cache))
+    assert "NEWCO" not in client.getSecurityIDKeyMap()
+
+    api.listed = True
+    assert "NEWCO" not in client.getSecurityIDKeyMap()
+    clock.now += cache.refresh_interval
+
+    assert client.getSecurityIDKeyMap()["NEWCO"] == 99
+    assert api.count("/api/nots/security") == 2
+
+
+@pytest.mark.asyncio
+async def test_async_close_cancels_refresh(mock_nepse_api, mock_security_list, tmp_path):
+    """Test closing the async client cancels a background refresh still running."""
+    clock = FakeClock()
+    api = new_listing_api(mock_nepse_api, mock_security_list)
+    cache = ReferenceCache(tmp_path, refresh_interval=3600, time_function=clock)
+    client = api.attach(AsyncNepseClient(reference_cache=cache))
+    await client.getSecurityIDKeyMap()
+
+    started = asyncio.Event()
+
+    async def slow_request(url):
+        started.set()
+        await asyncio.sleep(60)
+
+    client.requestGETAPI = slow_request
+    clock.now += 3600
+    await client.getSecurityIDKeyMap()
+    (task,) = client._refresh_tasks
+    await started.wait()
+    await client.close()
+
+    assert task.cancelled()
+    assert not client._refresh_tasks
+    assert cache.claimRefresh("security_list")
+
+
+def test_failed_refresh_waits_before_retrying(tmp_path):
+    """Test a dataset is not refreshed again until the retry delay after a failure passes."""
+    clock = FakeClock()
+    cache = ReferenceCache(tmp_path, refresh_interval=3600, time_function=clock, retry_delay=60)
+
+    assert cache.claimRefresh("security_list")
+    cache.releaseRefresh("security_list", failed=True)
+    assert not cache.claimRefresh("security_list")
+    clock.now += 60
+    assert cache.claimRefresh("security_list")
+    cache.releaseRefresh("security_list")
+    assert cache.claimRefresh("security_list")
+
+
+@pytest.mark.asyncio
+async def test_async_failed_refresh_is_not_retried_every_call(
+    mock_nepse_api, mock_security_list, tmp_path
+):
+    """Test a failing background refresh is retried only after the retry delay."""
+    clock = FakeClock()
+    api = new_listing_api(mock_nepse_api, mock_security_list)
+    cache = ReferenceCache(tmp_path, refresh_interval=3600, time_function=clock, retry_delay=60)
+    client = api.attach(AsyncNepseClient(reference_cache=cache))
+    await client.getSecurityIDKeyMap()
+
+    attempts = []
+
+    async def failing_request(url):
+        attempts.append(url)
+        raise NepseServerError("Service unavailable", status_code=503)
+
+    client.requestGETAPI = failing_request
+    clock.now += 3600
+    for _ in range(3):
+        assert "NABIL" in await client.getSecurityIDKeyMap()
+        await asyncio.gather(*client._refresh_tasks)
+    assert len(attempts) == 1
+
+    clock.now += 60
+    await client.getSecurityIDKeyMap()
+    await asyncio.gather(*client._refresh_tasks)
+    assert len(attempts) == 2
+    await client.close()
@@ -1,6 +1,7 @@
 # tests/test_async_client.py
 """Tests for the AsyncNepse client class."""
 
+import time
 from unittest.mock import patch
 
 import pytest
@@ -20,3 +21,421 @@ def sync_client_with_mocks(mock_config_files, monkeypatch):
     with patch("nepse_client.sync_client.httpx.Client"):
         client = NepseClient()
         return client
+
+
+def test_connection_close_by_default():
+    """Test requests opt out of connection reuse unless keep_alive is set."""
+    from nepse_client import NepseClient
+
+    client = NepseClient()
+    assert client.headers["Connection"] == "close"
+
+
+def test_construction_does_not_block(monkeypatch):
+    """Test creating a client neither sleeps nor re-reads configuration files."""
+    import time
+
+    from nepse_client import NepseClient
+    from nepse_client.client import _NepseBase
+
+    NepseClient()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unexpected blocking call during construction")
+
+    monkeypatch.setattr(time, "sleep", fail)
+    monkeypatch.setattr(_NepseBase, "_load_json_file", staticmethod(fail))
+
+    client = NepseClient()
+
+    assert client.api_end_points["security_list_url"]
+    assert client.headers["Host"] == "nepalstock.com.np"
+
+
+def test_ssl_context_cached_per_http_version():
+    """Test HTTP/2 and HTTP/1.1 clients never share an SSL context."""
+    from nepse_client.client import get_ssl_context
+
+    assert get_ssl_context(http2=True) is get_ssl_context(http2=True)
+    assert get_ssl_context(http2=True) is not get_ssl_context(http2=False)
+
+
+def test_clients_do_not_share_mutable_config():
+    """Test per-process config caching does not leak changes between clients."""
+    from nepse_client import NepseClient
+
+    first = NepseClient()
+    first.api_end_points["security_list_url"] = "/changed"
+    first.headers["X-Test"] = "1"
+
+    second = NepseClient()
+
+    assert second.api_end_points["security_list_url"] != "/changed"
+    assert "X-Test" not in second.headers
+
+
+def test_user_agents_loaded_once(monkeypatch):
+    """Test the User-Agent pool is read from disk once per process."""
+    from nepse_client import NepseClient
+    from nepse_client.client import _NepseBase, load_user_agents
+
+    client = NepseClient()
+    client.token_manager.getAccessToken = lambda: "abc"
+    load_user_agents()
+    calls = []
+    original = _NepseBase._load_json_file
+
+    def load_json_file(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(_NepseBase, "_load_json_file", staticmethod(load_json_file))
+
+    for _ in range(10):
+        client.getAuthorizationHeaders()
+        client.build_headers()
+
+    assert calls == []
+
+
+def test_user_agent_policies():
+    """Test round-robin cycles through the pool and fixed never changes."""
+    import pytest
+
+    from nepse_client import NepseClient
+    from nepse_client.client import load_user_agents
+    from nepse_client.exceptions import NepseValidationError
+
+    pool = load_user_agents()
+
+    client = NepseClient(user_agent_policy="round_robin")
+    agents = [client.build_headers()["User-Agent"] for _ in range(len(pool))]
+    assert sorted(agents) == sorted(pool)
+
+    client = NepseClient(user_agent_policy="fixed")
+    agents = {client.build_headers("token")["User-Agent"] for _ in range(20)}
+    assert agents == {client.headers["User-Agent"]}
+
+    with pytest.raises(NepseValidationError):
+        NepseClient(user_agent_policy="sticky")
+
+
+def test_authorization_headers_from_template():
+    """Test prebuilt templates only swap in the Authorization value."""
+    from nepse_client import NepseClient
+
+    client = NepseClient(user_agent_policy="fixed")
+    client.token_manager.getAccessToken = lambda: "abc"
+
+    headers = client.getAuthorizationHeaders()
+
+    assert headers == {
+        "Authorization": "Salter abc",
+        "Content-Type": "application/json",
+        **client.headers,
+    }
+    assert "Authorization" not in client.build_headers()
+    assert client.getAuthorizationHeaders() is not headers
+
+
+def test_keep_alive_pool_limits():
+    """Test keep_alive mode keeps connections open with custom pool limits."""
+    import httpx
+
+    from nepse_client import NepseClient
+
+    limits = httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=30.0)
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200, json={})
+
+    with NepseClient(keep_alive=True, limits=limits) as client:
+        assert client.limits is limits
+        client.client = httpx.Client(transport=httpx.MockTransport(handler))
+        client.requestGETAPI("/api/nots/nepse-data/market-open", include_authorization_headers=False)
+
+    assert sent[0].headers["Connection"] == "keep-alive"
+
+
+def test_floor_sheet_thread_pool_keeps_page_order(mock_nepse_api):
+    """Test max_workers fetches every page and keeps them in order."""
+    from nepse_client import NepseClient
+
+    api = mock_nepse_api(total_pages=9, rows_per_page=4)
+    client = api.attach(NepseClient())
+
+    serial = client.getFloorSheet()
+    parallel = client.getFloorSheet(max_workers=4, show_progress=True)
+    pages = client.getFloorSheet(max_workers=4, paginated=True)
+
+    assert parallel == serial
+    assert [row["contractId"] for row in parallel] == list(range(36, 0, -1))
+    assert len(pages) == 9
+    assert [page[0]["contractId"] for page in pages] == list(range(36, 0, -4))
+
+
+def test_token_refreshed_once_across_threads(mock_nepse_api):
+    """Test concurrent callers share a single token refresh."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from nepse_client import NepseClient
+
+    api = mock_nepse_api()
+    api.hooks["/api/authenticate/prove"] = lambda request: time.sleep(0.05)
+    client = api.attach(NepseClient())
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        tokens = list(executor.map(lambda _: client.token_manager.getAccessToken(), range(16)))
+
+    assert len(set(tokens)) == 1
+    assert api.count("/api/authenticate/prove") == 1
+
+
+def test_iter_floorsheet_is_lazy(mock_nepse_api):
+    """Test pages are only requested as the iterator is consumed."""
+    from itertools import islice
+
+    from nepse_client import NepseClient
+
+    api = mock_nepse_api(total_pages=6, rows_per_page=5)
+    client = api.attach(NepseClient())
+
+    rows = client.iter_floorsheet()
+    first = list(islice(rows, 7))
+    assert [row["contractId"] for row in first] == list(range(30, 23, -1))
+    assert api.count("/api/nots/nepse-data/floorsheet") == 2
+
+    pages = list(client.iter_floorsheet(paginated=True, max_workers=3))
+    assert [len(page) for page in pages] == [5] * 6
+
+
+def test_iter_floorsheet_of(mock_nepse_api):
+    """Test the company floor sheet iterator matches getFloorSheetOf."""
+    from nepse_client import NepseClient
+
+    api = mock_nepse_api(total_pages=3, rows_per_page=2)
+    client = api.attach(NepseClient())
+
+    rows = list(client.iter_floorsheet_of("nabil", business_date="2024-01-15"))
+    assert [row["contractId"] for row in rows] == [6, 5, 4, 3, 2, 1]
+    assert client.getFloorSheetOf("NABIL", business_date="2024-01-15") == rows
+
+
+def test_incremental_floor_sheet_stops_at_mark(mock_nepse_api):
+    """Test incremental mode only pages until the known contract ID."""
+    from nepse_client import NepseClient
+
+    api = mock_nepse_api(total_pages=20, rows_per_page=5)
+    client = api.attach(NepseClient())
+
+    result = client.getFloorSheet(since_contract_id=92)
+    assert [row["contractId"] for row in result["content"]] == list(range(100, 92, -1))
+    assert result["last_contract_id"] == 100
+    assert api.count("/api/nots/nepse-data/floorsheet") == 2
+
+    unchanged = client.getFloorSheet(since_contract_id=100)
+    assert unchanged == {"content": [], "last_contract_id": 100}
+
+    company = client.getFloorSheetOf("NABIL", since_contract_id=97)
+    assert company["last_contract_id"] == 100
+    assert len(company["content"]) == 3
+
+
+def test_checkpointed_floor_sheet_resumes(mock_nepse_api, tmp_path):
+    """Test an interrupted checkpointed download only refetches missing pages."""
+    import httpx
+
+    from nepse_client import NepseClient
+    from nepse_client.exceptions import NepseError
+    from nepse_client.floorsheet import FloorSheetCheckpoint
+
+    api = mock_nepse_api(total_pages=8, rows_per_page=3)
+    client = api.attach(NepseClient())
+    path = "/api/nots/nepse-data/floorsheet"
+
+    def fail_page_5(request):
+        if int(request.url.params.get("page", 0)) == 5:
+            return httpx.Response(500, json={"message": "Internal Server Error"})
+        return None
+
+    api.hooks[path] = fail_page_5
+    with pytest.raises(NepseError):
+        client.getFloorSheet(checkpoint_dir=tmp_path)
+
+    checkpoint = FloorSheetCheckpoint(tmp_path, "2024-01-15")
+    assert checkpoint.missing_pages() == [5, 6, 7]
+
+    del api.hooks[path]
+    api.calls.clear()
+    rows = client.getFloorSheet(checkpoint_dir=tmp_path, max_workers=3)
+
+    assert [row["contractId"] for row in rows] == list(range(24, 0, -1))
+    assert sorted(page for _, call_path, page in api.calls if call_path == path) == [0, 5, 6, 7]
+    assert checkpoint.is_complete()
+    assert len(client.getFloorSheet(checkpoint_dir=tmp_path, paginated=True)) == 8
+
+
+def test_columnar_floor_sheet(mock_nepse_api):
+    """Test columnar mode returns the same records as the list of dicts."""
+    from nepse_client import FloorSheetColumns, NepseClient
+    from nepse_client.exceptions import NepseValidationError
+
+    api = mock_nepse_api(total_pages=4, rows_per_page=5)
+    client = api.attach(NepseClient())
+
+    columns = client.getFloorSheet(columnar=True, max_workers=2)
+    assert isinstance(columns, FloorSheetColumns)
+    assert list(columns["contractId"]) == list(range(20, 0, -1))
+    assert columns.to_rows() == client.getFloorSheet()
+
+    company = client.getFloorSheetOf("NABIL", columnar=True)
+    assert len(company) == 20
+
+    with pytest.raises(NepseValidationError):
+        client.getFloorSheet(columnar=True, paginated=True)
+    with pytest.raises(NepseValidationError):
+        client.getFloorSheetOf("NABIL", columnar=True, since_contract_id=5)
+
+
+def test_payload_salts_match_token_under_concurrent_refresh(rotating_token_api):
+    """Test 64 threads never mix salts of one token with the header of another."""
+    import json
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from nepse_client import NepseClient
+
+    api = rotating_token_api
+    client = api.attach(NepseClient())
+    e = client.getPOSTPayloadIDForScrips()
+    salt_index = 3 if e % 10 < 5 else 1
+    mismatches = []
+
+    def check_payload(request):
+        salts = api.issued[request.headers["Authorization"].removeprefix("Salter ")]
+        expected = e + salts[salt_index] * client.clock.today().day - salts[salt_index - 1]
+        if json.loads(request.content)["id"] != expected:
+            mismatches.append(request)
+
+    api.hooks["/api/nots/nepse-data/floorsheet"] = check_payload
+    stop = threading.Event()
+
+    def churn():
+        while not stop.is_set():
+            client.token_manager.update()
+
+    def slow_payload():
+        # Widen the gap between reading the salts and building the header
+        payload = client.getPOSTPayloadID()
+        time.sleep(0.001)
+        return payload
+
+    refresher = threading.Thread(target=churn)
+    refresher.start()
+    try:
+        with ThreadPoolExecutor(max_workers=64) as executor:
+            list(
+                executor.map(
+                    lambda _: client.requestPOSTAPI(
+                        url="/api/nots/nepse-data/floorsheet", payload_generator=slow_payload
+                    ),
+                    range(640),
+                )
+            )
+    finally:
+        stop.set()
+        refresher.join()
+
+    assert len(api.issued) > 2
+    assert mismatches == []
+
+
+def test_rejected_token_refreshed_once_across_threads(rotating_token_api):
+    """Test 64 threads rejected with the same token trigger a single renewal."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    import httpx
+
+    from nepse_client import NepseClient
+
+    api = rotating_token_api
+    client = api.attach(NepseClient())
+    revoked = client.token_manager.getAccessToken()
+    barrier = threading.Barrier(64)
+
+    def reject_revoked(request):
+        if request.headers["Authorization"] == f"Salter {revoked}":
+            barrier.wait(timeout=5)
+            return httpx.Response(401, json={"message": "Token expired"})
+        return None
+
+    api.hooks["/api/nots/security"] = reject_revoked
+    with ThreadPoolExecutor(max_workers=64) as executor:
+        results = list(
+            executor.map(lambda _: client.requestGETAPI("/api/nots/security"), range(64))
+        )
+
+    assert all(results)
+    assert len(api.issued) == 2
+
+
+def test_success_response_builds_no_log_context(monkeypatch):
+    """Test 2xx responses skip the logging context that only errors need."""
+    import httpx
+    import pytest
+
+    from nepse_client import NepseClient
+    from nepse_client.exceptions import NepseClientError
+
+    client = NepseClient()
+    calls = []
+    build = client._buildLogContext
+    monkeypatch.setattr(client, "_buildLogContext", lambda *args: calls.append(args) or build(*args))
+    request = httpx.Request(
+        "POST", "https://nepalstock.com.np/api/x", headers={"Authorization": "Salter secret"}
+    )
+
+    assert client.handle_response(httpx.Response(200, json=[1], request=request)) == [1]
+    assert calls == []
+
+    records = []
+    monkeypatch.setattr(client.logger, "warning", lambda msg, extra: records.append(extra))
+    with pytest.raises(NepseClientError):
+        client.handle_response(
+            httpx.Response(400, json={"error": "bad"}, request=request), {"id": 1, "token": "t"}
+        )
+
+    assert len(calls) == 1
+    assert records[0]["request_headers"]["authorization"] == "***MASKED***"
+    assert records[0]["request_body"] == {"id": 1, "token": "***MASKED***"}
+
+
+def test_checkpointed_floor_sheet_restarts_on_changed_sheet(mock_nepse_api, tmp_path):
+    """Test a checkpoint is discarded when the first contract ID changes, and empty sheets."""
+    import httpx
+
+    from nepse_client import NepseClient
+    from nepse_client.floorsheet import FloorSheetCheckpoint
+
+    api = mock_nepse_api(total_pages=4, rows_per_page=3)
+    client = api.attach(NepseClient())
+    path = "/api/nots/nepse-data/floorsheet"
+    client.getFloorSheet(checkpoint_dir=tmp_path)
+
+    # New trades shift every page while the page count stays the same
+    api.rows_per_page = 2
+    api.calls.clear()
+    rows = client.getFloorSheet(checkpoint_dir=tmp_path, max_workers=2)
+
+    assert [row["contractId"] for row in rows] == list(range(8, 0, -1))
+    assert sorted(page for _, call_path, page in api.calls if call_path == path) == [0, 1, 2, 3]
+    assert FloorSheetCheckpoint(tmp_path, "2024-01-15").fingerprint == {
+        "totalElements": 8,
+        "firstContractId": 8,
+    }
+
+    api.hooks[path] = lambda request: httpx.Response(200, json={})
+    assert client.getFloorSheet(checkpoint_dir=tmp_path) == []
@@ -1,8 +1,11 @@
 # tests/test_token_manager.py
 """Tests for the AsyncNepse client class."""
 
+import time
 from unittest.mock import Mock
 
+import pytest
+
 
 # Helper functions
 def create_mock_token_manager(salts=None):
@@ -18,3 +21,189 @@ def create_mock_token_manager(salts=None):
     mock_manager.update = Mock()
 
     return mock_manager
+
+
+def test_native_index_functions_match_wasm():
+    """Test the Python ports of the css.wasm exports match the WASM module."""
+    import random
+
+    from nepse_client.token_manager import INDEX_FUNCTIONS, TokenParser
+
+    wasm_parser = TokenParser(use_wasm=True)
+    rng = random.Random(0)
+    samples = list(range(-999, 1000)) + [-(2**31), 2**31 - 1]
+    samples += [rng.randint(-(2**31), 2**31 - 1) for _ in range(200)]
+
+    for salt in samples:
+        salts = [rng.randint(0, 99999), salt, rng.randint(0, 99999), 7, 11]
+        for name, function in INDEX_FUNCTIONS.items():
+            assert function(salt) == wasm_parser.index(name, salts), (name, salt)
+
+
+def test_token_parser_without_wasm(mock_token_response):
+    """Test tokens parse identically without touching the WASM module."""
+    from unittest.mock import patch
+
+    from nepse_client.token_manager import TokenParser
+
+    expected = TokenParser(use_wasm=True).parse_token_response(mock_token_response)
+    with patch.object(TokenParser, "_loadWasm", side_effect=AssertionError("WASM used")):
+        assert TokenParser().parse_token_response(mock_token_response) == expected
+
+
+def test_token_parser_is_shared_and_memoized(mock_token_response):
+    """Test token managers share one parser that memoizes indices by salts."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from nepse_client import AsyncNepseClient, NepseClient
+    from nepse_client.token_manager import get_token_parser
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        parsers = set(executor.map(lambda _: id(get_token_parser()), range(8)))
+    assert len(parsers) == 1
+    assert NepseClient().token_manager.token_parser is get_token_parser()
+    assert AsyncNepseClient().token_manager.token_parser is get_token_parser()
+
+    parser = get_token_parser()
+    parser.token_indices.cache_clear()
+    parser.parse_token_response(mock_token_response)
+    parser.parse_token_response(dict(mock_token_response, accessToken="x" * 200))
+    info = parser.token_indices.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll ``condition`` until it holds or ``timeout`` seconds pass, and return it."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_background_refresh_thread(mock_nepse_api):
+    """Test the daemon refresher renews the token ahead of expiry and stops on close."""
+    from nepse_client import NepseClient
+
+    api = mock_nepse_api()
+    client = api.attach(NepseClient())
+    manager = client.token_manager
+    manager.MIN_REFRESH_INTERVAL = 0.05
+
+    manager.startBackgroundRefresh(lead_time=manager.MAX_UPDATE_PERIOD - 0.1)
+    assert wait_for(lambda: api.count("/api/authenticate/refresh-token") >= 2)
+    assert manager.isTokenValid()
+
+    refresher = manager._refresher
+    client.close()
+    assert not refresher.is_alive()
+    refreshes = api.count("/api/authenticate/refresh-token")
+    time.sleep(0.2)
+    assert api.count("/api/authenticate/refresh-token") == refreshes
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_task(mock_nepse_api):
+    """Test the asyncio refresher renews the token ahead of expiry and stops on close."""
+    import asyncio
+
+    from nepse_client import AsyncNepseClient
+
+    api = mock_nepse_api()
+    client = api.attach(AsyncNepseClient())
+    manager = client.token_manager
+    manager.MIN_REFRESH_INTERVAL = 0.05
+
+    task = manager.startBackgroundRefresh(lead_time=manager.MAX_UPDATE_PERIOD - 0.1)
+    assert manager.startBackgroundRefresh() is task
+    for _ in range(200):
+        if api.count("/api/authenticate/refresh-token") >= 2:
+            break
+        await asyncio.sleep(0.01)
+    assert api.count("/api/authenticate/refresh-token") >= 2
+
+    await client.close()
+    assert task.done()
+
+
+def test_update_uses_refresh_token(mock_nepse_api):
+    """Test renewals use the refresh-token endpoint and fall back to prove."""
+    import json
+
+    import httpx
+
+    from nepse_client import NepseClient
+
+    api = mock_nepse_api()
+    client = api.attach(NepseClient())
+    manager = client.token_manager
+    bodies = []
+
+    def record_body(request):
+        bodies.append(json.loads(request.content))
+
+    api.hooks["/api/authenticate/refresh-token"] = record_body
+    refresh_token = manager.getRefreshToken()
+    manager.update()
+
+    assert api.count("/api/authenticate/prove") == 1
+    assert bodies == [{"refreshToken": refresh_token}]
+
+    api.hooks["/api/authenticate/refresh-token"] = lambda request: httpx.Response(
+        401, json={"message": "Invalid refresh token"}
+    )
+    manager.update()
+    assert api.count("/api/authenticate/prove") == 2
+    assert manager.isTokenValid()
+
+    # The failed endpoint is skipped until the cooldown has passed
+    manager.update()
+    assert api.count("/api/authenticate/refresh-token") == 2
+    assert api.count("/api/authenticate/prove") == 3
+
+    manager._refresh_endpoint_disabled_until = 0.0
+    manager.update()
+    assert api.count("/api/authenticate/refresh-token") == 3
+
+
+@pytest.mark.asyncio
+async def test_async_update_uses_refresh_token(mock_nepse_api):
+    """Test async renewals use the refresh-token endpoint and fall back to prove."""
+    import httpx
+
+    from nepse_client import AsyncNepseClient
+
+    api = mock_nepse_api()
+    client = api.attach(AsyncNepseClient())
+    manager = client.token_manager
+
+    await manager.getAccessToken()
+    await manager.update()
+    assert api.count("/api/authenticate/refresh-token") == 1
+    assert api.count("/api/authenticate/prove") == 1
+
+    api.hooks["/api/authenticate/refresh-token"] = lambda request: httpx.Response(200, json={})
+    await manager.update()
+    assert api.count("/api/authenticate/prove") == 2
+
+    await manager.update()
+    assert api.count("/api/authenticate/refresh-token") == 2
+    assert api.count("/api/authenticate/prove") == 3
+
+
+def test_pinned_records_rejected_token_and_resets_context():
+    """Test a rejection inside pinned() names the token sent and leaves no pin behind."""
+    from nepse_client import NepseClient
+    from nepse_client.exceptions import NepseAuthenticationError
+    from nepse_client.token_manager import TokenSnapshot, _pinned_tokens
+
+    client = NepseClient()
+    manager = client.token_manager
+    manager._snapshot = TokenSnapshot("access", "refresh", int(client.clock.time()), (1, 2, 3, 4, 5))
+
+    with pytest.raises(NepseAuthenticationError) as info:
+        with manager.pinned() as snapshot:
+            assert manager.snapshot is snapshot
+            raise NepseAuthenticationError()
+
+    assert info.value.rejected_token is snapshot
+    assert _pinned_tokens.get() is None
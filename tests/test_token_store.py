@@ -0,0 +1,130 @@
+# tests/test_token_store.py
+"""Tests for the file-backed token store."""
+
+import os
+import stat
+import sys
+import threading
+
+import pytest
+
+from nepse_client import FileTokenStore, NepseClient
+
+
+def test_save_and_load_round_trip(tmp_path, mock_token_response):
+    """Test saved token responses are read back unchanged."""
+    store = FileTokenStore(tmp_path / "tokens" / "token.json")
+    assert store.load() is None
+
+    store.save(mock_token_response)
+
+    assert store.load() == mock_token_response
+    assert list(store.path.parent.glob("*.tmp")) == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+def test_token_file_is_private(tmp_path, mock_token_response):
+    """Test the token file is only readable by its owner."""
+    store = FileTokenStore(tmp_path / "token.json")
+    store.save(mock_token_response)
+
+    assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+
+
+def test_unreadable_token_file_is_ignored(tmp_path):
+    """Test a corrupt token file loads as empty."""
+    store = FileTokenStore(tmp_path / "token.json")
+    store.path.write_text("{not json")
+
+    assert store.load() is None
+
+
+def test_lock_times_out(tmp_path):
+    """Test acquire gives up when another holder keeps the lock."""
+    holder = FileTokenStore(tmp_path / "token.json")
+    waiter = FileTokenStore(tmp_path / "token.json", lock_timeout=0.05)
+
+    with holder.locked():
+        assert waiter.acquire() is None
+
+    handle = waiter.acquire()
+    assert handle is not None
+    waiter.release(handle)
+
+
+def test_clients_share_one_token(rotating_token_api, tmp_path):
+    """Test clients sharing a store authenticate once between them."""
+    api = rotating_token_api
+    path = tmp_path / "token.json"
+    clients = [api.attach(NepseClient(token_store=FileTokenStore(path))) for _ in range(8)]
+    barrier = threading.Barrier(len(clients))
+    tokens = []
+
+    def authenticate(client):
+        barrier.wait(timeout=5)
+        tokens.append(client.token_manager.getAccessToken())
+
+    threads = [threading.Thread(target=authenticate, args=(client,)) for client in clients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(api.issued) == 1
+    assert len(set(tokens)) == 1
+
+
+def test_stored_token_is_reused_by_new_client(rotating_token_api, tmp_path):
+    """Test a new client picks up a valid stored token instead of authenticating."""
+    api = rotating_token_api
+    store = FileTokenStore(tmp_path / "token.json")
+    first = api.attach(NepseClient(token_store=store))
+    token = first.token_manager.getAccessToken()
+
+    second = api.attach(NepseClient(token_store=store))
+
+    assert second.token_manager.getAccessToken() == token
+    assert len(api.issued) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_tasks_share_one_token(rotating_token_api, tmp_path):
+    """Test concurrent tasks of a client with a store authenticate once."""
+    import asyncio
+
+    from nepse_client import AsyncNepseClient
+
+    api = rotating_token_api
+    client = api.attach(AsyncNepseClient(token_store=FileTokenStore(tmp_path / "token.json")))
+
+    tokens = await asyncio.gather(*(client.token_manager.getAccessToken() for _ in range(10)))
+
+    assert len(api.issued) == 1
+    assert len(set(tokens)) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_async_renewal_releases_lock(rotating_token_api, tmp_path):
+    """Test a task cancelled while waiting for the store lock does not keep it."""
+    import asyncio
+
+    from nepse_client import AsyncNepseClient
+
+    path = tmp_path / "token.json"
+    holder = FileTokenStore(path)
+    client = rotating_token_api.attach(AsyncNepseClient(token_store=FileTokenStore(path)))
+
+    handle = holder.acquire()
+    task = asyncio.create_task(client.token_manager.getAccessToken())
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    holder.release(handle)
+
+    # The worker thread gets the lock after the holder and hands it back
+    waiter = FileTokenStore(path, lock_timeout=2.0)
+    handle = await asyncio.to_thread(waiter.acquire)
+    assert handle is not None
+    waiter.release(handle)
+    assert await client.token_manager.getAccessToken()